@@ -1,31 +1,272 @@
 from functools import lru_cache
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# 실행 환경(profile)별 DB 엔진 기본값.
+# 개별 `DB_*` 환경 변수가 지정되면 해당 값이 profile 기본값보다 우선합니다.
+DB_PROFILES: Dict[str, Dict[str, Any]] = {
+    "dev": {
+        "echo": True,
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    },
+    "test": {
+        "echo": False,
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_timeout": 5,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+    },
+    "prod": {
+        "echo": False,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    },
+}
+
+
 class Settings(BaseSettings):
     """
     애플리케이션 설정 클래스.
 
     - 환경 변수 또는 `.env` 파일에서 값을 로드하여 설정을 관리합니다.
+    - `APP_PROFILE`(dev, test, prod)에 따라 DB 엔진 기본값이 결정됩니다.
     """
-    MYSQL_USERNAME: str
-    MYSQL_PASSWORD: str
-    MYSQL_HOSTNAME: str
-    MYSQL_PORT: int
-    MYSQL_SCHEMA: str
-    
+    APP_PROFILE: Literal["dev", "test", "prod"] = "prod"
+
+    # SQLAlchemy DB URL. 지정하면 `MYSQL_*` 설정 대신 사용합니다.
+    # (`sqlite://`: 인메모리, `sqlite:///path/to/app.db`: 파일, `mysql+pymysql://...`)
+    DATABASE_URL: Optional[str] = None
+    # 읽기 전용 replica DB URL. 지정하면 `MYSQL_READ_*` 설정 대신 사용합니다.
+    DATABASE_READ_URL: Optional[str] = None
+
+    MYSQL_USERNAME: Optional[str] = None
+    MYSQL_PASSWORD: Optional[str] = None
+    MYSQL_HOSTNAME: Optional[str] = None
+    MYSQL_PORT: Optional[int] = None
+    MYSQL_SCHEMA: Optional[str] = None
+
+    # 읽기 전용 replica. 지정하지 않으면 모든 조회가 primary로 전달됩니다.
+    MYSQL_READ_HOSTNAME: Optional[str] = None
+    MYSQL_READ_PORT: Optional[int] = None
+    # 쓰기 직후 해당 사용자의 조회를 primary로 보내는 시간 (초, 0이면 비활성)
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    DB_ECHO: Optional[bool] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    # worker 시작(lifespan) 시 `create_all`로 누락된 테이블을 생성할지 여부
+    DB_AUTO_CREATE: bool = True
+    # SQLite 파일 DB를 WAL 모드로 열지 여부 (읽기와 쓰기가 서로를 막지 않습니다)
+    SQLITE_WAL: bool = True
+    # SQLite 쓰기 잠금 대기 시간 (ms). SQLite는 한 번에 하나의 쓰기 트랜잭션만 허용하므로 다른 쓰기는 이 시간 동안 대기합니다.
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # 백엔드 로그를 DB에 기록하기 전 대기시키는 큐의 최대 크기 (초과 시 로그를 버립니다)
+    LOG_QUEUE_MAX_SIZE: int = 10000
+
+    # Prometheus 형식의 `/metrics` 엔드포인트와 요청 metric 수집 여부
+    METRICS_ENABLED: bool = True
+    # 한 요청에서 같은 형태의 SQL 문이 이 횟수 이상 실행되면 N+1 경고를 남깁니다 (0이면 비활성)
+    SQL_REPEAT_THRESHOLD: int = 10
+    # 응답에 요청별 SQL 문 수 헤더(`X-SQL-Count` 등)를 추가할지 여부 (지정하지 않으면 dev profile에서만)
+    SQL_DEBUG_HEADERS: Optional[bool] = None
+    # 실행 시간이 이 값(ms)을 넘은 SQL 문을 slow query log에 기록합니다 (0이면 비활성)
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    # worker마다 보관하는 최근 slow query 수
+    SLOW_QUERY_LOG_SIZE: int = 200
+    # slow query의 실행 계획(`EXPLAIN`)을 별도 스레드에서 조회할지 여부
+    SLOW_QUERY_EXPLAIN: bool = True
+
+    # 요청별 추적(span) 수집 여부 (꺼져 있으면 계측 코드가 등록되지 않습니다)
+    TRACING_ENABLED: bool = False
+    # span exporter (`jsonl`: 파일에 JSON lines로 추가, `memory`: 메모리 보관, 테스트용)
+    TRACING_EXPORTER: Literal["jsonl", "memory"] = "jsonl"
+    TRACING_JSONL_PATH: str = "traces.jsonl"
+    # 추적할 요청 비율 (0~1)
+    TRACING_SAMPLE_RATE: float = 1.0
+
+    # 요청 프로파일링 미들웨어 등록 여부 (꺼져 있으면 미들웨어가 등록되지 않아 오버헤드가 없습니다)
+    PROFILING_ENABLED: bool = False
+    # `X-Profile` 헤더 서명 키 (지정하지 않으면 `SECRET_KEY` 사용)
+    PROFILING_SECRET: Optional[str] = None
+    # 무작위로 프로파일링할 요청 비율 (0~1). 관리자 API로 실행 중에 변경할 수 있습니다.
+    PROFILING_SAMPLE_RATE: float = 0.0
+    # worker마다 보관하는 최근 프로파일 결과 수
+    PROFILING_MAX_PROFILES: int = 50
+
+    # 메뉴별 댓글 목록의 기본/최대 페이지 크기
+    COMMENT_PAGE_SIZE: int = 20
+    COMMENT_PAGE_MAX_SIZE: int = 100
+    # 메뉴별 댓글 목록 첫 페이지의 worker 내 캐시 시간 (초, 0이면 비활성). 댓글이 등록되면 그 worker의 해당 메뉴 캐시를 바로 제거합니다.
+    # HTTP 응답은 브라우저/공유 캐시에 남지 않도록 `Cache-Control: private, no-cache`로 보냅니다.
+    COMMENT_FIRST_PAGE_CACHE_SECONDS: int = 30
+
+    # 관리자 댓글 검색용 글자 bigram 색인 사용 여부 (worker마다 모든 댓글을 메모리에 색인합니다)
+    SEARCH_ENABLED: bool = False
+    # 다른 worker에서 등록된 댓글을 색인하는 catch-up 간격 (초)
+    SEARCH_REFRESH_SECONDS: float = 5.0
+    # catch-up 시 한 번에 읽는 댓글 수
+    SEARCH_BATCH_SIZE: int = 10000
+
+    # 댓글을 단어로 나누어 (메뉴, 날짜, 단어)별 댓글 수를 집계할지 여부 (마이그레이션 `0006` 필요)
+    COMMENT_TERMS_ENABLED: bool = False
+    # 새 댓글을 집계하는 간격 (초). 집계는 최대 이 간격의 두 배만큼 늦게 반영됩니다.
+    COMMENT_TERMS_INTERVAL_SECONDS: float = 60.0
+    # 한 트랜잭션에서 집계하는 댓글 수
+    COMMENT_TERMS_BATCH_SIZE: int = 5000
+
+    # 기간별 음식 순위표(Bayesian 평균) API 사용 여부
+    LEADERBOARD_ENABLED: bool = True
+    # Bayesian 평균에서 기간 전체 평균에 부여하는 평가 수. 클수록 평가가 적은 음식이 평균 쪽으로 당겨집니다.
+    LEADERBOARD_PRIOR_WEIGHT: float = 5.0
+    # 순위표를 DB에서 다시 만드는 주기 (초). 다른 worker의 점수 등록은 이 시간 안에 반영됩니다.
+    LEADERBOARD_REFRESH_SECONDS: float = 300.0
+    # worker당 보관하는 최대 순위표 수 (기간 단위와 시작 날짜마다 하나)
+    LEADERBOARD_MAX_BOARDS: int = 32
+
+    # 음식 점수 시계열 API의 최대 조회 기간 (일)
+    FOOD_SERIES_MAX_DAYS: int = 731
+    # 음식 점수 시계열 응답 캐시 시간 (초, 0이면 비활성). 기간 내 점수가 등록되면 해당 음식의 캐시를 바로 제거합니다.
+    FOOD_SERIES_CACHE_SECONDS: int = 300
+
+    # 점수/투표/댓글 등록 API에서 `Idempotency-Key` 헤더를 처리할지 여부
+    IDEMPOTENCY_ENABLED: bool = True
+    # 키별 첫 응답 보관 시간 (초)과 worker당 최대 보관 키 수
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_MAX_KEYS: int = 50000
+    # 이보다 큰 응답 본문은 보관하지 않습니다 (bytes)
+    IDEMPOTENCY_MAX_BODY_BYTES: int = 16384
+
+    # 점수 등록을 로컬 저널 파일에 기록한 뒤 바로 응답하고, DB에는 모아서 저장(group commit)할지 여부
+    # (마이그레이션 `0004` 필요, 저널 디렉터리는 재시작 후에도 유지되는 로컬 디스크여야 합니다)
+    SCORE_WRITE_BEHIND: bool = False
+    SCORE_JOURNAL_DIR: str = "journal"
+    # 저널의 점수를 DB에 저장하는 최대 지연 (ms)
+    SCORE_JOURNAL_FLUSH_MS: int = 200
+    # 대기 점수가 이 수에 도달하면 간격을 기다리지 않고 저장합니다 (INSERT 한 번의 최대 행 수).
+    SCORE_JOURNAL_BATCH_SIZE: int = 1000
+    # 저장 대기 점수 상한 (초과 시 503)
+    SCORE_JOURNAL_MAX_PENDING: int = 50000
+    # 저널에 기록할 때마다 fsync할지 여부 (끄면 OS 장애 시 최근 점수가 유실될 수 있습니다)
+    SCORE_JOURNAL_FSYNC: bool = True
+    # worker가 한 번에 예약하는 점수 ID 수
+    SCORE_ID_BLOCK_SIZE: int = 1000
+
+    # 도메인 이벤트를 쓰기와 같은 트랜잭션의 `event_outbox` 테이블에도 기록하여,
+    # 커밋 직후 종료되어 전달되지 못한 이벤트를 다시 전달할지 여부 (마이그레이션 `0003` 필요)
+    EVENT_OUTBOX_ENABLED: bool = False
+    # 전달된 outbox 이벤트를 모아 전달 완료로 표시하는 간격 (ms)
+    EVENT_OUTBOX_FLUSH_MS: int = 500
+    # 이 시간(초)이 지나도 전달 완료로 표시되지 않은 outbox 이벤트를 다시 전달합니다.
+    EVENT_OUTBOX_REPLAY_AFTER_SECONDS: float = 60.0
+    # 전달 완료된 outbox 이벤트 보관 기간 (시간)
+    EVENT_OUTBOX_RETENTION_HOURS: float = 24.0
+
+    # 실시간 통계 구독(SSE) 사용 여부
+    LIVE_ENABLED: bool = True
+    # 쓰기 변경을 모아 구독자에게 전달하는 간격 (ms). 이 간격마다 변경된 메뉴의 통계를 한 번만 다시 계산합니다.
+    LIVE_COALESCE_MS: int = 1000
+    # 변경이 없을 때 연결 유지용 heartbeat를 보내는 간격 (초)
+    LIVE_HEARTBEAT_SECONDS: float = 15.0
+    # 메시지를 이 시간(초) 이상 받아가지 못한 구독자는 연결을 종료합니다.
+    LIVE_SLOW_CLIENT_SECONDS: float = 30.0
+    # worker당 최대 구독 수 (초과 시 503)
+    LIVE_MAX_SUBSCRIPTIONS: int = 5000
+
     CORS_ORIGINS: str
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
-    
+    # 인증된 사용자 정보를 캐싱하는 시간 (초, 0이면 비활성)
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_SIZE: int = 1024
+    # 토큰에 사용자 ID/이메일/역할을 포함하여 인증 시 DB 조회를 생략합니다.
+    # 활성화하면 계정 비활성화/역할 변경이 토큰 만료 전까지 반영되지 않습니다.
+    JWT_EMBED_CLAIMS: bool = False
+
+    # bcrypt cost. 값이 바뀌면 기존 해시는 다음 로그인 시 새 cost로 재해싱됩니다.
+    BCRYPT_ROUNDS: int = 12
+    # 비밀번호 해싱/검증을 수행하는 worker 스레드 수
+    PASSWORD_HASH_WORKERS: int = 2
+    # 동시에 처리(대기 포함)할 수 있는 해싱/검증 요청 수와 대기 제한 시간 (초)
+    PASSWORD_HASH_MAX_PENDING: int = 16
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 5.0
+
     model_config = SettingsConfigDict(env_file=".env")
-    
-    
+
+    @model_validator(mode="after")
+    def _check_database(self) -> "Settings":
+        if self.DATABASE_URL is None and self.MYSQL_URL is None:
+            raise ValueError(
+                "Set DATABASE_URL, or all of MYSQL_USERNAME, MYSQL_PASSWORD, MYSQL_HOSTNAME, MYSQL_PORT and MYSQL_SCHEMA."
+            )
+        return self
+
     @property
-    def MYSQL_URL(self) -> str:
+    def MYSQL_URL(self) -> Optional[str]:
+        required = (self.MYSQL_USERNAME, self.MYSQL_PASSWORD, self.MYSQL_HOSTNAME, self.MYSQL_PORT, self.MYSQL_SCHEMA)
+        if any(value is None for value in required):
+            return None
         return f"mysql+pymysql://{self.MYSQL_USERNAME}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOSTNAME}:{self.MYSQL_PORT}/{self.MYSQL_SCHEMA}"
-    
+
+    @property
+    def MYSQL_READ_URL(self) -> Optional[str]:
+        if not self.MYSQL_READ_HOSTNAME or self.MYSQL_URL is None:
+            return None
+        port = self.MYSQL_READ_PORT or self.MYSQL_PORT
+        return f"mysql+pymysql://{self.MYSQL_USERNAME}:{self.MYSQL_PASSWORD}@{self.MYSQL_READ_HOSTNAME}:{port}/{self.MYSQL_SCHEMA}"
+
+    @property
+    def db_url(self) -> str:
+        """primary DB URL (`DATABASE_URL`이 없으면 `MYSQL_*` 설정으로 구성)."""
+        return self.DATABASE_URL or self.MYSQL_URL
+
+    @property
+    def db_read_url(self) -> Optional[str]:
+        """replica DB URL. 설정되지 않았으면 None."""
+        if self.DATABASE_URL is not None:
+            return self.DATABASE_READ_URL
+        return self.DATABASE_READ_URL or self.MYSQL_READ_URL
+
+    @property
+    def db_engine_options(self) -> Dict[str, Any]:
+        """
+        `create_engine`에 전달할 엔진/커넥션 풀 옵션.
+
+        profile 기본값 위에 명시적으로 지정된 `DB_*` 설정을 덮어씁니다.
+        """
+        overrides = {
+            "echo": self.DB_ECHO,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+        }
+        options = dict(DB_PROFILES[self.APP_PROFILE])
+        options.update({key: value for key, value in overrides.items() if value is not None})
+        return options
+
+    @property
+    def sql_debug_headers(self) -> bool:
+        if self.SQL_DEBUG_HEADERS is None:
+            return self.APP_PROFILE == "dev"
+        return self.SQL_DEBUG_HEADERS
+
     @property
     def cors_origin_list(self) -> str:
         return self.CORS_ORIGINS.split(",")
@@ -0,0 +1,127 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# 이름이 지정된 캐시 (metric 수집 대상)
+_named_caches: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)과 최대 크기를 가진 스레드 안전 인메모리 캐시.
+
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거하며(LRU),
+    적중/실패 횟수를 기록하여 캐시 효율을 확인할 수 있습니다.
+
+    Attributes:
+        maxsize (int): 최대 저장 항목 수.
+        ttl (float): 기본 만료 시간 (초).
+        hits (int): 누적 캐시 적중 횟수.
+        misses (int): 누적 캐시 실패 횟수.
+        name (Optional[str]): 캐시 이름. 지정하면 `/metrics`에 적중률이 노출됩니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, name: Optional[str] = None) -> None:
+        self.name = name
+        if name is not None:
+            _named_caches[name] = self
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시된 값을 조회합니다. 만료된 항목은 제거 후 `default`를 반환합니다.
+
+        Args:
+            key (Hashable): 캐시 키.
+            default (Any): 값이 없을 때 반환할 기본값.
+
+        Returns:
+            Any: 캐시된 값 또는 `default`.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key (Hashable): 캐시 키.
+            value (Any): 저장할 값.
+            ttl (Optional[float]): 항목별 만료 시간 (초). 없으면 기본 TTL 사용.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """지정한 키의 항목을 제거합니다."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        조건을 만족하는 키의 항목을 모두 제거합니다.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): 제거 대상 키 판별 함수.
+
+        Returns:
+            int: 제거된 항목 수.
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목과 적중 통계를 초기화합니다."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 크기와 적중률 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 5) if total else 0.0,
+        }
+
+
+def named_caches() -> Dict[str, TTLCache]:
+    """이름이 지정된 캐시 목록을 반환합니다."""
+    return dict(_named_caches)
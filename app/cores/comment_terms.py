@@ -0,0 +1,160 @@
+import logging
+import threading
+from collections import Counter
+from typing import List, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from app.cores.metrics import MetricFamily, registry
+from app.cores.search import comment_words
+from app.database import SessionLocal
+
+logger = logging.getLogger("app.comment_terms")
+
+CHECKPOINT_NAME = "comment_terms"
+TERM_MAX_LENGTH = 50
+
+
+class CommentTermRollup:
+    """
+    댓글을 단어로 나누어 `comment_term_counts`에 (메뉴, 날짜, 단어)별 댓글 수를 누적하는 catch-up 작업.
+
+    `rollup_checkpoints`의 진행 위치 이후 댓글을 ID 순으로 읽고, 집계 결과와 진행 위치를 한 트랜잭션에 반영합니다.
+    진행 위치를 조건부로 갱신하므로 모든 worker에서 실행해도 각 댓글은 한 번만 집계됩니다.
+
+    직전 실행에서 확인한 최대 ID까지만 집계하여, ID를 받은 뒤 늦게 커밋된 댓글도 다음 실행에서 빠짐없이 집계합니다
+    (집계는 최대 `interval_seconds`의 두 배만큼 늦게 반영됩니다).
+
+    Attributes:
+        interval_seconds (float): 실행 간격 (초).
+        batch_size (int): 한 트랜잭션에서 집계하는 댓글 수.
+        stats (dict): 누적 집계 댓글 수, 실행 수, 실패 수.
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int) -> None:
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._horizon: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"comments": 0, "runs": 0, "failures": 0}
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="comment-term-rollup", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                self.stats["failures"] += 1
+                logger.exception("Failed to roll up comment terms")
+            self._stop.wait(self.interval_seconds)
+
+    def run_once(self) -> int:
+        """
+        직전 실행에서 확인한 최대 ID까지의 댓글을 집계합니다.
+
+        Returns:
+            int: 이 worker가 집계한 댓글 수.
+        """
+        from app.crud.comments import get_comments_after, get_max_comment_id
+        from app.crud.statistics import add_comment_term_counts, advance_rollup_checkpoint, get_rollup_checkpoint
+
+        self.stats["runs"] += 1
+        processed = 0
+        db = SessionLocal()
+        try:
+            horizon, self._horizon = self._horizon, get_max_comment_id(db)
+            db.rollback()
+            if horizon is None:
+                return 0
+
+            last_id = get_rollup_checkpoint(db, CHECKPOINT_NAME)
+            while last_id < horizon and not self._stop.is_set():
+                rows = get_comments_after(db, last_id, self.batch_size, until_id=horizon)
+                new_last_id = rows[-1][0] if len(rows) == self.batch_size else horizon
+
+                counts: Counter = Counter()
+                for _, text, menu_id, created_at in rows:
+                    if menu_id is None:
+                        continue
+                    day = created_at.date()
+                    for term in {word[:TERM_MAX_LENGTH] for word in comment_words(text)}:
+                        counts[(menu_id, day, term)] += 1
+
+                try:
+                    advanced = advance_rollup_checkpoint(db, CHECKPOINT_NAME, last_id, new_last_id)
+                except IntegrityError:
+                    advanced = False
+                if not advanced:
+                    # 다른 worker가 이 범위를 먼저 집계했습니다.
+                    db.rollback()
+                    break
+                add_comment_term_counts(db, counts)
+                db.commit()
+                processed += len(rows)
+                last_id = new_last_id
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        self.stats["comments"] += processed
+        return processed
+
+
+_comment_term_rollup: Optional[CommentTermRollup] = None
+
+
+def start_comment_term_rollup(interval_seconds: float, batch_size: int) -> CommentTermRollup:
+    """
+    댓글 단어 집계 작업을 시작합니다 (lifespan 시작 시 호출).
+
+    Args:
+        interval_seconds (float): 실행 간격 (초).
+        batch_size (int): 한 트랜잭션에서 집계하는 댓글 수.
+
+    Returns:
+        CommentTermRollup: 시작된 집계 작업.
+    """
+    global _comment_term_rollup
+    if _comment_term_rollup is None:
+        rollup = CommentTermRollup(interval_seconds, batch_size)
+        rollup.start()
+        _comment_term_rollup = rollup
+    return _comment_term_rollup
+
+
+def stop_comment_term_rollup() -> None:
+    """집계 작업을 종료합니다 (lifespan 종료 시 호출)."""
+    global _comment_term_rollup
+    if _comment_term_rollup is not None:
+        _comment_term_rollup.stop()
+        _comment_term_rollup = None
+
+
+def _collect_comment_term_rollup() -> List[MetricFamily]:
+    rollup = _comment_term_rollup
+    if rollup is None:
+        return []
+    stats = dict(rollup.stats)
+    return [
+        ("comment_term_rollup_comments_total", "counter", "Comments tokenised into comment_term_counts by this worker.",
+         [({}, stats["comments"])]),
+        ("comment_term_rollup_runs_total", "counter", "Comment term rollup runs.", [({}, stats["runs"])]),
+        ("comment_term_rollup_failures_total", "counter", "Comment term rollup runs that failed.",
+         [({}, stats["failures"])]),
+    ]
+
+
+registry.add_collector(_collect_comment_term_rollup)
@@ -0,0 +1,20 @@
+from datetime import date, datetime, time, timedelta
+from typing import Tuple
+
+
+def day_range(value: date) -> Tuple[datetime, datetime]:
+    """
+    주어진 날짜(또는 일시)가 속한 하루의 시작/끝 구간을 반환합니다.
+
+    `DATE(column) = :date` 대신 `column >= start AND column < end` 형태로 비교하면
+    컬럼 인덱스를 사용할 수 있고, DB 방언에 의존하지 않습니다.
+
+    Args:
+        value (date): 기준 날짜 또는 일시.
+
+    Returns:
+        Tuple[datetime, datetime]: (해당 날짜 00:00, 다음 날 00:00).
+    """
+    day = value.date() if isinstance(value, datetime) else value
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
@@ -0,0 +1,511 @@
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, or_
+from sqlalchemy.orm import Session
+
+from app.cores.metrics import registry
+from app.database import SessionLocal
+from app.models.events import OutboxEvent
+
+logger = logging.getLogger("app.events")
+
+domain_events_total = registry.counter(
+    "domain_events_total", "Domain events dispatched to subscribers after commit.", ("event",)
+)
+domain_event_handler_errors_total = registry.counter(
+    "domain_event_handler_errors_total", "Domain event subscribers that raised.", ("event", "handler")
+)
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """
+    커밋된 쓰기를 나타내는 도메인 이벤트 기본 클래스.
+
+    `DomainEvent`를 구독하면 모든 종류의 이벤트를 전달받습니다.
+    """
+
+    def to_payload(self) -> Dict[str, Any]:
+        """outbox에 저장할 JSON 호환 dict로 변환합니다."""
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else list(value) if isinstance(value, tuple) else value
+            for key, value in asdict(self).items()
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "DomainEvent":
+        """`to_payload`로 변환한 dict에서 이벤트를 복원합니다."""
+        values = {}
+        for field in fields(cls):
+            value = payload.get(field.name)
+            if field.type is datetime and isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif isinstance(value, list):
+                value = tuple(value)
+            values[field.name] = value
+        return cls(**values)
+
+
+@dataclass(frozen=True)
+class ScoreCreated(DomainEvent):
+    """
+    음식 평가 점수가 등록됨.
+
+    Attributes:
+        score_id (int): 점수 ID.
+        user_id (str): 사용자 ID.
+        food_id (int): 음식 ID.
+        score (float): 점수.
+        created_at (datetime): 등록 시각.
+    """
+    score_id: int
+    user_id: str
+    food_id: int
+    score: float
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class VoteChanged(DomainEvent):
+    """
+    투표가 등록되거나 다른 메뉴로 변경됨.
+
+    Attributes:
+        vote_id (int): 투표 ID.
+        user_id (str): 사용자 ID.
+        menu_id (int): 투표한 메뉴 ID.
+        previous_menu_id (Optional[int]): 변경 전 메뉴 ID (새 투표이면 None).
+        created_at (datetime): 투표 시각.
+    """
+    vote_id: int
+    user_id: str
+    menu_id: int
+    previous_menu_id: Optional[int]
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class CommentCreated(DomainEvent):
+    """
+    메뉴에 댓글이 등록됨.
+
+    Attributes:
+        comment_id (int): 댓글 ID.
+        user_id (str): 사용자 ID.
+        menu_id (int): 메뉴 ID.
+        comment (str): 댓글 내용.
+        created_at (datetime): 작성 시각.
+    """
+    comment_id: int
+    user_id: str
+    menu_id: int
+    comment: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class MenuPublished(DomainEvent):
+    """
+    메뉴가 등록됨.
+
+    Attributes:
+        menu_id (int): 메뉴 ID.
+        date (datetime): 메뉴 날짜.
+        food_ids (Tuple[int, ...]): 메뉴에 포함된 음식 ID.
+    """
+    menu_id: int
+    date: datetime
+    food_ids: Tuple[int, ...]
+
+
+# outbox의 `event_type` -> 이벤트 클래스
+EVENT_TYPES: Dict[str, Type[DomainEvent]] = {
+    cls.__name__: cls for cls in (ScoreCreated, VoteChanged, CommentCreated, MenuPublished)
+}
+
+
+@dataclass
+class _Subscriber:
+    handler: Callable[[Any], Any]
+    batch: bool
+    is_async: bool
+
+    @property
+    def name(self) -> str:
+        return f"{self.handler.__module__}.{getattr(self.handler, '__qualname__', repr(self.handler))}"
+
+
+class EventBus:
+    """
+    프로세스 내 도메인 이벤트 버스.
+
+    - 동기 구독자는 커밋한 스레드에서 커밋 직후 바로 호출됩니다. 요청 처리를 지연시키므로 가벼운 작업만 수행해야 합니다.
+    - 비동기 구독자(`async def`)는 lifespan에서 연결한 이벤트 루프에 task로 예약됩니다.
+    - `batch=True`로 구독하면 한 트랜잭션에서 발생한 같은 종류의 이벤트를 목록으로 한 번에 전달받습니다.
+    - 구독자에서 발생한 예외는 기록만 하고 다른 구독자와 요청 처리에는 영향을 주지 않습니다.
+    - outbox ID가 있는 이벤트는 최근 `DEDUPE_WINDOW`개의 ID를 기억하여, outbox에서 다시 전달된 이벤트를
+      이 프로세스의 구독자에게 두 번 전달하지 않습니다.
+
+    Attributes:
+        DEDUPE_WINDOW (int): 중복 전달을 막기 위해 기억하는 최근 outbox ID 수.
+    """
+    DEDUPE_WINDOW = 10000
+
+    def __init__(self) -> None:
+        self._subscribers: Dict[Type[DomainEvent], List[_Subscriber]] = {}
+        self._lock = threading.Lock()
+        self._delivered: "OrderedDict[int, None]" = OrderedDict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable[[Any], Any], batch: bool = False) -> None:
+        """
+        이벤트 구독자를 등록합니다.
+
+        Args:
+            event_type (Type[DomainEvent]): 구독할 이벤트 타입 (`DomainEvent`이면 모든 이벤트).
+            handler (Callable): 이벤트(또는 `batch=True`이면 이벤트 목록)를 인자로 받는 함수 또는 `async` 함수.
+            batch (bool): 트랜잭션 단위로 이벤트 목록을 전달받을지 여부.
+        """
+        subscriber = _Subscriber(handler, batch, inspect.iscoroutinefunction(handler))
+        with self._lock:
+            self._subscribers[event_type] = [*self._subscribers.get(event_type, []), subscriber]
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: Callable[[Any], Any]) -> None:
+        """구독자를 제거합니다."""
+        with self._lock:
+            self._subscribers[event_type] = [
+                subscriber for subscriber in self._subscribers.get(event_type, []) if subscriber.handler != handler
+            ]
+
+    def subscriber(self, event_type: Type[DomainEvent], batch: bool = False) -> Callable:
+        """`subscribe`의 decorator 형태."""
+        def decorator(handler: Callable[[Any], Any]) -> Callable[[Any], Any]:
+            self.subscribe(event_type, handler, batch)
+            return handler
+        return decorator
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """비동기 구독자를 실행할 이벤트 루프를 지정합니다 (lifespan 시작 시 호출)."""
+        self._loop = loop
+
+    async def close(self) -> None:
+        """실행 중인 비동기 구독자를 기다린 뒤 이벤트 루프 연결을 해제합니다 (lifespan 종료 시 호출)."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        self._loop = None
+
+    def dispatch(self, events: Sequence[DomainEvent], outbox_ids: Optional[Sequence[int]] = None) -> None:
+        """
+        이벤트를 구독자에게 전달합니다. 어느 스레드에서나 호출할 수 있습니다.
+
+        Args:
+            events (Sequence[DomainEvent]): 한 트랜잭션에서 발생한 이벤트 (발생 순서).
+            outbox_ids (Optional[Sequence[int]]): 이벤트별 outbox ID. 이미 전달한 ID의 이벤트는 건너뜁니다.
+        """
+        if outbox_ids is not None:
+            events = self._undelivered(events, outbox_ids)
+
+        grouped: Dict[Type[DomainEvent], List[DomainEvent]] = {}
+        for domain_event in events:
+            grouped.setdefault(type(domain_event), []).append(domain_event)
+
+        for event_type, batch in grouped.items():
+            domain_events_total.inc(event_type.__name__, amount=len(batch))
+            with self._lock:
+                subscribers = self._subscribers.get(event_type, []) + self._subscribers.get(DomainEvent, [])
+            for subscriber in subscribers:
+                for argument in ([batch] if subscriber.batch else batch):
+                    self._call(subscriber, event_type, argument)
+
+    def _undelivered(self, events: Sequence[DomainEvent], outbox_ids: Sequence[int]) -> List[DomainEvent]:
+        undelivered = []
+        with self._lock:
+            for domain_event, outbox_id in zip(events, outbox_ids):
+                if outbox_id in self._delivered:
+                    continue
+                self._delivered[outbox_id] = None
+                undelivered.append(domain_event)
+            while len(self._delivered) > self.DEDUPE_WINDOW:
+                self._delivered.popitem(last=False)
+        return undelivered
+
+    def _call(self, subscriber: _Subscriber, event_type: Type[DomainEvent], argument: Any) -> None:
+        if subscriber.is_async:
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                logger.warning("Dropping %s for %s: event loop is not running", event_type.__name__, subscriber.name)
+                return
+            loop.call_soon_threadsafe(self._spawn, subscriber, event_type, argument)
+            return
+        try:
+            subscriber.handler(argument)
+        except Exception:
+            self._failed(subscriber, event_type)
+
+    def _spawn(self, subscriber: _Subscriber, event_type: Type[DomainEvent], argument: Any) -> None:
+        task = asyncio.ensure_future(subscriber.handler(argument))
+        self._tasks.add(task)
+
+        def finished(task: asyncio.Task) -> None:
+            self._tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                self._failed(subscriber, event_type, task.exception())
+
+        task.add_done_callback(finished)
+
+    @staticmethod
+    def _failed(subscriber: _Subscriber, event_type: Type[DomainEvent], error: Optional[BaseException] = None) -> None:
+        domain_event_handler_errors_total.inc(event_type.__name__, subscriber.name)
+        logger.error(
+            "Subscriber %s failed to handle %s", subscriber.name, event_type.__name__,
+            exc_info=error if error is not None else True
+        )
+
+
+event_bus = EventBus()
+
+
+class OutboxRelay:
+    """
+    outbox에 기록된 이벤트의 전달 완료를 표시하고, 전달되지 못한 이벤트를 다시 전달하는 relay.
+
+    - 커밋 직후 전달된 이벤트의 ID를 모아 `flush_seconds`마다 한 번의 UPDATE로 전달 완료를 표시합니다.
+    - `replay_after_seconds`가 지나도 전달 완료로 표시되지 않은 이벤트(커밋 직후 프로세스 종료 등)는
+      조건부 UPDATE로 `claimed_at`을 기록하여 선점한 뒤 다시 전달하고, 전달이 끝난 뒤에 전달 완료로 표시합니다.
+      여러 worker가 동시에 실행해도 한 worker만 선점하며, 전달 도중 종료되면 `replay_after_seconds` 뒤에
+      선점이 만료되어 다시 전달됩니다.
+    - 전달 완료 후 `retention_seconds`가 지난 이벤트는 삭제합니다.
+
+    전달 완료 표시 전에 종료되면 같은 이벤트가 다시 전달될 수 있습니다(at-least-once).
+    같은 프로세스 안에서는 `EventBus`가 outbox ID로 중복을 걸러내지만, 다른 worker에 다시 전달될 수 있으므로
+    구독자는 멱등해야 합니다.
+
+    Attributes:
+        flush_seconds (float): 전달 완료 표시 주기 (초).
+        replay_after_seconds (float): 재전달 대상 판단 기준 (초).
+        retention_seconds (float): 전달 완료 이벤트 보관 기간 (초).
+        BATCH_SIZE (int): 한 번에 재전달할 최대 이벤트 수.
+    """
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        bus: EventBus,
+        flush_seconds: float,
+        replay_after_seconds: float,
+        retention_seconds: float
+    ) -> None:
+        self.bus = bus
+        self.flush_seconds = flush_seconds
+        self.replay_after_seconds = replay_after_seconds
+        self.retention_seconds = retention_seconds
+        self._dispatched: List[int] = []
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def mark_dispatched(self, ids: Sequence[int]) -> None:
+        """커밋 직후 전달된 이벤트 ID를 기록합니다. 어느 스레드에서나 호출할 수 있습니다."""
+        with self._lock:
+            self._dispatched.extend(ids)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """relay task를 중지하고 남은 전달 완료 표시를 저장합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await run_in_threadpool(self.flush_marks)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(self.run_once)
+            except Exception:
+                logger.exception("Event outbox relay failed")
+            await asyncio.sleep(self.flush_seconds)
+
+    def run_once(self) -> None:
+        self.flush_marks()
+        now = time.monotonic()
+        if now - self._last_sweep >= self.replay_after_seconds:
+            self._last_sweep = now
+            while self.replay_stale() == self.BATCH_SIZE:
+                pass
+            self.purge()
+
+    def flush_marks(self) -> int:
+        """모아 둔 이벤트 ID를 전달 완료로 표시합니다."""
+        with self._lock:
+            ids, self._dispatched = self._dispatched, []
+        if not ids:
+            return 0
+        try:
+            self._mark(ids)
+        except Exception:
+            # 표시하지 못한 ID는 다음 주기에 다시 표시합니다 (재전달 대상이 되지 않도록).
+            with self._lock:
+                self._dispatched[:0] = ids
+            raise
+        return len(ids)
+
+    @staticmethod
+    def _mark(ids: Sequence[int]) -> None:
+        db = SessionLocal()
+        try:
+            db.query(OutboxEvent).filter(OutboxEvent.id.in_(ids)).update(
+                {OutboxEvent.dispatched_at: datetime.now()}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def replay_stale(self) -> int:
+        """
+        오래 전달되지 않은 이벤트를 선점하여 다시 전달하고, 전달이 끝나면 전달 완료로 표시합니다.
+
+        Returns:
+            int: 조회한 이벤트 수.
+        """
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=self.replay_after_seconds)
+        unclaimed = or_(OutboxEvent.claimed_at.is_(None), OutboxEvent.claimed_at < stale_before)
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(OutboxEvent)
+                .filter(OutboxEvent.dispatched_at.is_(None), OutboxEvent.created_at < stale_before, unclaimed)
+                .order_by(OutboxEvent.id)
+                .limit(self.BATCH_SIZE)
+                .all()
+            )
+            claimed = [
+                row for row in rows
+                if db.query(OutboxEvent)
+                .filter(OutboxEvent.id == row.id, OutboxEvent.dispatched_at.is_(None), unclaimed)
+                .update({OutboxEvent.claimed_at: now}, synchronize_session=False)
+            ]
+            replayable = [row for row in claimed if row.event_type in EVENT_TYPES]
+            events = [EVENT_TYPES[row.event_type].from_payload(row.payload) for row in replayable]
+            outbox_ids = [row.id for row in replayable]
+            claimed_ids = [row.id for row in claimed]
+            db.commit()
+        finally:
+            db.close()
+
+        if events:
+            logger.warning("Replaying %d undelivered domain events from the outbox", len(events))
+            self.bus.dispatch(events, outbox_ids)
+        if claimed_ids:
+            self._mark(claimed_ids)
+        return len(rows)
+
+    def purge(self) -> int:
+        """보관 기간이 지난 전달 완료 이벤트를 삭제합니다."""
+        db = SessionLocal()
+        try:
+            deleted = db.query(OutboxEvent).filter(
+                OutboxEvent.dispatched_at < datetime.now() - timedelta(seconds=self.retention_seconds)
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        return deleted
+
+
+_outbox_relay: Optional[OutboxRelay] = None
+
+
+def start_event_outbox(flush_seconds: float, replay_after_seconds: float, retention_seconds: float) -> OutboxRelay:
+    """
+    outbox 기록을 켜고 relay task를 시작합니다 (lifespan 시작 시 호출).
+
+    Args:
+        flush_seconds (float): 전달 완료 표시 주기 (초).
+        replay_after_seconds (float): 재전달 대상 판단 기준 (초).
+        retention_seconds (float): 전달 완료 이벤트 보관 기간 (초).
+
+    Returns:
+        OutboxRelay: 시작된 relay.
+    """
+    global _outbox_relay
+    if _outbox_relay is None:
+        _outbox_relay = OutboxRelay(event_bus, flush_seconds, replay_after_seconds, retention_seconds)
+    _outbox_relay.start()
+    return _outbox_relay
+
+
+async def stop_event_outbox() -> None:
+    """relay task를 중지하고 outbox 기록을 끕니다 (lifespan 종료 시 호출)."""
+    global _outbox_relay
+    if _outbox_relay is not None:
+        await _outbox_relay.stop()
+        _outbox_relay = None
+
+
+def emit(db: Session, domain_event: DomainEvent) -> None:
+    """
+    세션이 커밋되면 구독자에게 전달할 이벤트를 기록합니다. 롤백되면 버려집니다.
+
+    outbox가 켜져 있으면 같은 트랜잭션에 `event_outbox` 행을 추가합니다.
+
+    Args:
+        db (Session): 쓰기를 수행한 세션.
+        domain_event (DomainEvent): 이벤트.
+    """
+    db.info.setdefault("pending_events", []).append(domain_event)
+    if _outbox_relay is not None:
+        row = OutboxEvent(
+            event_type=type(domain_event).__name__,
+            payload=domain_event.to_payload(),
+            created_at=datetime.now()
+        )
+        db.add(row)
+        db.info.setdefault("pending_outbox", []).append(row)
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _assign_outbox_ids(session):
+    rows = session.info.pop("pending_outbox", None)
+    if rows:
+        # 커밋 후에는 객체가 만료되어 ID를 읽으면 SQL이 실행되므로 커밋 전에 ID를 확보합니다.
+        session.flush()
+        session.info["outbox_ids"] = [row.id for row in rows]
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _dispatch_committed_events(session):
+    events = session.info.pop("pending_events", None)
+    outbox_ids = session.info.pop("outbox_ids", None)
+    if events:
+        # outbox를 켜기 전에 기록된 이벤트가 섞여 있으면 ID와 짝이 맞지 않으므로 중복 확인을 하지 않습니다.
+        event_bus.dispatch(events, outbox_ids if outbox_ids and len(outbox_ids) == len(events) else None)
+    relay = _outbox_relay
+    if outbox_ids and relay is not None:
+        relay.mark_dispatched(outbox_ids)
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_events(session, previous_transaction):
+    # `after_rollback`과 달리 트랜잭션이 시작되지 않은 세션의 `rollback()`에서도 호출됩니다.
+    if previous_transaction.nested:
+        return
+    for key in ("pending_events", "pending_outbox", "outbox_ids"):
+        session.info.pop(key, None)
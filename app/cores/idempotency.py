@@ -0,0 +1,115 @@
+import hashlib
+import threading
+from typing import Hashable, List, NamedTuple, Optional, Set, Tuple
+
+from app.cores.cache import TTLCache
+from app.cores.metrics import registry
+
+idempotent_replays_total = registry.counter(
+    "idempotent_replays_total", "Requests answered from a stored response of the same Idempotency-Key.", ["outcome"]
+)
+
+
+class StoredResponse(NamedTuple):
+    """
+    `Idempotency-Key`로 보관한 첫 응답.
+
+    Attributes:
+        fingerprint (bytes): 요청 본문 해시 (같은 키를 다른 요청에 재사용했는지 확인용).
+        status_code (int): 응답 상태 코드.
+        headers (List[Tuple[bytes, bytes]]): 응답 헤더 (`content-length` 제외, ASGI raw 형식).
+        body (bytes): 직렬화된 응답 본문.
+    """
+    fingerprint: bytes
+    status_code: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyKeyInUse(Exception):
+    """같은 키의 첫 요청이 아직 처리 중일 때 발생합니다."""
+
+
+class IdempotencyKeyMismatch(Exception):
+    """같은 키가 다른 요청 본문에 재사용되었을 때 발생합니다."""
+
+
+def request_fingerprint(body: bytes) -> bytes:
+    """요청 본문의 128bit 해시를 반환합니다."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class IdempotencyStore:
+    """
+    `Idempotency-Key`별 첫 응답을 보관하는 worker 단위 저장소.
+
+    응답은 직렬화된 본문(bytes) 그대로 TTL/LRU 캐시에 보관하며, 처리 중인 키는 별도로 기록하여
+    첫 요청이 끝나기 전에 도착한 재시도가 쓰기를 한 번 더 수행하지 않도록 합니다.
+
+    Attributes:
+        max_body_bytes (int): 보관할 응답 본문 최대 크기. 이보다 큰 응답은 보관하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, max_body_bytes: int) -> None:
+        self.max_body_bytes = max_body_bytes
+        self._responses = TTLCache(maxsize=maxsize, ttl=ttl, name="idempotency")
+        self._in_flight: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def begin(self, key: Hashable, fingerprint: bytes) -> Optional[StoredResponse]:
+        """
+        키의 처리를 시작합니다.
+
+        보관된 응답이 있으면 반환하고, 없으면 키를 처리 중으로 표시한 뒤 None을 반환합니다.
+        None을 받은 호출자는 반드시 `complete` 또는 `release`를 호출해야 합니다.
+
+        Args:
+            key (Hashable): (사용자 ID, 경로, `Idempotency-Key`) 키.
+            fingerprint (bytes): 요청 본문 해시.
+
+        Returns:
+            Optional[StoredResponse]: 보관된 첫 응답. 처음 보는 키이면 None.
+
+        Raises:
+            IdempotencyKeyInUse: 같은 키의 첫 요청이 처리 중인 경우.
+            IdempotencyKeyMismatch: 보관된 응답의 요청 본문이 다른 경우.
+        """
+        with self._lock:
+            stored = self._responses.get(key)
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    idempotent_replays_total.inc("mismatch")
+                    raise IdempotencyKeyMismatch()
+                idempotent_replays_total.inc("replayed")
+                return stored
+            if key in self._in_flight:
+                idempotent_replays_total.inc("in_flight")
+                raise IdempotencyKeyInUse()
+            self._in_flight.add(key)
+            return None
+
+    def complete(self, key: Hashable, response: StoredResponse) -> None:
+        """
+        첫 응답을 보관하고 처리 중 표시를 해제합니다.
+
+        서버 오류(5xx) 응답이나 `max_body_bytes`보다 큰 응답은 보관하지 않아 재시도가 다시 처리됩니다.
+
+        Args:
+            key (Hashable): `begin`에 전달한 키.
+            response (StoredResponse): 첫 응답.
+        """
+        with self._lock:
+            self._in_flight.discard(key)
+            if response.status_code < 500 and len(response.body) <= self.max_body_bytes:
+                self._responses.set(key, response)
+
+    def release(self, key: Hashable) -> None:
+        """응답을 보관하지 않고 처리 중 표시만 해제합니다 (예외 또는 연결 종료 시)."""
+        with self._lock:
+            self._in_flight.discard(key)
+
+    def clear(self) -> None:
+        """보관된 응답을 모두 제거합니다."""
+        with self._lock:
+            self._responses.clear()
+            self._in_flight.clear()
@@ -0,0 +1,347 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import date, datetime, timedelta
+from typing import Deque, Dict, List, Literal, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.cores.dates import day_range
+from app.cores.events import ScoreCreated, event_bus
+from app.cores.metrics import MetricFamily, registry
+
+Period = Literal["day", "week", "month", "all"]
+
+
+def period_range(period: Period, anchor: date) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    기준 날짜가 속한 기간의 시작/끝 구간을 반환합니다.
+
+    Args:
+        period (Period): `day`, `week`(월요일 시작), `month`, `all`(전체 기간).
+        anchor (date): 기준 날짜.
+
+    Returns:
+        Tuple[Optional[datetime], Optional[datetime]]: (시작, 끝) 반열린 구간. `all`이면 (None, None).
+    """
+    if period == "all":
+        return None, None
+    if period == "day":
+        return day_range(anchor)
+    if period == "week":
+        start = anchor - timedelta(days=anchor.weekday())
+        end = start + timedelta(days=7)
+    else:
+        start = anchor.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+    return datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.min.time())
+
+
+def _covers(start: Optional[datetime], end: Optional[datetime], created_at: datetime) -> bool:
+    return (start is None or created_at >= start) and (end is None or created_at < end)
+
+
+class Leaderboard:
+    """
+    한 기간의 음식 Bayesian 평균 순위표.
+
+    음식마다 평가 수와 점수 합을 보관하고, (-Bayesian 평균, 음식 ID) 키를 정렬된 리스트로 유지하여
+    상위 N개 조회와 음식의 순위 조회를 이분 탐색으로 처리합니다.
+
+    Bayesian 평균은 `(prior_weight * prior_mean + 점수 합) / (prior_weight + 평가 수)`이며,
+    평가가 적은 음식의 평균을 기간 전체 평균(`prior_mean`) 쪽으로 당겨 소수의 평가로 순위가 뒤집히지 않도록 합니다.
+    `prior_mean`은 다시 만들 때(`built_at`)만 계산하고, 그 사이의 점수는 해당 음식의 키만 갱신합니다.
+
+    `watermark` 이전에 등록된 점수는 만들 때의 GROUP BY로만 집계하고, 이후의 점수는 ID로 기억하여 한 번씩만 더합니다.
+
+    Attributes:
+        start (Optional[datetime]): 기간 시작 (포함).
+        end (Optional[datetime]): 기간 끝 (제외).
+        prior_weight (float): 사전 평균에 부여하는 평가 수.
+        prior_mean (float): 기간 전체 평균 점수.
+        watermark (datetime): 점수를 ID로 구분하기 시작하는 등록 시각.
+        built_at (float): 마지막으로 DB에서 다시 만든 시각 (`time.monotonic`).
+    """
+
+    def __init__(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        prior_weight: float,
+        totals: List[Tuple[int, int, float]],
+        watermark: datetime,
+        score_ids: Set[int]
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.prior_weight = prior_weight
+        self.watermark = watermark
+        self._score_ids = score_ids
+        count = sum(food_count for _, food_count, _ in totals)
+        self.prior_mean = sum(food_sum for _, _, food_sum in totals) / count if count else 0.0
+        self.built_at = time.monotonic()
+        self._totals: Dict[int, Tuple[int, float]] = {}
+        self._keys: Dict[int, Tuple[float, int]] = {}
+        self._order: List[Tuple[float, int]] = []
+        for food_id, food_count, food_sum in totals:
+            self._totals[food_id] = (food_count, food_sum)
+            self._keys[food_id] = (-self._bayesian(food_count, food_sum), food_id)
+        self._order = sorted(self._keys.values())
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _bayesian(self, count: int, total: float) -> float:
+        return (self.prior_weight * self.prior_mean + total) / (self.prior_weight + count)
+
+    def covers(self, created_at: datetime) -> bool:
+        return _covers(self.start, self.end, created_at)
+
+    def add_event(self, event: ScoreCreated) -> None:
+        """기간에 속하고 `watermark` 이후에 등록된 점수 중 아직 더하지 않은 점수만 반영합니다."""
+        if (
+            not self.covers(event.created_at)
+            or event.created_at < self.watermark
+            or event.score_id in self._score_ids
+        ):
+            return
+        self._score_ids.add(event.score_id)
+        self.add(event.food_id, event.score)
+
+    def add(self, food_id: int, score: float) -> None:
+        """점수 하나를 반영하고 해당 음식의 순위 키만 다시 정렬 위치에 넣습니다."""
+        count, total = self._totals.get(food_id, (0, 0.0))
+        count, total = count + 1, total + score
+        self._totals[food_id] = (count, total)
+
+        old_key = self._keys.get(food_id)
+        if old_key is not None:
+            del self._order[bisect.bisect_left(self._order, old_key)]
+        key = (-self._bayesian(count, total), food_id)
+        self._keys[food_id] = key
+        bisect.insort(self._order, key)
+
+    def _entry(self, rank: int, key: Tuple[float, int]) -> Dict[str, float]:
+        count, total = self._totals[key[1]]
+        return {"rank": rank, "food_id": key[1], "count": count, "mean": total / count, "score": -key[0]}
+
+    def top(self, limit: int, min_count: int = 0, worst: bool = False) -> List[Dict[str, float]]:
+        """
+        상위(또는 하위) 음식을 순위와 함께 반환합니다.
+
+        Args:
+            limit (int): 최대 개수.
+            min_count (int): 최소 평가 수. 미만인 음식은 건너뜁니다.
+            worst (bool): 하위부터 반환할지 여부.
+
+        Returns:
+            List[Dict[str, float]]: `rank`, `food_id`, `count`, `mean`, `score` 목록.
+                `rank`는 기간 내 평가된 모든 음식 중 상위 순위입니다.
+        """
+        size = len(self._order)
+        positions = range(size - 1, -1, -1) if worst else range(size)
+        entries = []
+        for position in positions:
+            key = self._order[position]
+            if self._totals[key[1]][0] < min_count:
+                continue
+            entries.append(self._entry(position + 1, key))
+            if len(entries) == limit:
+                break
+        return entries
+
+    def rank(self, food_id: int) -> Optional[Dict[str, float]]:
+        """음식의 순위 정보를 반환합니다. 기간 내 평가가 없으면 None."""
+        key = self._keys.get(food_id)
+        if key is None:
+            return None
+        return self._entry(bisect.bisect_left(self._order, key) + 1, key)
+
+
+class LeaderboardService:
+    """
+    기간별 순위표를 worker 메모리에 보관하고 점수 등록 이벤트로 갱신하는 서비스.
+
+    - 순위표는 처음 조회될 때 기간 내 음식별 평가 수/점수 합을 한 번의 GROUP BY로 읽어 만듭니다.
+    - 이 worker에서 등록된 점수는 `ScoreCreated` 이벤트로 기간이 맞는 순위표에 바로 반영됩니다.
+    - `refresh_seconds`가 지난 순위표는 다음 조회 때 DB에서 다시 만들어 다른 worker의 점수와 `prior_mean`을 반영합니다.
+    - 최근에 조회된 `max_boards`개의 순위표만 보관합니다.
+
+    순위표를 만들 때 `WATERMARK_SECONDS`보다 오래된 점수는 GROUP BY로 집계하고, 그 이후의 점수는 한 건씩 읽어 ID를 기억합니다.
+    순위표를 만드는 동안 도착한 이벤트와 replica 지연으로 아직 조회되지 않는 점수의 이벤트가 빠지지 않도록
+    최근 `RECENT_EVENTS`개의 이벤트를 보관했다가 설치할 때 다시 반영하며, 이미 읽은 ID와 outbox 재전달 등으로
+    다시 도착한 이벤트는 건너뛰므로 어느 DB 상태를 읽었는지와 관계없이 한 번씩만 집계됩니다.
+    `watermark` 이전 시각의 점수가 순위표를 만든 뒤에 저장되면 (저널 replay 등) 다음에 다시 만들 때 반영됩니다.
+
+    Attributes:
+        RECENT_EVENTS (int): 보관하는 최근 점수 등록 이벤트 수.
+        WATERMARK_SECONDS (float): 점수를 ID로 구분하는 최근 구간 (초).
+    """
+    RECENT_EVENTS = 5000
+    WATERMARK_SECONDS = 300.0
+
+    def __init__(self, prior_weight: float, refresh_seconds: float, max_boards: int) -> None:
+        self.prior_weight = prior_weight
+        self.refresh_seconds = refresh_seconds
+        self.max_boards = max_boards
+        self._boards: "OrderedDict[Tuple[Period, Optional[datetime]], Leaderboard]" = OrderedDict()
+        self._recent: Deque[ScoreCreated] = deque()
+        self._recent_ids: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def _board(self, db: Session, period: Period, anchor: date) -> Leaderboard:
+        from app.crud.statistics import get_food_score_totals, get_food_scores_since
+
+        start, end = period_range(period, anchor)
+        key = (period, start)
+        with self._lock:
+            board = self._boards.get(key)
+            if board is not None and time.monotonic() - board.built_at < self.refresh_seconds:
+                self._boards.move_to_end(key)
+                return board
+
+        watermark = datetime.now() - timedelta(seconds=self.WATERMARK_SECONDS)
+        if end is not None and end <= watermark:
+            totals = get_food_score_totals(db, start, end)
+            scores = []
+        else:
+            totals = get_food_score_totals(db, start, watermark)
+            scores = get_food_scores_since(db, watermark if start is None else max(start, watermark), end)
+
+        food_totals: Dict[int, List[float]] = {food_id: [count, total] for food_id, count, total in totals}
+        for _, food_id, score in scores:
+            food_total = food_totals.setdefault(food_id, [0, 0.0])
+            food_total[0] += 1
+            food_total[1] += score
+        board = Leaderboard(
+            start, end, self.prior_weight,
+            [(food_id, count, total) for food_id, (count, total) in food_totals.items()],
+            watermark,
+            {score_id for score_id, _, _ in scores}
+        )
+
+        with self._lock:
+            for event in self._recent:
+                board.add_event(event)
+            self._boards[key] = board
+            self._boards.move_to_end(key)
+            while len(self._boards) > self.max_boards:
+                self._boards.popitem(last=False)
+        return board
+
+    def top(
+        self,
+        db: Session,
+        period: Period,
+        anchor: date,
+        limit: int,
+        min_count: int = 0,
+        worst: bool = False
+    ) -> Tuple[Leaderboard, List[Dict[str, float]]]:
+        """
+        기간의 상위(또는 하위) 음식을 조회합니다. 순위표가 없거나 오래되었으면 DB에서 다시 만듭니다.
+
+        Args:
+            db (Session): SQLAlchemy 세션 객체.
+            period (Period): 기간 단위.
+            anchor (date): 기간을 정하는 기준 날짜.
+            limit (int): 최대 개수.
+            min_count (int): 최소 평가 수.
+            worst (bool): 하위부터 조회할지 여부.
+
+        Returns:
+            Tuple[Leaderboard, List[Dict[str, float]]]: (순위표, 순위 항목 목록).
+        """
+        board = self._board(db, period, anchor)
+        with self._lock:
+            return board, board.top(limit, min_count, worst)
+
+    def rank(
+        self,
+        db: Session,
+        period: Period,
+        anchor: date,
+        food_id: int
+    ) -> Tuple[Leaderboard, Optional[Dict[str, float]]]:
+        """기간 내 음식의 순위를 조회합니다. 평가가 없으면 항목은 None."""
+        board = self._board(db, period, anchor)
+        with self._lock:
+            return board, board.rank(food_id)
+
+    def apply(self, events: List[ScoreCreated]) -> None:
+        """등록된 점수를 기간이 맞는 순위표에 반영합니다. 이미 반영한 점수 ID의 이벤트는 건너뜁니다."""
+        with self._lock:
+            for event in events:
+                if event.score_id in self._recent_ids:
+                    continue
+                if len(self._recent) == self.RECENT_EVENTS:
+                    self._recent_ids.discard(self._recent.popleft().score_id)
+                self._recent.append(event)
+                self._recent_ids.add(event.score_id)
+                for board in self._boards.values():
+                    board.add_event(event)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boards.clear()
+            self._recent.clear()
+            self._recent_ids.clear()
+
+    def sizes(self) -> Dict[str, int]:
+        """기간 단위별 보관 중인 순위표의 음식 수 합계."""
+        with self._lock:
+            sizes: Dict[str, int] = {}
+            for (period, _), board in self._boards.items():
+                sizes[period] = sizes.get(period, 0) + len(board)
+            return sizes
+
+
+_leaderboard: Optional[LeaderboardService] = None
+
+
+def start_leaderboard(prior_weight: float, refresh_seconds: float, max_boards: int) -> LeaderboardService:
+    """
+    음식 순위표 서비스를 시작합니다 (lifespan 시작 시 호출).
+
+    Args:
+        prior_weight (float): Bayesian 평균의 사전 평균 가중치 (평가 수).
+        refresh_seconds (float): 순위표를 DB에서 다시 만드는 주기 (초).
+        max_boards (int): 보관할 최대 순위표 수.
+
+    Returns:
+        LeaderboardService: 시작된 서비스.
+    """
+    global _leaderboard
+    if _leaderboard is None:
+        service = LeaderboardService(prior_weight, refresh_seconds, max_boards)
+        event_bus.subscribe(ScoreCreated, service.apply, batch=True)
+        _leaderboard = service
+    return _leaderboard
+
+
+def stop_leaderboard() -> None:
+    """이벤트 구독을 해제하고 순위표를 비웁니다 (lifespan 종료 시 호출)."""
+    global _leaderboard
+    if _leaderboard is not None:
+        event_bus.unsubscribe(ScoreCreated, _leaderboard.apply)
+        _leaderboard.clear()
+        _leaderboard = None
+
+
+def get_leaderboard() -> Optional[LeaderboardService]:
+    """음식 순위표 서비스를 반환합니다. `LEADERBOARD_ENABLED`가 꺼져 있으면 None."""
+    return _leaderboard
+
+
+def _collect_leaderboard() -> List[MetricFamily]:
+    leaderboard = _leaderboard
+    if leaderboard is None:
+        return []
+    return [
+        ("leaderboard_foods", "gauge", "Foods held in in-memory leaderboards by period.",
+         [({"period": period}, size) for period, size in leaderboard.sizes().items()]),
+    ]
+
+
+registry.add_collector(_collect_leaderboard)
@@ -0,0 +1,314 @@
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.cores.events import CommentCreated, ScoreCreated, VoteChanged, event_bus
+from app.cores.metrics import MetricFamily, registry
+from app.database import SessionLocal
+
+logger = logging.getLogger("app.live")
+
+# 변경 종류 -> 메시지의 `delta` 키
+CHANGE_KINDS = ("scores", "votes", "comments")
+
+
+class Subscription:
+    """
+    구독자(SSE 연결) 하나.
+
+    메뉴별로 아직 보내지 못한 최신 메시지 하나만 보관하므로(latest-wins),
+    느린 구독자라도 대기 메시지 수가 구독한 메뉴 수를 넘지 않습니다.
+
+    Attributes:
+        id (int): 구독 ID.
+        menu_ids (frozenset): 구독한 메뉴 ID.
+        closed (bool): 종료 여부 (느린 구독자로 판단되어 hub가 종료했거나 연결이 끊어진 경우).
+        sent (int): 전달한 메시지 수.
+        superseded (int): 전달되기 전에 새 메시지로 대체된 메시지 수.
+    """
+
+    def __init__(self, subscription_id: int, menu_ids: Iterable[int]) -> None:
+        self.id = subscription_id
+        self.menu_ids = frozenset(menu_ids)
+        self.closed = False
+        self.sent = 0
+        self.superseded = 0
+        self._pending: Dict[int, dict] = {}
+        self._pending_since: Optional[float] = None
+        self._ready = asyncio.Event()
+
+    def offer(self, menu_id: int, message: dict) -> None:
+        """
+        메뉴의 최신 메시지를 대기열에 넣습니다.
+
+        같은 메뉴의 전달 전 메시지는 대체되며, 변경 수(`delta`)는 합산되어 유실되지 않습니다.
+        """
+        previous = self._pending.get(menu_id)
+        if previous is not None:
+            self.superseded += 1
+            # 메시지는 구독자 간에 공유되므로 새 dict로 합산합니다.
+            delta = {kind: previous["delta"][kind] + message["delta"][kind] for kind in CHANGE_KINDS}
+            message = {**message, "delta": delta}
+        self._pending[menu_id] = message
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._ready.set()
+
+    def lag(self, now: float) -> float:
+        """가장 오래된 대기 메시지가 기다린 시간 (초)."""
+        return now - self._pending_since if self._pending_since is not None else 0.0
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def next(self, timeout: float) -> List[dict]:
+        """
+        대기 중인 메시지를 모두 꺼냅니다.
+
+        Args:
+            timeout (float): 메시지가 없을 때 기다릴 시간 (초).
+
+        Returns:
+            List[dict]: 메시지 목록. 시간 안에 메시지가 없거나 종료되었으면 빈 목록.
+        """
+        if not self._pending and not self.closed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._ready.clear()
+        if self.closed:
+            return []
+        messages = list(self._pending.values())
+        self._pending.clear()
+        self._pending_since = None
+        self.sent += len(messages)
+        return messages
+
+
+class LiveHub:
+    """
+    쓰기 변경을 메뉴별로 모아 일정 주기마다 한 번만 통계를 다시 계산하고, 모든 구독자에게 전달하는 hub.
+
+    - `publish`는 커밋 직후 이벤트 버스를 통해 요청 처리 스레드에서 호출되며 변경 수만 누적합니다.
+    - 주기(`coalesce_seconds`)마다 변경된 메뉴 중 구독자가 있는 메뉴의 요약을 한 번에 계산하여
+      해당 메뉴의 모든 구독자에게 같은 메시지를 전달합니다 (구독자 수와 관계없이 계산은 한 번).
+    - 대기 메시지가 `slow_client_seconds` 이상 전달되지 못한 구독자는 종료합니다.
+
+    Attributes:
+        coalesce_seconds (float): 변경을 모으는 주기 (초).
+        slow_client_seconds (float): 느린 구독자 판단 기준 (초).
+        max_subscriptions (int): worker당 최대 구독 수.
+    """
+
+    def __init__(self, coalesce_seconds: float, slow_client_seconds: float, max_subscriptions: int) -> None:
+        self.coalesce_seconds = coalesce_seconds
+        self.slow_client_seconds = slow_client_seconds
+        self.max_subscriptions = max_subscriptions
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._by_menu: Dict[int, Set[int]] = defaultdict(set)
+        self._ids = itertools.count(1)
+        # 메뉴 ID -> 종류별 변경 수, 음식 ID -> 평가 변경 수 (요청 처리 스레드에서 갱신)
+        self._menu_changes: Dict[int, Dict[str, int]] = {}
+        self._food_changes: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"published": 0, "recomputes": 0, "messages": 0, "slow_closed": 0}
+
+    def start(self) -> None:
+        """주기적으로 변경을 전달하는 task를 시작합니다 (이벤트 루프 안에서 호출)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """전달 task를 중지하고 모든 구독을 종료합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscription in list(self._subscriptions.values()):
+            self.unsubscribe(subscription)
+
+    def subscribe(self, menu_ids: Iterable[int]) -> Optional[Subscription]:
+        """
+        메뉴 변경을 구독합니다 (이벤트 루프 안에서 호출).
+
+        Args:
+            menu_ids (Iterable[int]): 구독할 메뉴 ID.
+
+        Returns:
+            Optional[Subscription]: 구독 객체. 최대 구독 수를 넘으면 None.
+        """
+        if len(self._subscriptions) >= self.max_subscriptions:
+            return None
+        subscription = Subscription(next(self._ids), menu_ids)
+        self._subscriptions[subscription.id] = subscription
+        for menu_id in subscription.menu_ids:
+            self._by_menu[menu_id].add(subscription.id)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독을 해제합니다. 여러 번 호출해도 안전합니다."""
+        subscription.close()
+        if self._subscriptions.pop(subscription.id, None) is None:
+            return
+        for menu_id in subscription.menu_ids:
+            subscribers = self._by_menu.get(menu_id)
+            if subscribers is not None:
+                subscribers.discard(subscription.id)
+                if not subscribers:
+                    del self._by_menu[menu_id]
+
+    def publish(self, kind: str, menu_id: Optional[int] = None, food_id: Optional[int] = None) -> None:
+        """
+        커밋된 변경 하나를 기록합니다. 어느 스레드에서나 호출할 수 있습니다.
+
+        Args:
+            kind (str): 변경 종류 (`scores`, `votes`, `comments`).
+            menu_id (Optional[int]): 변경된 메뉴 ID (투표/댓글).
+            food_id (Optional[int]): 평가된 음식 ID (평가는 음식 단위이므로 전달 시점에 메뉴로 변환합니다).
+        """
+        with self._lock:
+            self.stats["published"] += 1
+            if menu_id is not None:
+                changes = self._menu_changes.setdefault(menu_id, dict.fromkeys(CHANGE_KINDS, 0))
+                changes[kind] += 1
+            elif food_id is not None:
+                self._food_changes[food_id] = self._food_changes.get(food_id, 0) + 1
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.coalesce_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to push live statistics")
+
+    async def flush(self) -> None:
+        """누적된 변경을 구독자에게 전달하고 느린 구독자를 종료합니다."""
+        with self._lock:
+            menu_changes, self._menu_changes = self._menu_changes, {}
+            food_changes, self._food_changes = self._food_changes, {}
+
+        subscribed = set(self._by_menu)
+        menu_changes = {menu_id: changes for menu_id, changes in menu_changes.items() if menu_id in subscribed}
+        if subscribed and (menu_changes or food_changes):
+            summaries = await run_in_threadpool(self._summarize, menu_changes, food_changes, subscribed)
+            self.stats["recomputes"] += 1
+            for menu_id, summary in summaries.items():
+                message = {"menu_id": menu_id, "delta": menu_changes[menu_id], "summary": summary.model_dump()}
+                for subscription_id in self._by_menu.get(menu_id, ()):
+                    self._subscriptions[subscription_id].offer(menu_id, message)
+                    self.stats["messages"] += 1
+
+        now = time.monotonic()
+        for subscription in list(self._subscriptions.values()):
+            if subscription.lag(now) > self.slow_client_seconds:
+                logger.warning("Closing slow live subscriber %d (lag %.1fs)", subscription.id, subscription.lag(now))
+                self.stats["slow_closed"] += 1
+                self.unsubscribe(subscription)
+
+    @staticmethod
+    def _summarize(menu_changes: Dict[int, Dict[str, int]], food_changes: Dict[int, int], subscribed: Set[int]):
+        from app.crud.statistics import get_food_menu_ids, get_menu_live_summaries
+
+        db = SessionLocal()
+        try:
+            if food_changes:
+                for food_id, menu_id in get_food_menu_ids(db, list(food_changes), list(subscribed)):
+                    changes = menu_changes.setdefault(menu_id, dict.fromkeys(CHANGE_KINDS, 0))
+                    changes["scores"] += food_changes[food_id]
+            return get_menu_live_summaries(db, list(menu_changes))
+        finally:
+            db.close()
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "subscriptions": len(self._subscriptions),
+            "subscribed_menus": len(self._by_menu),
+            **self.stats,
+        }
+
+
+_live_hub: Optional[LiveHub] = None
+
+
+def start_live_hub(coalesce_seconds: float, slow_client_seconds: float, max_subscriptions: int) -> LiveHub:
+    """
+    프로세스 전역 live hub를 생성하고 전달 task를 시작합니다 (lifespan 시작 시 호출).
+
+    Args:
+        coalesce_seconds (float): 변경을 모으는 주기 (초).
+        slow_client_seconds (float): 느린 구독자 판단 기준 (초).
+        max_subscriptions (int): worker당 최대 구독 수.
+
+    Returns:
+        LiveHub: 시작된 hub.
+    """
+    global _live_hub
+    if _live_hub is None:
+        _live_hub = LiveHub(coalesce_seconds, slow_client_seconds, max_subscriptions)
+    _live_hub.start()
+    return _live_hub
+
+
+async def stop_live_hub() -> None:
+    """전달 task를 중지하고 구독을 모두 종료합니다 (lifespan 종료 시 호출)."""
+    global _live_hub
+    if _live_hub is not None:
+        await _live_hub.stop()
+        _live_hub = None
+
+
+def get_live_hub() -> Optional[LiveHub]:
+    """live hub를 반환합니다. `LIVE_ENABLED`가 꺼져 있으면 None."""
+    return _live_hub
+
+
+def _publish_events(events: List) -> None:
+    """커밋된 평가/투표/댓글 이벤트를 live hub에 전달합니다 (이벤트 버스 동기 구독자)."""
+    hub = _live_hub
+    if hub is None:
+        return
+    for domain_event in events:
+        if isinstance(domain_event, ScoreCreated):
+            hub.publish("scores", food_id=domain_event.food_id)
+        elif isinstance(domain_event, VoteChanged):
+            if domain_event.previous_menu_id is not None:
+                hub.publish("votes", menu_id=domain_event.previous_menu_id)
+            hub.publish("votes", menu_id=domain_event.menu_id)
+        elif isinstance(domain_event, CommentCreated):
+            hub.publish("comments", menu_id=domain_event.menu_id)
+
+
+for _event_type in (ScoreCreated, VoteChanged, CommentCreated):
+    event_bus.subscribe(_event_type, _publish_events, batch=True)
+
+
+def _collect_live() -> List[MetricFamily]:
+    hub = _live_hub
+    if hub is None:
+        return []
+    snapshot = hub.snapshot()
+    return [
+        ("live_subscriptions", "gauge", "Open live statistics subscriptions.", [({}, snapshot["subscriptions"])]),
+        ("live_changes_published_total", "counter", "Committed writes published to the live hub.",
+         [({}, snapshot["published"])]),
+        ("live_recomputes_total", "counter", "Coalesced live summary recomputations.", [({}, snapshot["recomputes"])]),
+        ("live_messages_total", "counter", "Live messages queued for subscribers.", [({}, snapshot["messages"])]),
+        ("live_slow_subscribers_closed_total", "counter", "Subscribers closed because they fell behind.",
+         [({}, snapshot["slow_closed"])]),
+    ]
+
+
+registry.add_collector(_collect_live)
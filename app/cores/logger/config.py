@@ -1,24 +1,62 @@
 import logging
-from app.database import get_db
-from app.cores.logger.handler import CustomLoggingHandler
+import queue
+from logging.handlers import QueueListener
+from typing import Optional
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.cores.logger.handler import CustomLoggingHandler, DroppingQueueHandler
+
+settings = get_settings()
+
+# 애플리케이션 전체에서 사용할 전역 로거 객체
+logger = logging.getLogger("logger")
+logger.setLevel(logging.INFO)
+
+# DB 저장 대기 중인 로그 레코드 큐
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE)
+
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+# 이전 lifespan에서 종료된 큐 핸들러가 버린 로그 수
+_dropped_before = 0
 
 
 def setup_logger() -> logging.Logger:
     """
     커스텀 로그 핸들러를 포함한 로거를 설정하는 함수.
 
-    DB 세션을 통해 CustomLoggingHandler를 생성하고,
-    로거에 핸들러를 추가하여 로그 메시지를 데이터베이스에 저장할 수 있도록 설정합니다.
+    로거에는 큐에 레코드를 넣기만 하는 핸들러를 등록하고,
+    별도 스레드(QueueListener)가 CustomLoggingHandler로 로그 메시지를 데이터베이스에 저장합니다.
+    각 worker 프로세스의 lifespan 시작 시 호출됩니다.
 
     Returns:
         logging.Logger: 커스텀 핸들러가 등록된 로거 인스턴스.
     """
-    handler = CustomLoggingHandler(db=next(get_db()))
-    logger = logging.getLogger("logger")
-    logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    global _queue_handler, _listener
+    if _listener is not None:
+        return logger
+
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, CustomLoggingHandler(session_factory=SessionLocal))
+    _listener.start()
+    logger.addHandler(_queue_handler)
     return logger
 
 
-# 애플리케이션 전체에서 사용할 전역 로거 객체
-logger = setup_logger()
+def shutdown_logger() -> None:
+    """
+    로거에서 큐 핸들러를 제거하고, 대기 중인 로그를 모두 저장한 뒤 처리 스레드를 종료합니다.
+    """
+    global _queue_handler, _listener, _dropped_before
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+        _dropped_before += _queue_handler.dropped
+    if _listener is not None:
+        _listener.stop()
+    _queue_handler = _listener = None
+
+
+def dropped_log_records() -> int:
+    """큐가 가득 차서 버려진 로그 레코드 수를 반환합니다."""
+    return _dropped_before + (_queue_handler.dropped if _queue_handler is not None else 0)
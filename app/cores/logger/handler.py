@@ -1,5 +1,8 @@
 import logging
-from sqlalchemy.orm import Session
+import queue
+from logging.handlers import QueueHandler
+
+from sqlalchemy.orm import sessionmaker
 from app.models.logs import BackLog
 
 
@@ -11,27 +14,31 @@ class CustomLoggingHandler(logging.Handler):
     로그 기록을 데이터베이스에 저장합니다.
 
     Attributes:
-        db (Session): SQLAlchemy 데이터베이스 세션.
+        session_factory (sessionmaker): 로그 한 건마다 세션을 생성할 SQLAlchemy 세션 팩토리.
     """
 
-    def __init__(self, db: Session, level: int = 0) -> None:
+    def __init__(self, session_factory: sessionmaker, level: int = 0) -> None:
         """
         CustomLoggingHandler 초기화.
 
         Args:
-            db (Session): SQLAlchemy 세션 인스턴스.
+            session_factory (sessionmaker): SQLAlchemy 세션 팩토리.
             level (int): 로깅 레벨 (기본값: 0).
         """
         super().__init__(level)
-        self.db = db
+        self.session_factory = session_factory
 
     def emit(self, record: logging.LogRecord) -> None:
         """
         로그 레코드를 데이터베이스에 저장.
 
+        저장에 실패하면 롤백 후 logging 시스템의 `handleError`로 처리하여
+        로그 처리 스레드가 중단되지 않도록 합니다.
+
         Args:
             record (logging.LogRecord): 로깅 시스템으로부터 전달된 로그 레코드.
         """
+        db = self.session_factory()
         try:
             new_log = BackLog(
                 user_id=record.user_id,
@@ -41,12 +48,34 @@ class CustomLoggingHandler(logging.Handler):
                 response=record.response,
                 status_code=record.status_code,
                 is_success=record.is_success,
+                trace_id=getattr(record, "trace_id", None),
                 time=record.time
             )
-            self.db.add(new_log)
-            self.db.commit()
+            db.add(new_log)
+            db.commit()
         except Exception:
-            self.db.rollback()
-            raise
+            db.rollback()
+            self.handleError(record)
         finally:
-            self.db.close()
+            db.close()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    큐가 가득 차면 로그를 버리는 QueueHandler.
+
+    요청 처리 경로에서는 큐에 넣기만 하고, 실제 DB 저장은 QueueListener 스레드가 수행합니다.
+
+    Attributes:
+        dropped (int): 큐가 가득 차 버려진 로그 수.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
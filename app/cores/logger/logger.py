@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import datetime
 from app.cores.logger.config import logger
 
@@ -9,7 +9,8 @@ def record_log(
     request_body: Dict[str, Any],
     status_code: int, 
     response: Dict[str, Any], 
-    is_success: bool
+    is_success: bool,
+    trace_id: Optional[str] = None
 ) -> None:
     """
     백엔드 로그를 기록하는 함수.
@@ -25,6 +26,7 @@ def record_log(
         status_code (int): HTTP 응답 상태 코드.
         response (Dict[str, Any]): API 응답 데이터.
         is_success (bool): 요청 성공 여부.
+        trace_id (Optional[str]): 요청의 추적 ID (추적 중인 경우).
     """
     logger.info(
         f"{request_api} 호출",
@@ -36,6 +38,7 @@ def record_log(
             "status_code": status_code,
             "response": response,
             "is_success": is_success,
+            "trace_id": trace_id,
             "time": datetime.now()
         }
     )
@@ -0,0 +1,283 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.cores.statements import add_statement_observer
+
+# Prometheus 기본 히스토그램 버킷 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (metric 이름, 타입, 설명, [(라벨, 값), ...])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """
+    라벨별로 누적되는 카운터.
+
+    Attributes:
+        name (str): metric 이름.
+        documentation (str): `# HELP` 설명.
+        labelnames (Sequence[str]): 라벨 이름 목록.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def collect(self) -> List[MetricFamily]:
+        with self._lock:
+            samples = [(dict(zip(self.labelnames, key)), value) for key, value in self._values.items()]
+        return [(self.name, "counter", self.documentation, samples)]
+
+
+class Histogram:
+    """
+    라벨별 누적 버킷, 합계, 개수를 기록하는 히스토그램.
+
+    Attributes:
+        name (str): metric 이름 (`_bucket`, `_sum`, `_count` 접미사가 붙습니다).
+        documentation (str): `# HELP` 설명.
+        labelnames (Sequence[str]): 라벨 이름 목록.
+        buckets (Tuple[float, ...]): 버킷 상한 (오름차순).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> [버킷별 개수(비누적)..., +Inf 개수, 합계]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            values = self._values.get(labelvalues)
+            if values is None:
+                values = self._values[labelvalues] = [0.0] * (len(self.buckets) + 2)
+            values[index] += 1
+            values[-1] += value
+
+    def collect(self) -> List[MetricFamily]:
+        samples: List[Tuple[Dict[str, str], float]] = []
+        with self._lock:
+            items = [(key, list(values)) for key, values in self._values.items()]
+        for key, values in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), values[:-1]):
+                cumulative += count
+                samples.append(({**labels, "le": _format_value(bound)}, cumulative))
+        families = [(f"{self.name}_bucket", "histogram", self.documentation, samples)]
+        families.append((f"{self.name}_sum", "", "", [(dict(zip(self.labelnames, key)), values[-1]) for key, values in items]))
+        families.append((f"{self.name}_count", "", "", [
+            (dict(zip(self.labelnames, key)), sum(values[:-1])) for key, values in items
+        ]))
+        return families
+
+
+class Registry:
+    """
+    metric과 수집 시점에 값을 계산하는 collector를 모아 Prometheus 텍스트 형식으로 출력하는 클래스.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: List = []
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """scrape 시점에 호출되어 gauge 등 현재 값을 반환하는 함수를 등록합니다."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        등록된 모든 metric을 Prometheus 텍스트 노출 형식(0.0.4)으로 반환합니다.
+
+        Returns:
+            str: `/metrics` 응답 본문.
+        """
+        families: List[MetricFamily] = []
+        for metric in self._metrics:
+            families.extend(metric.collect())
+        for collector in self._collectors:
+            families.extend(collector())
+
+        lines = []
+        for name, kind, documentation, samples in families:
+            if kind:
+                base = name[:-len("_bucket")] if kind == "histogram" else name
+                lines.append(f"# HELP {base} {documentation}")
+                lines.append(f"# TYPE {base} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route")
+)
+http_request_db_statements = registry.histogram(
+    "http_request_db_statements", "SQL statements executed per HTTP request by route template.", ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+)
+http_request_db_seconds = registry.histogram(
+    "http_request_db_seconds", "Total SQL execution time per HTTP request by route template.", ("method", "route"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+db_statement_duration_seconds = registry.histogram(
+    "db_statement_duration_seconds", "SQL statement execution time by engine.", ("engine",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+
+def observe_request(
+    method: str,
+    route: str,
+    status: int,
+    duration: float,
+    db_statements: int = 0,
+    db_duration: float = 0.0
+) -> None:
+    """
+    HTTP 요청 하나의 결과를 기록합니다.
+
+    Args:
+        method (str): HTTP 메서드.
+        route (str): 라우트 템플릿 (`/api/v1/menus/{date}`). 매칭되지 않은 요청은 `unmatched`.
+        status (int): 응답 상태 코드.
+        duration (float): 처리 시간 (초).
+        db_statements (int): 요청 처리 중 실행된 SQL 문 수.
+        db_duration (float): 요청 처리 중 SQL 실행 시간 합계 (초).
+    """
+    http_requests_total.inc(method, route, str(status))
+    http_request_duration_seconds.observe(duration, method, route)
+    http_request_db_statements.observe(db_statements, method, route)
+    http_request_db_seconds.observe(db_duration, method, route)
+
+
+def _observe_statement(engine: str, statement: str, parameters, duration: float, executemany: bool) -> None:
+    db_statement_duration_seconds.observe(duration, engine)
+
+
+add_statement_observer(_observe_statement)
+
+
+def _collect_pools() -> List[MetricFamily]:
+    from app import database
+
+    engines = {"primary": database.engine}
+    if database.read_engine is not None and database.read_engine is not database.engine:
+        engines["replica"] = database.read_engine
+
+    gauges = {
+        "db_pool_size": ("gauge", "Configured pool size.", "size"),
+        "db_pool_checked_out": ("gauge", "Connections currently checked out.", "checked_out"),
+        "db_pool_checked_in": ("gauge", "Idle connections in the pool.", "checked_in"),
+        "db_pool_overflow": ("gauge", "Overflow connections currently open.", "overflow"),
+        "db_pool_checkouts_total": ("counter", "Successful connection checkouts.", "checkouts"),
+        "db_pool_checkout_timeouts_total": ("counter", "Checkouts that hit pool_timeout.", "timeouts"),
+    }
+    samples: Dict[str, List[Tuple[Dict[str, str], float]]] = {name: [] for name in gauges}
+    wait_samples: List[Tuple[Dict[str, str], float]] = []
+    for name, engine in engines.items():
+        if engine is None or not hasattr(engine.pool, "status_snapshot"):
+            continue
+        snapshot = engine.pool.status_snapshot()
+        for metric, (_, _, key) in gauges.items():
+            samples[metric].append(({"engine": name}, snapshot[key]))
+        wait_samples.append(({"engine": name}, snapshot["total_wait_ms"] / 1000))
+
+    families = [(metric, kind, documentation, samples[metric]) for metric, (kind, documentation, _) in gauges.items()]
+    families.append((
+        "db_pool_checkout_wait_seconds_total", "counter", "Total time spent waiting for a connection.", wait_samples
+    ))
+    return families
+
+
+def _collect_log_queue() -> List[MetricFamily]:
+    from app.cores.logger.config import dropped_log_records, log_queue
+
+    return [
+        ("log_queue_depth", "gauge", "Log records waiting to be written to the database.", [({}, log_queue.qsize())]),
+        ("log_queue_capacity", "gauge", "Maximum size of the log queue.", [({}, log_queue.maxsize)]),
+        ("log_records_dropped_total", "counter", "Log records dropped because the queue was full.",
+         [({}, dropped_log_records())]),
+    ]
+
+
+def _collect_caches() -> List[MetricFamily]:
+    from app.cores.cache import named_caches
+
+    stats = {name: cache.stats() for name, cache in sorted(named_caches().items())}
+    return [
+        ("cache_hits_total", "counter", "Cache hits.", [({"cache": name}, value["hits"]) for name, value in stats.items()]),
+        ("cache_misses_total", "counter", "Cache misses.", [({"cache": name}, value["misses"]) for name, value in stats.items()]),
+        ("cache_entries", "gauge", "Entries currently cached.", [({"cache": name}, value["size"]) for name, value in stats.items()]),
+        ("cache_hit_ratio", "gauge", "Hits / (hits + misses) since start.",
+         [({"cache": name}, value["hit_ratio"]) for name, value in stats.items()]),
+    ]
+
+
+registry.add_collector(_collect_pools)
+registry.add_collector(_collect_log_queue)
+registry.add_collector(_collect_caches)
+
+
+def render_metrics() -> str:
+    """현재 worker 프로세스의 metric을 Prometheus 텍스트 형식으로 반환합니다."""
+    return registry.render()
@@ -0,0 +1,98 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStatistics:
+    """
+    커넥션 풀 체크아웃 대기 통계를 누적하는 클래스.
+
+    Attributes:
+        checkouts (int): 누적 체크아웃 횟수.
+        timeouts (int): `pool_timeout` 초과로 실패한 체크아웃 횟수.
+        total_wait (float): 누적 체크아웃 대기 시간 (초).
+        max_wait (float): 최대 체크아웃 대기 시간 (초).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """누적 통계를 초기화합니다."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        """
+        체크아웃 한 번의 대기 시간을 기록합니다.
+
+        Args:
+            wait (float): 체크아웃에 걸린 시간 (초).
+            timed_out (bool): 타임아웃으로 실패했는지 여부.
+        """
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 누적 통계를 딕셔너리로 반환합니다."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+                "avg_wait_ms": round(self.total_wait * 1000 / attempts, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    체크아웃 대기 시간을 기록하는 QueuePool.
+
+    대기 시간에는 풀이 비어 있을 때의 대기, overflow 커넥션 생성,
+    `pool_pre_ping` 검사 시간이 모두 포함됩니다.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.statistics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.statistics.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+    def status_snapshot(self) -> Dict[str, Any]:
+        """풀의 실시간 상태와 누적 대기 통계를 함께 반환합니다."""
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self._timeout,
+            **self.statistics.snapshot(),
+        }
@@ -0,0 +1,245 @@
+import cProfile
+import hashlib
+import hmac
+import io
+import itertools
+import marshal
+import pstats
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Literal, Optional
+
+ProfileTrigger = Literal["header", "sample"]
+
+
+@dataclass
+class ProfileRecord:
+    """
+    프로파일링된 요청 하나의 결과.
+
+    Attributes:
+        id (int): 프로파일 ID (worker 프로세스 내에서 증가).
+        method (str): HTTP 메서드.
+        path (str): 요청 경로.
+        route (Optional[str]): 라우트 템플릿 (`/api/v1/statistics/menus/{menu_id}`).
+        status_code (int): 응답 상태 코드.
+        trigger (ProfileTrigger): 프로파일링 계기 (서명된 헤더 또는 샘플링).
+        started_at (datetime): 요청 시작 시각.
+        duration_ms (float): 프로파일링 구간의 처리 시간 (ms).
+        stats (bytes): `pstats`/`snakeviz`로 읽을 수 있는 marshal 형식의 cProfile 결과.
+    """
+    id: int
+    method: str
+    path: str
+    route: Optional[str]
+    status_code: int
+    trigger: ProfileTrigger
+    started_at: datetime
+    duration_ms: float
+    stats: bytes = field(repr=False)
+
+    def summary(self, sort: str = "cumulative", limit: int = 40) -> str:
+        """
+        `pstats` 형식의 텍스트 요약을 반환합니다.
+
+        Args:
+            sort (str): 정렬 기준 (`cumulative`, `tottime`, `ncalls` 등).
+            limit (int): 출력할 함수 수.
+
+        Returns:
+            str: 텍스트 요약.
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(_MarshalledStats(self.stats), stream=stream)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+class _MarshalledStats:
+    """`pstats.Stats`가 marshal 형식의 결과를 읽을 수 있도록 `create_stats()` 인터페이스를 제공합니다."""
+
+    def __init__(self, data: bytes) -> None:
+        self.stats = marshal.loads(data)
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfileStore:
+    """
+    최근 프로파일 결과를 최대 `maxsize`개까지 보관하는 스레드 안전 저장소.
+
+    결과는 worker 프로세스 메모리에 보관되므로 여러 worker로 실행하면 요청을 처리한 worker에서만 조회됩니다.
+
+    Attributes:
+        maxsize (int): 최대 보관 개수 (초과 시 오래된 결과부터 제거).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._records: "OrderedDict[int, ProfileRecord]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, **fields) -> ProfileRecord:
+        with self._lock:
+            record = ProfileRecord(id=next(self._ids), **fields)
+            self._records[record.id] = record
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+        return record
+
+    def get(self, profile_id: int) -> Optional[ProfileRecord]:
+        with self._lock:
+            return self._records.get(profile_id)
+
+    def list(self) -> List[ProfileRecord]:
+        """최근 결과부터 반환합니다."""
+        with self._lock:
+            return list(reversed(self._records.values()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+def sign_profile_token(secret: str, expires_at: int) -> str:
+    """
+    `X-Profile` 헤더 값(`<만료 시각>.<HMAC-SHA256>`)을 생성합니다.
+
+    Args:
+        secret (str): 서명 키.
+        expires_at (int): 만료 시각 (Unix time, 초).
+
+    Returns:
+        str: 헤더 값.
+    """
+    signature = hmac.new(secret.encode(), str(expires_at).encode(), hashlib.sha256).hexdigest()
+    return f"{expires_at}.{signature}"
+
+
+def verify_profile_token(secret: str, token: str, now: Optional[float] = None) -> bool:
+    """
+    `X-Profile` 헤더 값의 서명과 만료 시각을 검증합니다.
+
+    Args:
+        secret (str): 서명 키.
+        token (str): 헤더 값.
+        now (Optional[float]): 현재 시각 (Unix time). 지정하지 않으면 `time.time()`.
+
+    Returns:
+        bool: 유효한 토큰이면 True.
+    """
+    expires_at, _, signature = token.partition(".")
+    if not expires_at.isdigit() or not signature:
+        return False
+    if int(expires_at) < (time.time() if now is None else now):
+        return False
+    return hmac.compare_digest(sign_profile_token(secret, int(expires_at)), token)
+
+
+class Profiler:
+    """
+    요청 단위 프로파일링 여부를 결정하고 결과를 저장하는 클래스.
+
+    - 서명된 `X-Profile` 헤더가 있는 요청은 항상 프로파일링합니다.
+    - `sample_rate`(0~1) 비율로 무작위 요청을 프로파일링합니다. 관리자 API로 실행 중에 변경할 수 있습니다.
+
+    cProfile은 이벤트 루프 스레드에서 동작하므로 동시에 하나의 요청만 프로파일링하며,
+    프로파일링 중 같은 worker에서 처리된 다른 요청의 작업이 결과에 섞일 수 있습니다.
+
+    Attributes:
+        secret (Optional[str]): `X-Profile` 헤더 서명 키. None이면 헤더로 프로파일링할 수 없습니다.
+        sample_rate (float): 샘플링 비율.
+        store (ProfileStore): 결과 저장소.
+    """
+
+    HEADER = b"x-profile"
+
+    def __init__(self, secret: Optional[str], sample_rate: float, max_profiles: int) -> None:
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self.store = ProfileStore(max_profiles)
+        self._busy = threading.Lock()
+
+    def should_profile(self, headers: List) -> Optional[ProfileTrigger]:
+        """
+        요청을 프로파일링할지 결정합니다.
+
+        Args:
+            headers (List): ASGI scope의 원본 헤더 목록.
+
+        Returns:
+            Optional[ProfileTrigger]: 프로파일링 계기. 프로파일링하지 않으면 None.
+        """
+        if self.secret is not None:
+            for name, value in headers:
+                if name == self.HEADER:
+                    if verify_profile_token(self.secret, value.decode("latin-1")):
+                        return "header"
+                    break
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def acquire(self) -> Optional[cProfile.Profile]:
+        """
+        다른 요청을 프로파일링 중이 아니면 시작된 프로파일러를 반환합니다.
+
+        Returns:
+            Optional[cProfile.Profile]: 시작된 프로파일러. 이미 프로파일링 중이면 None.
+        """
+        if not self._busy.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 도구(디버거 등)가 이미 프로파일러를 사용 중인 경우
+            self._busy.release()
+            return None
+        return profile
+
+    def release(self, profile: cProfile.Profile, **metadata) -> ProfileRecord:
+        """
+        프로파일러를 중지하고 결과를 저장합니다.
+
+        Args:
+            profile (cProfile.Profile): `acquire()`로 시작한 프로파일러.
+            **metadata: `ProfileRecord`의 나머지 필드.
+
+        Returns:
+            ProfileRecord: 저장된 결과.
+        """
+        try:
+            profile.disable()
+        finally:
+            self._busy.release()
+        profile.create_stats()
+        return self.store.add(stats=marshal.dumps(profile.stats), **metadata)
+
+    def settings(self) -> Dict:
+        return {
+            "header_enabled": self.secret is not None,
+            "sample_rate": self.sample_rate,
+            "max_profiles": self.store.maxsize,
+        }
+
+
+_profiler: Optional[Profiler] = None
+
+
+def init_profiler(secret: Optional[str], sample_rate: float, max_profiles: int) -> Profiler:
+    """프로세스 전역 프로파일러를 생성합니다 (`create_app`에서 호출)."""
+    global _profiler
+    _profiler = Profiler(secret, sample_rate, max_profiles)
+    return _profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """프로파일러를 반환합니다. `PROFILING_ENABLED`가 꺼져 있으면 None."""
+    return _profiler
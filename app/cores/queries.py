@@ -0,0 +1,146 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from app.cores.statements import add_statement_observer
+
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_SINGLE_PLACEHOLDER = re.compile(_PLACEHOLDER)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    같은 형태의 SQL 문이 같은 문자열이 되도록 정규화합니다.
+
+    리터럴과 바인드 파라미터를 `?`로 바꾸고, `IN (?, ?, ?)`처럼 개수가 달라지는 목록은 `(?)`로 합칩니다.
+
+    Args:
+        statement (str): DBAPI에 전달된 SQL 문.
+
+    Returns:
+        str: 정규화된 SQL 문.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(?)", statement)
+    statement = _SINGLE_PLACEHOLDER.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryStats:
+    """
+    하나의 추적 구간(요청 등)에서 실행된 SQL 문 통계.
+
+    Attributes:
+        count (int): 실행된 SQL 문 수.
+        duration (float): SQL 실행 시간 합계 (초).
+        statements (Counter): 정규화된 SQL 문별 실행 횟수.
+        parent (Optional[QueryStats]): 바깥 추적 구간. 중첩된 구간의 SQL 문은 바깥 구간에도 집계됩니다.
+    """
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = field(default=None, repr=False)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        `threshold`번 이상 반복된 SQL 문을 많이 실행된 순으로 반환합니다 (N+1 의심).
+
+        Args:
+            threshold (int): 반복 횟수 기준.
+
+        Returns:
+            List[Tuple[str, int]]: (정규화된 SQL 문, 실행 횟수) 목록.
+        """
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+    @property
+    def max_repeat(self) -> int:
+        return max(self.statements.values(), default=0)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _record_statement(engine: str, statement: str, parameters: Any, duration: float, executemany: bool) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    normalized = normalize_sql(statement)
+    while stats is not None:
+        stats.count += 1
+        stats.duration += duration
+        stats.statements[normalized] += 1
+        stats = stats.parent
+
+
+add_statement_observer(_record_statement)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 추적 중인 구간의 SQL 통계를 반환합니다. 추적 중이 아니면 `None`."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 SQL 문을 집계합니다.
+
+    ContextVar로 격리되므로 동시에 처리되는 다른 요청의 SQL 문은 포함되지 않으며,
+    threadpool에서 실행되는 동기 엔드포인트/의존성의 SQL 문도 포함됩니다.
+
+    Yields:
+        QueryStats: 블록 실행 중 갱신되는 통계 객체.
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """SQL 문 수가 허용 범위를 넘었을 때 발생하는 예외."""
+
+
+@contextmanager
+def query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 SQL 문 수가 예산을 넘으면 `QueryBudgetExceeded`를 발생시킵니다.
+
+    Args:
+        max_queries (int): 허용하는 최대 SQL 문 수.
+        max_repeats (Optional[int]): 같은 SQL 문의 최대 반복 횟수 (N+1 검사). `None`이면 검사하지 않습니다.
+
+    Yields:
+        QueryStats: 블록 실행 중 갱신되는 통계 객체.
+
+    Raises:
+        QueryBudgetExceeded: 예산을 초과한 경우.
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} SQL statements, got {stats.count}:\n" + _describe(stats)
+        )
+    if max_repeats is not None and stats.max_repeat > max_repeats:
+        raise QueryBudgetExceeded(
+            f"A statement was repeated {stats.max_repeat} times (limit {max_repeats}), possible N+1:\n"
+            + _describe(stats)
+        )
+
+
+def _describe(stats: QueryStats) -> str:
+    return "\n".join(f"  {count:>4} x {statement}" for statement, count in stats.statements.most_common(10))
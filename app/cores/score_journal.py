@@ -0,0 +1,399 @@
+import glob
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from app.cores.metrics import MetricFamily, registry
+from app.database import SessionLocal
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger("app.score_journal")
+
+SEGMENT_PATTERN = "scores-*.jsonl"
+
+# 점수 기록 하나: {"id", "user_id", "food_id", "score", "created_at"}
+ScoreRecord = Dict[str, Any]
+
+
+class JournalFullError(Exception):
+    """DB에 저장되기를 기다리는 점수가 `max_pending`을 넘은 경우."""
+
+
+class ScoreIdAllocator:
+    """
+    DB에 저장하기 전에 점수 ID를 발급하는 할당기.
+
+    `id_blocks` 테이블에서 `block_size`개씩 ID 블록을 예약하고, 블록 안에서는 DB 접근 없이 발급합니다.
+    여러 worker가 서로 다른 블록을 예약하므로 ID가 겹치지 않습니다.
+
+    Attributes:
+        block_size (int): 한 번에 예약할 ID 수.
+    """
+
+    def __init__(self, block_size: int) -> None:
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def allocate(self, count: int) -> List[int]:
+        """
+        ID를 `count`개 발급합니다. 예약한 블록을 모두 사용했으면 새 블록을 예약합니다.
+
+        Args:
+            count (int): 발급할 ID 수.
+
+        Returns:
+            List[int]: 발급된 ID 목록.
+        """
+        ids: List[int] = []
+        with self._lock:
+            while len(ids) < count:
+                if self._next >= self._end:
+                    size = max(self.block_size, count - len(ids))
+                    self._next = self._reserve(size)
+                    self._end = self._next + size
+                take = min(count - len(ids), self._end - self._next)
+                ids.extend(range(self._next, self._next + take))
+                self._next += take
+        return ids
+
+    @staticmethod
+    def _reserve(size: int) -> int:
+        from app.crud.scores import reserve_score_ids
+
+        for attempt in range(2):
+            db = SessionLocal()
+            try:
+                start = reserve_score_ids(db, size)
+                db.commit()
+                return start
+            except IntegrityError:
+                # 다른 worker가 동시에 첫 블록을 예약한 경우 다시 시도합니다.
+                db.rollback()
+                if attempt:
+                    raise
+            finally:
+                db.close()
+
+
+class ScoreJournal:
+    """
+    점수 write-behind 저널.
+
+    - `append`: 점수에 ID를 발급하고 현재 세그먼트 파일에 JSON lines로 추가(및 fsync)한 뒤 바로 반환합니다.
+    - flusher 스레드: `flush_seconds`마다 또는 대기 점수가 `batch_size`에 도달하면 새 세그먼트로 전환하고,
+      이전 세그먼트의 점수를 한 트랜잭션으로 저장(group commit)한 뒤 세그먼트 파일을 삭제합니다.
+      저장하는 동안에도 이전 세그먼트의 잠금을 유지하여 다른 worker가 같은 세그먼트를 replay하지 않도록 합니다.
+    - `replay`: 시작 시 다른 프로세스가 사용 중이지 않은 세그먼트(비정상 종료로 남은 파일)를 저장하고 삭제합니다.
+      ID가 미리 발급되어 있으므로 이미 저장된 점수는 건너뛰어 중복 저장되지 않습니다.
+
+    Attributes:
+        directory (str): 세그먼트 파일 디렉터리.
+        flush_seconds (float): 최대 저장 지연 (초).
+        batch_size (int): 즉시 저장을 시작하는 대기 점수 수, 및 INSERT 한 번에 저장할 행 수.
+        max_pending (int): 저장 대기 점수 상한 (초과 시 `JournalFullError`).
+        fsync (bool): 추가할 때마다 fsync할지 여부.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        flush_seconds: float,
+        batch_size: int,
+        max_pending: int,
+        fsync: bool,
+        id_block_size: int
+    ) -> None:
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.fsync = fsync
+        self.allocator = ScoreIdAllocator(id_block_size)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._pending: List[ScoreRecord] = []
+        self._inflight: List[ScoreRecord] = []
+        self._file = None
+        self._segment: Optional[str] = None
+        # 저장을 기다리는 이전 세그먼트 (경로, 잠금을 유지하는 열린 파일)
+        self._sealed: List[Tuple[str, IO[str]]] = []
+        self._sequence = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.stats = {"appended": 0, "flushed": 0, "batches": 0, "replayed": 0, "failures": 0, "rejected": 0}
+
+    def start(self) -> None:
+        """남은 세그먼트를 저장하고 새 세그먼트와 flusher 스레드를 시작합니다."""
+        os.makedirs(self.directory, exist_ok=True)
+        self.replay()
+        with self._lock:
+            self._open_segment()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="score-journal-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """flusher 스레드를 종료하고 대기 중인 점수를 모두 저장합니다."""
+        with self._lock:
+            self._stopping = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush score journal on shutdown; it will be replayed on restart")
+        with self._lock:
+            # 저장하지 못한 세그먼트는 잠금을 풀어 다음 시작 시(또는 다른 worker가) replay하도록 남깁니다.
+            for _, file in self._sealed:
+                file.close()
+            self._sealed = []
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                if not self._pending:
+                    os.remove(self._segment)
+
+    def append(self, user_id: str, scores: Sequence[Tuple[int, float]]) -> List[ScoreRecord]:
+        """
+        점수를 저널에 추가합니다. 반환 시점에 점수는 파일에 기록되어 있으며 DB에는 아직 저장되지 않았을 수 있습니다.
+
+        Args:
+            user_id (str): 사용자 ID.
+            scores (Sequence[Tuple[int, float]]): (음식 ID, 점수) 목록.
+
+        Returns:
+            List[ScoreRecord]: ID와 등록 시각이 채워진 점수 기록.
+
+        Raises:
+            JournalFullError: 저장 대기 점수가 `max_pending`을 넘은 경우.
+        """
+        with self._lock:
+            if len(self._pending) + len(self._inflight) + len(scores) > self.max_pending:
+                self.stats["rejected"] += len(scores)
+                raise JournalFullError(f"{len(self._pending) + len(self._inflight)} scores are waiting to be saved")
+
+        now = datetime.now()
+        records = [
+            {"id": score_id, "user_id": user_id, "food_id": food_id, "score": score, "created_at": now}
+            for score_id, (food_id, score) in zip(self.allocator.allocate(len(scores)), scores)
+        ]
+        data = "".join(json.dumps(record, default=datetime.isoformat) + "\n" for record in records)
+
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._pending.extend(records)
+            self.stats["appended"] += len(records)
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.notify()
+        return records
+
+    def pending_for_user(self, user_id: str) -> List[ScoreRecord]:
+        """아직 DB에 저장되지 않은 사용자의 점수를 반환합니다 (read-your-writes)."""
+        with self._lock:
+            return [record for record in self._inflight + self._pending if record["user_id"] == user_id]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._inflight)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    self._wakeup.wait(self.flush_seconds)
+                if self._stopping:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush score journal; retrying")
+                with self._lock:
+                    self._wakeup.wait(self.flush_seconds)
+
+    def flush(self) -> int:
+        """
+        대기 중인 점수를 한 트랜잭션으로 저장합니다.
+
+        Returns:
+            int: 새로 저장한 점수 수.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                records, self._pending = self._pending, []
+                self._inflight = records
+                self._sealed.append((self._segment, self._file))
+                self._open_segment()
+
+            try:
+                inserted = self._insert(records)
+            except Exception:
+                with self._lock:
+                    self._pending = records + self._pending
+                    self._inflight = []
+                    self.stats["failures"] += 1
+                raise
+
+            with self._lock:
+                self._inflight = []
+                sealed, self._sealed = self._sealed, []
+                self.stats["flushed"] += inserted
+                self.stats["batches"] += 1
+            # 삭제한 뒤에 파일을 닫아 잠금을 풀므로, 다른 worker가 저장 중인 세그먼트를 replay하지 않습니다.
+            for segment, file in sealed:
+                os.remove(segment)
+                file.close()
+            return inserted
+
+    def replay(self) -> int:
+        """
+        다른 프로세스가 사용 중이지 않은 세그먼트 파일의 점수를 저장하고 파일을 삭제합니다.
+
+        Returns:
+            int: 새로 저장한 점수 수.
+        """
+        replayed = 0
+        for segment in sorted(glob.glob(os.path.join(self.directory, SEGMENT_PATTERN))):
+            if segment == self._segment:
+                continue
+            try:
+                file = open(segment, "r+", encoding="utf-8")
+            except FileNotFoundError:
+                # 다른 worker가 저장을 마치고 삭제한 세그먼트
+                continue
+            with file:
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        continue
+                if os.fstat(file.fileno()).st_nlink == 0:
+                    # 잠금을 얻기 전에 소유한 worker가 저장을 마치고 삭제한 세그먼트
+                    continue
+                records = []
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 기록 도중 종료되어 잘린 마지막 줄 (응답하지 않은 점수)
+                        continue
+                    record["created_at"] = datetime.fromisoformat(record["created_at"])
+                    records.append(record)
+                inserted = self._insert(records)
+            os.remove(segment)
+            replayed += inserted
+            logger.warning("Replayed %d of %d journaled scores from %s", inserted, len(records), segment)
+        self.stats["replayed"] += replayed
+        return replayed
+
+    def _insert(self, records: List[ScoreRecord]) -> int:
+        from app.crud.scores import insert_journaled_scores
+
+        db = SessionLocal()
+        try:
+            inserted = sum(
+                insert_journaled_scores(db, records[start:start + self.batch_size])
+                for start in range(0, len(records), self.batch_size)
+            )
+            db.commit()
+            return inserted
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _open_segment(self) -> None:
+        self._sequence += 1
+        self._segment = os.path.join(self.directory, f"scores-{os.getpid()}-{self._sequence:08d}.jsonl")
+        self._file = open(self._segment, "a", encoding="utf-8")
+        if fcntl is not None:
+            # 실행 중인 다른 worker가 시작하면서 이 세그먼트를 replay하지 않도록 잠급니다.
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+_score_journal: Optional[ScoreJournal] = None
+
+
+def start_score_journal(
+    directory: str,
+    flush_seconds: float,
+    batch_size: int,
+    max_pending: int,
+    fsync: bool,
+    id_block_size: int
+) -> ScoreJournal:
+    """
+    점수 write-behind 저널을 시작합니다 (lifespan 시작 시 호출). 남은 세그먼트를 먼저 저장하므로 DB 연결이 필요합니다.
+
+    Args:
+        directory (str): 세그먼트 파일 디렉터리.
+        flush_seconds (float): 최대 저장 지연 (초).
+        batch_size (int): 즉시 저장을 시작하는 대기 점수 수.
+        max_pending (int): 저장 대기 점수 상한.
+        fsync (bool): 추가할 때마다 fsync할지 여부.
+        id_block_size (int): 한 번에 예약할 점수 ID 수.
+
+    Returns:
+        ScoreJournal: 시작된 저널.
+    """
+    global _score_journal
+    if _score_journal is None:
+        journal = ScoreJournal(directory, flush_seconds, batch_size, max_pending, fsync, id_block_size)
+        journal.start()
+        _score_journal = journal
+    return _score_journal
+
+
+def stop_score_journal() -> None:
+    """대기 중인 점수를 저장하고 저널을 종료합니다 (lifespan 종료 시 호출)."""
+    global _score_journal
+    if _score_journal is not None:
+        _score_journal.stop()
+        _score_journal = None
+
+
+def get_score_journal() -> Optional[ScoreJournal]:
+    """점수 write-behind 저널을 반환합니다. `SCORE_WRITE_BEHIND`가 꺼져 있으면 None."""
+    return _score_journal
+
+
+def _collect_score_journal() -> List[MetricFamily]:
+    journal = _score_journal
+    if journal is None:
+        return []
+    stats = dict(journal.stats)
+    return [
+        ("score_journal_pending", "gauge", "Journaled scores not yet saved to the database.",
+         [({}, journal.pending_count())]),
+        ("score_journal_appended_total", "counter", "Scores appended to the journal.", [({}, stats["appended"])]),
+        ("score_journal_flushed_total", "counter", "Journaled scores saved by group commits.", [({}, stats["flushed"])]),
+        ("score_journal_batches_total", "counter", "Group commits of journaled scores.", [({}, stats["batches"])]),
+        ("score_journal_failures_total", "counter", "Group commits that failed and were retried.",
+         [({}, stats["failures"])]),
+        ("score_journal_replayed_total", "counter", "Scores saved from leftover segments on startup.",
+         [({}, stats["replayed"])]),
+        ("score_journal_rejected_total", "counter", "Scores rejected because the journal was full.",
+         [({}, stats["rejected"])]),
+    ]
+
+
+registry.add_collector(_collect_score_journal)
@@ -0,0 +1,408 @@
+import logging
+import math
+import re
+import threading
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.cores.events import CommentCreated, event_bus
+from app.cores.metrics import MetricFamily, registry
+from app.database import SessionLocal
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger("app.search")
+
+_WORD = re.compile(r"\w+")
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def comment_words(text: str) -> List[str]:
+    """댓글을 공백/문장부호 기준으로 나눈 소문자 단어 목록을 반환합니다."""
+    return _WORD.findall(text.lower())
+
+
+def comment_tokens(text: str) -> Set[str]:
+    """
+    댓글을 색인할 토큰 집합으로 변환합니다.
+
+    공백/문장부호로 나눈 단어마다 글자 bigram과 각 글자(unigram)를 토큰으로 사용합니다.
+    형태소 분석 없이도 "짜다"가 "짜다고", "너무짜다" 등과, "양"이 "양이" 등과 일치합니다.
+
+    Args:
+        text (str): 댓글 내용.
+
+    Returns:
+        Set[str]: 토큰 집합.
+    """
+    tokens: Set[str] = set()
+    for word in comment_words(text):
+        tokens.update(word)
+        tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def query_tokens(query: str) -> List[str]:
+    """
+    검색어의 모든 단어에 대한 토큰 목록 (AND 조건)을 반환합니다.
+
+    두 글자 이상인 단어는 bigram, 한 글자 단어는 그 글자를 토큰으로 사용합니다.
+    """
+    tokens: Dict[str, None] = {}
+    for word in comment_words(query):
+        if len(word) == 1:
+            tokens[word] = None
+        else:
+            tokens.update(dict.fromkeys(word[i:i + 2] for i in range(len(word) - 1)))
+    return list(tokens)
+
+
+def contains_query(query: str, text: str) -> bool:
+    """
+    댓글이 검색어의 모든 단어를 실제로 포함하는지 확인합니다.
+
+    bigram 색인은 "너무짜"의 "너무"와 "무짜"가 서로 다른 위치에 있는 댓글도 후보로 찾으므로, 결과를 반환하기 전에 확인합니다.
+    """
+    words = comment_words(text)
+    return all(any(query_word in word for word in words) for query_word in comment_words(query))
+
+
+class _Column:
+    """
+    용량을 두 배씩 늘리는 numpy 배열.
+
+    확장 시 새 배열을 만들기 때문에 이전에 얻은 view는 그대로 유효합니다.
+    """
+    __slots__ = ("data", "size")
+
+    def __init__(self, dtype: str, capacity: int = 4) -> None:
+        import numpy as np
+
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: Sequence) -> None:
+        import numpy as np
+
+        end = self.size + len(values)
+        if end > len(self.data):
+            grown = np.empty(max(end, len(self.data) * 2), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end] = values
+        self.size = end
+
+    def view(self) -> "np.ndarray":
+        return self.data[:self.size]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+
+class CommentSearchIndex:
+    """
+    댓글 내용의 글자 bigram/unigram 역색인.
+
+    색인된 댓글마다 추가 순서대로 문서 번호를 부여하고, 토큰별로 문서 번호를 오름차순 uint32 배열(posting list)로 보관합니다.
+    메뉴 ID/작성 날짜/토큰 수는 문서 번호로 접근하는 열(column) 배열에 보관하여 필터와 순위 계산을 벡터 연산으로 처리합니다.
+
+    Attributes:
+        ready (bool): 기존 댓글 색인(최초 catch-up)이 끝났는지 여부.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._postings: Dict[str, _Column] = {}
+        self._ids = _Column("int64", 1024)
+        self._menus = _Column("int64", 1024)
+        self._days = _Column("int32", 1024)
+        self._lengths = _Column("uint16", 1024)
+        self._total_length = 0
+        # 색인된 댓글 ID (1bit/ID, 이벤트와 catch-up으로 같은 댓글이 두 번 색인되지 않도록 합니다)
+        self._indexed = bytearray()
+        self.ready = False
+
+    def __len__(self) -> int:
+        return self._ids.size
+
+    def _mark(self, comment_id: int) -> bool:
+        byte, bit = divmod(comment_id, 8)
+        if byte >= len(self._indexed):
+            self._indexed.extend(bytes(max(byte + 1 - len(self._indexed), len(self._indexed))))
+        if self._indexed[byte] & (1 << bit):
+            return False
+        self._indexed[byte] |= 1 << bit
+        return True
+
+    def add_many(self, comments: Iterable[Tuple[int, str, Optional[int], datetime]]) -> int:
+        """
+        댓글을 색인합니다. 이미 색인된 댓글은 건너뜁니다.
+
+        Args:
+            comments (Iterable[Tuple[int, str, Optional[int], datetime]]): (댓글 ID, 내용, 메뉴 ID, 작성 시각) 목록.
+
+        Returns:
+            int: 새로 색인한 댓글 수.
+        """
+        with self._lock:
+            position = self._ids.size
+            new_postings: Dict[str, List[int]] = {}
+            ids, menus, days, lengths = [], [], [], []
+            for comment_id, text, menu_id, created_at in comments:
+                if not self._mark(comment_id):
+                    continue
+                tokens = comment_tokens(text)
+                for token in tokens:
+                    postings = new_postings.get(token)
+                    if postings is None:
+                        new_postings[token] = [position]
+                    else:
+                        postings.append(position)
+                ids.append(comment_id)
+                menus.append(menu_id or 0)
+                days.append(created_at.toordinal())
+                lengths.append(min(len(tokens), 65535))
+                position += 1
+
+            for token, positions in new_postings.items():
+                column = self._postings.get(token)
+                if column is None:
+                    column = self._postings[token] = _Column("uint32", max(4, len(positions)))
+                column.extend(positions)
+            self._ids.extend(ids)
+            self._menus.extend(menus)
+            self._days.extend(days)
+            self._lengths.extend(lengths)
+            self._total_length += sum(lengths)
+            return len(ids)
+
+    def search(
+        self,
+        query: str,
+        menu_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """
+        검색어의 모든 단어를 포함하는 댓글을 BM25 점수순(같으면 최신순)으로 조회합니다.
+
+        Args:
+            query (str): 검색어. 공백으로 나눈 모든 단어를 포함해야 합니다 (AND).
+            menu_id (Optional[int]): 메뉴 ID 필터.
+            date_from (Optional[date]): 작성 날짜 시작 (포함).
+            date_to (Optional[date]): 작성 날짜 끝 (포함).
+            limit (int): 반환할 최대 개수.
+            offset (int): 건너뛸 개수.
+
+        Returns:
+            Tuple[int, List[Tuple[int, float]]]: (일치한 전체 댓글 수, (댓글 ID, 점수) 목록).
+        """
+        import numpy as np
+
+        tokens = query_tokens(query)
+        if not tokens:
+            return 0, []
+
+        with self._lock:
+            lists = []
+            for token in tokens:
+                column = self._postings.get(token)
+                if column is None:
+                    return 0, []
+                lists.append(column.view())
+            ids, menus, days, lengths = (
+                self._ids.view(), self._menus.view(), self._days.view(), self._lengths.view()
+            )
+            document_count, total_length = len(ids), self._total_length
+
+        # 가장 짧은 posting list를 기준으로 나머지에서 이분 탐색하여 교집합을 구합니다.
+        lists.sort(key=len)
+        candidates = lists[0]
+        for postings in lists[1:]:
+            found = np.searchsorted(postings, candidates)
+            found[found == len(postings)] = 0
+            candidates = candidates[postings[found] == candidates]
+            if not len(candidates):
+                return 0, []
+
+        if menu_id is not None:
+            candidates = candidates[menus[candidates] == menu_id]
+        if date_from is not None or date_to is not None:
+            candidate_days = days[candidates]
+            mask = np.ones(len(candidates), dtype=bool)
+            if date_from is not None:
+                mask &= candidate_days >= date_from.toordinal()
+            if date_to is not None:
+                mask &= candidate_days <= date_to.toordinal()
+            candidates = candidates[mask]
+
+        total = len(candidates)
+        if total == 0 or offset >= total:
+            return total, []
+
+        # 모든 후보가 검색 토큰을 포함하므로(tf=1) IDF 합은 같고, 짧은 댓글일수록 점수가 높습니다.
+        idf = sum(math.log(1 + (document_count - len(p) + 0.5) / (len(p) + 0.5)) for p in lists)
+        relative_length = lengths[candidates] / (total_length / document_count or 1)
+        scores = idf * (BM25_K1 + 1) / (1 + BM25_K1 * (1 - BM25_B + BM25_B * relative_length))
+
+        # 상위 `wanted`번째 점수 이상인 후보(같은 점수 포함)만 골라 (점수, 문서 번호) 내림차순으로 정렬합니다.
+        wanted = min(offset + limit, total)
+        if wanted < total:
+            threshold = np.partition(scores, total - wanted)[total - wanted]
+            top = np.flatnonzero(scores >= threshold)
+        else:
+            top = np.arange(total)
+        top = top[np.lexsort((-candidates[top].astype(np.int64), -scores[top]))][offset:wanted]
+        return total, list(zip(ids[candidates[top]].tolist(), scores[top].tolist()))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            postings = sum(column.size for column in self._postings.values())
+            nbytes = sum(column.nbytes for column in self._postings.values())
+            nbytes += self._ids.nbytes + self._menus.nbytes + self._days.nbytes + self._lengths.nbytes
+            return {
+                "documents": self._ids.size,
+                "terms": len(self._postings),
+                "postings": postings,
+                "bytes": nbytes + len(self._indexed),
+            }
+
+
+class CommentSearch:
+    """
+    댓글 검색 색인과 이를 DB와 맞추는 catch-up 스레드.
+
+    - 이 worker에서 등록된 댓글은 `CommentCreated` 이벤트로 커밋 직후 색인합니다.
+    - 다른 worker에서 등록된 댓글과 기존 댓글은 `refresh_seconds`마다 ID 순으로 읽어 색인합니다.
+      늦게 커밋된 트랜잭션의 댓글을 놓치지 않도록 직전 catch-up 범위를 한 번 더 읽습니다.
+
+    Attributes:
+        index (CommentSearchIndex): 역색인.
+    """
+
+    def __init__(self, refresh_seconds: float, batch_size: int) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.batch_size = batch_size
+        self.index = CommentSearchIndex()
+        self._scan_from = 0
+        self._last_id = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        event_bus.subscribe(CommentCreated, self._index_events, batch=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="comment-search-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        event_bus.unsubscribe(CommentCreated, self._index_events)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _index_events(self, events: List[CommentCreated]) -> None:
+        self.index.add_many(
+            (event.comment_id, event.comment, event.menu_id, event.created_at) for event in events
+        )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh comment search index")
+            self._stop.wait(self.refresh_seconds)
+
+    def refresh(self) -> int:
+        """
+        마지막 catch-up 이후 저장된 댓글을 색인합니다.
+
+        Returns:
+            int: 새로 색인한 댓글 수.
+        """
+        from app.crud.comments import get_comments_after
+
+        added, last_id = 0, self._scan_from
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                rows = get_comments_after(db, last_id, self.batch_size)
+            finally:
+                db.close()
+            if not rows:
+                break
+            added += self.index.add_many(rows)
+            last_id = rows[-1][0]
+            if len(rows) < self.batch_size:
+                break
+
+        if not self.index.ready:
+            # 색인 중에 커밋된 댓글을 놓치지 않도록 마지막 batch 범위를 다음 catch-up에서 한 번 더 읽습니다.
+            self._scan_from = max(0, last_id - self.batch_size)
+            self.index.ready = True
+            logger.info("Comment search index built: %s", self.index.stats())
+        else:
+            # 이번 catch-up에서 새로 읽은 범위는 다음 catch-up에서 한 번 더 읽습니다.
+            self._scan_from = self._last_id
+        self._last_id = max(self._last_id, last_id)
+        return added
+
+
+_comment_search: Optional[CommentSearch] = None
+
+
+def start_comment_search(refresh_seconds: float, batch_size: int) -> CommentSearch:
+    """
+    댓글 검색 색인을 시작합니다 (lifespan 시작 시 호출). 기존 댓글은 백그라운드에서 색인합니다.
+
+    Args:
+        refresh_seconds (float): 다른 worker의 댓글을 색인하는 catch-up 간격 (초).
+        batch_size (int): catch-up 시 한 번에 읽는 댓글 수.
+
+    Returns:
+        CommentSearch: 시작된 검색 색인.
+    """
+    global _comment_search
+    if _comment_search is None:
+        search = CommentSearch(refresh_seconds, batch_size)
+        search.start()
+        _comment_search = search
+    return _comment_search
+
+
+def stop_comment_search() -> None:
+    """catch-up 스레드를 종료하고 색인을 해제합니다 (lifespan 종료 시 호출)."""
+    global _comment_search
+    if _comment_search is not None:
+        _comment_search.stop()
+        _comment_search = None
+
+
+def get_comment_search() -> Optional[CommentSearch]:
+    """댓글 검색 색인을 반환합니다. `SEARCH_ENABLED`가 꺼져 있으면 None."""
+    return _comment_search
+
+
+def _collect_comment_search() -> List[MetricFamily]:
+    search = _comment_search
+    if search is None:
+        return []
+    stats = search.index.stats()
+    return [
+        ("comment_search_documents", "gauge", "Comments in the search index.", [({}, stats["documents"])]),
+        ("comment_search_terms", "gauge", "Distinct bigram/unigram terms in the search index.", [({}, stats["terms"])]),
+        ("comment_search_postings", "gauge", "Postings in the search index.", [({}, stats["postings"])]),
+        ("comment_search_bytes", "gauge", "Memory allocated for the search index.", [({}, stats["bytes"])]),
+    ]
+
+
+registry.add_collector(_collect_comment_search)
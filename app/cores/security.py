@@ -1,6 +1,10 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Callable, Optional, TypeVar
 
 import bcrypt
+from fastapi import HTTPException, status
 from jose import jwt
 
 from app.config import get_settings
@@ -11,6 +15,12 @@ settings = get_settings()
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+T = TypeVar("T")
+
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_semaphore: Optional[asyncio.Semaphore] = None
 
 
 def get_password_hash(password: str) -> str:
@@ -21,9 +31,9 @@ def get_password_hash(password: str) -> str:
         password (str): 사용자의 원본 비밀번호.
 
     Returns:
-        str: 해싱된 비밀번호.
+        str: `BCRYPT_ROUNDS` cost로 해싱된 비밀번호.
     """
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -38,6 +48,90 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    저장된 해시의 bcrypt cost가 현재 설정(`BCRYPT_ROUNDS`)과 다른지 확인.
+
+    Args:
+        hashed_password (str): 데이터베이스에 저장된 해싱된 비밀번호 (`$2b$<rounds>$...`).
+
+    Returns:
+        bool: 재해싱이 필요하면 `True`.
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    `get_password_hash`를 이벤트 루프를 막지 않도록 worker 스레드에서 실행.
+
+    Args:
+        password (str): 사용자의 원본 비밀번호.
+
+    Returns:
+        str: 해싱된 비밀번호.
+
+    Raises:
+        HTTPException: 대기 중인 해싱 요청이 많아 제한 시간 내에 처리할 수 없는 경우 503.
+    """
+    return await _run_password_task(get_password_hash, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    `verify_password`를 이벤트 루프를 막지 않도록 worker 스레드에서 실행.
+
+    Args:
+        plain_password (str): 사용자가 입력한 원본 비밀번호.
+        hashed_password (str): 데이터베이스에 저장된 해싱된 비밀번호.
+
+    Returns:
+        bool: 비밀번호가 일치하면 `True`, 그렇지 않으면 `False`.
+
+    Raises:
+        HTTPException: 대기 중인 검증 요청이 많아 제한 시간 내에 처리할 수 없는 경우 503.
+    """
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+def shutdown_password_executor() -> None:
+    """비밀번호 해싱 worker 스레드 풀을 종료합니다."""
+    global _password_executor, _password_semaphore
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+    _password_executor = None
+    _password_semaphore = None
+
+async def _run_password_task(func: Callable[..., T], *args) -> T:
+    """
+    bcrypt 작업을 전용 스레드 풀에서 실행합니다.
+
+    동시에 처리(대기 포함)되는 작업 수를 `PASSWORD_HASH_MAX_PENDING`으로 제한하여
+    로그인이 몰려도 다른 요청의 스레드 풀과 이벤트 루프가 고갈되지 않도록 합니다.
+    """
+    global _password_executor, _password_semaphore
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="password-hash"
+        )
+        _password_semaphore = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+    semaphore = _password_semaphore
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests. Please retry later.",
+            headers={"Retry-After": "1"}
+        )
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+    finally:
+        semaphore.release()
+
 def create_access_token(data: TokenCreateRequest) -> str:
     """
     사용자 정보를 기반으로 JWT 액세스 토큰을 생성.
@@ -47,10 +141,16 @@ def create_access_token(data: TokenCreateRequest) -> str:
 
     Returns:
         str: 생성된 JWT 액세스 토큰.
+
+    Note:
+        `JWT_EMBED_CLAIMS`가 활성화되어 있으면 `uid`, `email`도 토큰에 포함하여
+        인증 시 DB 조회 없이 사용자 정보를 구성할 수 있도록 합니다.
     """
     to_encode = {
         "sub": data.sub,
         "role": data.role,
         "exp": datetime.now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     }
+    if settings.JWT_EMBED_CLAIMS and data.uid is not None:
+        to_encode.update({"uid": data.uid, "email": data.email})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -0,0 +1,258 @@
+import itertools
+import logging
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from app.cores.queries import normalize_sql
+from app.cores.statements import add_statement_observer, get_instrumented_engine, remove_statement_observer
+
+sql_logger = logging.getLogger("app.sql")
+
+# 방언별 실행 계획 조회 구문
+EXPLAIN_PREFIX: Dict[str, str] = {
+    "mysql": "EXPLAIN ",
+    "mariadb": "EXPLAIN ",
+    "postgresql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+# SQLite 등에서 문자열로 전달되는 날짜/일시 파라미터 (가리지 않음)
+_DATETIME_STRING = re.compile(r"^\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?)?$")
+
+# 이 모듈에서 실행하는 EXPLAIN 문은 다시 기록하지 않습니다.
+_explaining: ContextVar[bool] = ContextVar("explaining", default=False)
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    바인드 파라미터에서 문자열/바이너리 값을 가리고 숫자, 날짜, NULL 등만 남깁니다.
+
+    사용자 ID, 댓글 내용, 비밀번호 해시 등이 로그에 남지 않도록 하면서
+    ID/날짜 조건은 그대로 남겨 재현할 수 있도록 합니다.
+
+    Args:
+        parameters (Any): DBAPI에 전달된 파라미터 (tuple, list, dict).
+
+    Returns:
+        Any: 가려진 파라미터.
+    """
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    if isinstance(parameters, str):
+        return parameters if _DATETIME_STRING.match(parameters) else f"<str:{len(parameters)}>"
+    if isinstance(parameters, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(parameters)}>"
+    if isinstance(parameters, (datetime, date)):
+        return parameters.isoformat()
+    if parameters is None or isinstance(parameters, (bool, int, float)):
+        return parameters
+    return f"<{type(parameters).__name__}>"
+
+
+def find_caller(skip_modules: Set[str]) -> Optional[str]:
+    """
+    호출 스택에서 SQL 문을 실행한 애플리케이션 함수(`app.crud.statistics.get_food_mean` 등)를 찾습니다.
+
+    Args:
+        skip_modules (Set[str]): 건너뛸 모듈 이름 (계측 모듈 자신).
+
+    Returns:
+        Optional[str]: `모듈.함수` 이름. 애플리케이션 코드에서 실행되지 않았으면 None.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("app.") and module not in skip_modules:
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+@dataclass
+class SlowQueryRecord:
+    """
+    실행 시간이 기준을 넘은 SQL 문 하나의 기록.
+
+    Attributes:
+        id (int): 기록 ID (worker 프로세스 내에서 증가).
+        engine (str): 엔진 이름 (`primary`, `replica`).
+        statement (str): 정규화된 SQL 문.
+        parameters (Any): 가려진 바인드 파라미터. executemany의 경우 첫 번째 행과 행 수만 기록합니다.
+        duration_ms (float): 실행 시간 (ms).
+        caller (Optional[str]): SQL 문을 실행한 함수.
+        occurred_at (datetime): 실행 완료 시각.
+        explain (Optional[List[Dict[str, Any]]]): 실행 계획. 비동기로 채워지며 아직 조회 전이면 None.
+        explain_error (Optional[str]): 실행 계획 조회 실패/생략 사유.
+    """
+    id: int
+    engine: str
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: Optional[str]
+    occurred_at: datetime
+    explain: Optional[List[Dict[str, Any]]] = None
+    explain_error: Optional[str] = None
+
+
+class SlowQueryLog:
+    """
+    실행 시간이 `threshold_ms`를 넘은 SQL 문을 최근 `maxsize`개까지 보관하는 statement observer.
+
+    실행 계획은 요청 처리를 지연시키지 않도록 별도 스레드에서 원래 파라미터로 `EXPLAIN`을 실행하여 채웁니다.
+    같은 형태의 SQL 문에 대한 `EXPLAIN`이 대기 중이면 중복 실행하지 않습니다.
+
+    Attributes:
+        threshold_ms (float): 기록 기준 실행 시간 (ms).
+        maxsize (int): 최대 보관 개수 (초과 시 오래된 기록부터 제거).
+        explain (bool): `EXPLAIN` 실행 여부.
+        MAX_PENDING_EXPLAINS (int): 동시에 대기할 수 있는 `EXPLAIN` 수.
+    """
+    MAX_PENDING_EXPLAINS = 32
+    SKIP_MODULES = {__name__, "app.cores.statements"}
+
+    def __init__(self, threshold_ms: float, maxsize: int, explain: bool = True) -> None:
+        self.threshold_ms = threshold_ms
+        self.maxsize = maxsize
+        self.explain = explain
+        self._records: Deque[SlowQueryRecord] = deque(maxlen=maxsize)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        """관찰자를 등록하고 `EXPLAIN` 실행 스레드를 준비합니다."""
+        if self.explain and self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        add_statement_observer(self.observe)
+
+    def stop(self) -> None:
+        """관찰자를 제거하고 대기 중인 `EXPLAIN`을 취소합니다."""
+        remove_statement_observer(self.observe)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def observe(self, engine: str, statement: str, parameters: Any, duration: float, executemany: bool) -> None:
+        duration_ms = duration * 1000
+        if duration_ms < self.threshold_ms or _explaining.get():
+            return
+
+        normalized = normalize_sql(statement)
+        if executemany:
+            rows = list(parameters)
+            redacted = {"rows": len(rows), "first": redact_parameters(rows[0]) if rows else None}
+        else:
+            redacted = redact_parameters(parameters)
+        caller = find_caller(self.SKIP_MODULES)
+
+        with self._lock:
+            record = SlowQueryRecord(
+                id=next(self._ids),
+                engine=engine,
+                statement=normalized,
+                parameters=redacted,
+                duration_ms=round(duration_ms, 3),
+                caller=caller,
+                occurred_at=datetime.now()
+            )
+            self._records.append(record)
+            executor = self._executor
+            schedule = (
+                executor is not None
+                and not executemany
+                and normalized not in self._pending
+                and len(self._pending) < self.MAX_PENDING_EXPLAINS
+            )
+            if schedule:
+                self._pending.add(normalized)
+
+        sql_logger.warning("Slow query (%.1f ms) from %s: %s", duration_ms, caller or "unknown", normalized)
+
+        if schedule:
+            try:
+                executor.submit(self._run_explain, record, engine, statement, parameters)
+            except RuntimeError:
+                # stop()과 경합하여 executor가 종료된 경우
+                with self._lock:
+                    self._pending.discard(normalized)
+        elif self.explain:
+            record.explain_error = "skipped"
+
+    def _run_explain(self, record: SlowQueryRecord, engine_name: str, statement: str, parameters: Any) -> None:
+        token = _explaining.set(True)
+        try:
+            engine = get_instrumented_engine(engine_name)
+            prefix = EXPLAIN_PREFIX.get(engine.dialect.name) if engine is not None else None
+            if prefix is None or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                record.explain_error = "unsupported statement"
+                return
+            if isinstance(parameters, list):
+                # exec_driver_sql은 list를 executemany 파라미터로 해석합니다.
+                parameters = tuple(parameters)
+            with engine.connect() as connection:
+                result = connection.exec_driver_sql(prefix + statement, parameters)
+                record.explain = [
+                    {key: value if isinstance(value, (int, float, type(None))) else str(value)
+                     for key, value in row.items()}
+                    for row in result.mappings()
+                ]
+        except Exception as e:
+            record.explain_error = f"{type(e).__name__}: {e}"
+        finally:
+            _explaining.reset(token)
+            with self._lock:
+                self._pending.discard(record.statement)
+
+    def list(self, limit: Optional[int] = None) -> List[SlowQueryRecord]:
+        """최근 기록부터 반환합니다."""
+        with self._lock:
+            records = list(reversed(self._records))
+        return records[:limit] if limit is not None else records
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_slow_query_log: Optional[SlowQueryLog] = None
+
+
+def start_slow_query_log(threshold_ms: float, maxsize: int, explain: bool = True) -> SlowQueryLog:
+    """
+    프로세스 전역 slow query log를 생성하고 관찰자를 등록합니다 (lifespan 시작 시 호출).
+
+    Args:
+        threshold_ms (float): 기록 기준 실행 시간 (ms).
+        maxsize (int): 최대 보관 개수.
+        explain (bool): `EXPLAIN` 실행 여부.
+
+    Returns:
+        SlowQueryLog: 시작된 slow query log.
+    """
+    global _slow_query_log
+    if _slow_query_log is None:
+        _slow_query_log = SlowQueryLog(threshold_ms, maxsize, explain)
+    _slow_query_log.start()
+    return _slow_query_log
+
+
+def stop_slow_query_log() -> None:
+    """관찰자를 제거하고 `EXPLAIN` 실행 스레드를 종료합니다 (lifespan 종료 시 호출). 기록은 유지됩니다."""
+    if _slow_query_log is not None:
+        _slow_query_log.stop()
+
+
+def get_slow_query_log() -> Optional[SlowQueryLog]:
+    """slow query log를 반환합니다. `SLOW_QUERY_THRESHOLD_MS`가 0이면 None."""
+    return _slow_query_log
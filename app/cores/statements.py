@@ -0,0 +1,69 @@
+import time
+import weakref
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# (engine 이름, SQL 문, 파라미터, 실행 시간(초), executemany 여부)를 전달받는 관찰자
+StatementObserver = Callable[[str, str, Any, float, bool], None]
+
+_observers: List[StatementObserver] = []
+_instrumented: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+_engines_by_name: "weakref.WeakValueDictionary[str, Engine]" = weakref.WeakValueDictionary()
+
+
+def add_statement_observer(observer: StatementObserver) -> None:
+    """
+    SQL 문 실행이 끝날 때마다 호출될 관찰자를 등록합니다.
+
+    관찰자는 요청 처리 스레드에서 동기적으로 호출되므로 가볍게 유지해야 합니다.
+
+    Args:
+        observer (StatementObserver): 등록할 관찰자.
+    """
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_statement_observer(observer: StatementObserver) -> None:
+    """등록된 관찰자를 제거합니다."""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    엔진의 cursor 실행 이벤트에 실행 시간 측정 리스너를 등록합니다.
+
+    같은 엔진에 여러 번 호출해도 한 번만 등록됩니다.
+
+    Args:
+        engine (Engine): 계측할 엔진.
+        name (str): 관찰자에게 전달할 엔진 이름 (`primary`, `replica` 등).
+    """
+    _engines_by_name[name] = engine
+    if engine in _instrumented:
+        return
+    _instrumented.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["statement_started"].pop()
+        for observer in _observers:
+            observer(name, statement, parameters, duration, executemany)
+
+    @event.listens_for(engine, "handle_error")
+    def _discard(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("statement_started"):
+            connection.info["statement_started"].pop()
+
+
+def get_instrumented_engine(name: str) -> Optional[Engine]:
+    """`instrument_engine`에 전달된 이름으로 엔진을 조회합니다. 없으면 None."""
+    return _engines_by_name.get(name)
@@ -0,0 +1,336 @@
+import functools
+import inspect
+import json
+import os
+import pkgutil
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence
+
+from app.cores.queries import normalize_sql
+from app.cores.statements import add_statement_observer, remove_statement_observer
+
+
+@dataclass
+class Span:
+    """
+    추적 구간(span) 하나.
+
+    Attributes:
+        trace_id (str): 요청 단위 추적 ID (32자리 hex).
+        span_id (str): 구간 ID (16자리 hex).
+        parent_id (Optional[str]): 상위 구간 ID. 요청 구간이면 None.
+        name (str): 구간 이름 (`GET /api/v1/statistics/menus/{menu_id}`, `app.crud.statistics.get_food_statistics` 등).
+        kind (str): 구간 종류 (`server`, `handler`, `crud`, `sql`, `numpy`, `serialize`).
+        start_time (float): 시작 시각 (Unix time, 초).
+        duration_ms (float): 소요 시간 (ms).
+        attributes (Dict[str, Any]): 부가 정보 (SQL 문, 상태 코드 등).
+        error (Optional[str]): 구간에서 발생한 예외.
+    """
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    kind: str
+    start_time: float
+    duration_ms: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SpanExporter(ABC):
+    """
+    완료된 요청의 span 목록을 내보내는 exporter 기본 클래스.
+
+    요청 구간이 끝날 때 해당 요청의 모든 span을 한 번에 `export`로 전달받습니다.
+    """
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """요청 하나의 span 목록을 내보냅니다."""
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonLinesExporter(SpanExporter):
+    """
+    span을 한 줄에 하나씩 JSON으로 파일에 추가하는 exporter.
+
+    Attributes:
+        path (str): 출력 파일 경로.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n" for span in spans)
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(lines)
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class InMemoryExporter(SpanExporter):
+    """
+    span을 메모리에 보관하는 exporter (테스트용).
+    """
+
+    def __init__(self) -> None:
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """
+        보관 중인 span을 반환합니다.
+
+        Args:
+            trace_id (Optional[str]): 지정하면 해당 요청의 span만 반환합니다.
+
+        Returns:
+            List[Span]: 종료 순서대로 정렬된 span 목록.
+        """
+        with self._lock:
+            return [span for span in self._spans if trace_id is None or span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class _Trace:
+    """하나의 요청에서 완료된 span을 모으는 버퍼."""
+
+    __slots__ = ("spans",)
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+
+
+_current: ContextVar[Optional[tuple]] = ContextVar("current_span", default=None)
+_exporter: Optional[SpanExporter] = None
+_null_context = nullcontext()
+
+
+def _new_id(length: int) -> str:
+    return os.urandom(length // 2).hex()
+
+
+def configure_tracing(exporter: Optional[SpanExporter]) -> Optional[SpanExporter]:
+    """
+    exporter를 지정합니다. None이면 추적을 끕니다.
+
+    Args:
+        exporter (Optional[SpanExporter]): 사용할 exporter.
+
+    Returns:
+        Optional[SpanExporter]: 이전 exporter.
+    """
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if exporter is not None:
+        add_statement_observer(_record_statement)
+    else:
+        remove_statement_observer(_record_statement)
+    return previous
+
+
+def shutdown_tracing() -> None:
+    """exporter를 정리합니다 (lifespan 종료 시 호출)."""
+    if _exporter is not None:
+        _exporter.shutdown()
+
+
+def current_trace_id() -> Optional[str]:
+    """현재 요청의 추적 ID를 반환합니다. 추적 중이 아니면 None."""
+    current = _current.get()
+    return current[0].trace_id if current is not None else None
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    요청 단위 추적을 시작합니다. 블록이 끝나면 요청의 모든 span을 exporter로 내보냅니다.
+
+    Args:
+        name (str): 요청 구간 이름.
+        **attributes: 부가 정보.
+
+    Yields:
+        Span: 요청 구간. 블록 안에서 `name`, `attributes`를 갱신할 수 있습니다.
+    """
+    span = Span(_new_id(32), _new_id(16), None, name, "server", time.time(), attributes=attributes)
+    trace = _Trace()
+    token = _current.set((span, trace))
+    start = time.perf_counter()
+    try:
+        yield span
+    except BaseException as e:
+        span.error = repr(e)
+        raise
+    finally:
+        span.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        _current.reset(token)
+        trace.spans.append(span)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(trace.spans)
+
+
+@contextmanager
+def _span(name: str, kind: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+    parent, trace = _current.get()
+    span = Span(parent.trace_id, _new_id(16), parent.span_id, name, kind, time.time(), attributes=attributes)
+    token = _current.set((span, trace))
+    start = time.perf_counter()
+    try:
+        yield span
+    except BaseException as e:
+        span.error = repr(e)
+        raise
+    finally:
+        span.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        _current.reset(token)
+        trace.spans.append(span)
+
+
+def trace_span(name: str, kind: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+    """
+    현재 요청 구간 아래에 하위 구간을 엽니다.
+
+    추적 중이 아니면(비활성, 샘플링 제외, 요청 밖) 아무 일도 하지 않는 context manager를 반환하므로
+    hot path에 두어도 비용이 거의 없습니다.
+
+    Args:
+        name (str): 구간 이름.
+        kind (str): 구간 종류.
+        **attributes: 부가 정보.
+
+    Returns:
+        ContextManager[Optional[Span]]: 구간 context manager (추적 중이 아니면 None을 yield).
+    """
+    if _current.get() is None:
+        return _null_context
+    return _span(name, kind, attributes)
+
+
+def record_span(name: str, kind: str, start_time: float, duration: float, **attributes: Any) -> None:
+    """
+    이미 끝난 구간을 현재 구간의 하위 구간으로 기록합니다 (SQL 실행, 직렬화 등).
+
+    Args:
+        name (str): 구간 이름.
+        kind (str): 구간 종류.
+        start_time (float): 시작 시각 (Unix time, 초).
+        duration (float): 소요 시간 (초).
+        **attributes: 부가 정보.
+    """
+    current = _current.get()
+    if current is None:
+        return
+    parent, trace = current
+    trace.spans.append(Span(
+        parent.trace_id, _new_id(16), parent.span_id, name, kind, start_time,
+        duration_ms=round(duration * 1000, 3), attributes=attributes
+    ))
+
+
+def _record_statement(engine: str, statement: str, parameters: Any, duration: float, executemany: bool) -> None:
+    if _current.get() is None:
+        return
+    normalized = normalize_sql(statement)
+    record_span(
+        normalized.split(" ", 1)[0].upper(), "sql", time.time() - duration, duration,
+        engine=engine, statement=normalized, executemany=executemany
+    )
+
+
+def traced(func: Callable, name: str, kind: str) -> Callable:
+    """
+    함수 호출을 구간으로 감싼 함수를 반환합니다. 동기/비동기 함수를 모두 지원합니다.
+
+    Args:
+        func (Callable): 감쌀 함수.
+        name (str): 구간 이름.
+        kind (str): 구간 종류.
+
+    Returns:
+        Callable: 감싼 함수 (`__wrapped__`로 원래 함수에 접근할 수 있습니다).
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with trace_span(name, kind):
+                return await func(*args, **kwargs)
+        wrapper = async_wrapper
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, kind):
+                return func(*args, **kwargs)
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def instrument_crud() -> int:
+    """
+    `app.crud` 패키지의 모든 공개 함수를 `crud` 구간으로 감쌉니다.
+
+    crud 모듈의 속성을 교체하고, `from app.crud.users import get_user`처럼 함수를 직접 import한
+    다른 `app` 모듈의 참조도 함께 교체합니다. 이미 감싼 함수는 다시 감싸지 않습니다.
+
+    Returns:
+        int: 새로 감싼 함수 수.
+    """
+    import importlib
+
+    from app import crud
+
+    replacements: Dict[int, Callable] = {}
+    for module_info in pkgutil.iter_modules(crud.__path__):
+        module = importlib.import_module(f"{crud.__name__}.{module_info.name}")
+        for attribute, value in list(vars(module).items()):
+            if (
+                attribute.startswith("_")
+                or not inspect.isfunction(value)
+                or value.__module__ != module.__name__
+                or getattr(value, "__traced__", False)
+            ):
+                continue
+            wrapper = traced(value, f"{module.__name__}.{attribute}", "crud")
+            setattr(module, attribute, wrapper)
+            replacements[id(value)] = wrapper
+
+    if replacements:
+        for module_name, module in list(sys.modules.items()):
+            if module is None or not module_name.startswith("app.") or module_name.startswith("app.crud."):
+                continue
+            for attribute, value in list(vars(module).items()):
+                if id(value) in replacements and inspect.isfunction(value):
+                    setattr(module, attribute, replacements[id(value)])
+    return len(replacements)
@@ -1,11 +1,31 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from fastapi import HTTPException, status
 
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import and_
+from sqlalchemy.orm import Session, noload
+from sqlalchemy.sql import and_, func
 
+from app.config import get_settings
+from app.cores.cache import TTLCache
+from app.cores.events import CommentCreated, emit, event_bus
 from app.models.menus import Menu
 from app.models.comments import Comment
-from app.schemas.comments import CommentCreateRequest, CommentCountResponse, CommentResponse
+from app.schemas.comments import CommentCreateRequest, CommentCountResponse, CommentPageResponse, CommentResponse
+
+settings = get_settings()
+
+# (menu_id, size) -> 메뉴별 댓글 목록 첫 페이지
+first_page_cache = TTLCache(
+    maxsize=4096, ttl=settings.COMMENT_FIRST_PAGE_CACHE_SECONDS, name="comment_first_page"
+)
+
+
+@event_bus.subscriber(CommentCreated, batch=True)
+def _invalidate_first_pages(events: List[CommentCreated]) -> None:
+    """댓글이 등록된 메뉴의 첫 페이지 캐시를 제거합니다."""
+    menu_ids = {event.menu_id for event in events}
+    first_page_cache.invalidate(lambda key: key[0] in menu_ids)
 
 
 def create_comment(db: Session, user_id: str, comment: CommentCreateRequest) -> CommentResponse:
@@ -38,6 +58,13 @@ def create_comment(db: Session, user_id: str, comment: CommentCreateRequest) ->
 
     db.add(new_comment)
     db.flush()
+    emit(db, CommentCreated(
+        comment_id=new_comment.id,
+        user_id=new_comment.user_id,
+        menu_id=new_comment.menu_id,
+        comment=new_comment.comment,
+        created_at=new_comment.created_at
+    ))
 
     return CommentResponse.model_validate(new_comment)
 
@@ -74,6 +101,52 @@ def get_comment_by_menu(db: Session, user_id: str, menu_id: int) -> CommentRespo
     return CommentResponse.model_validate(comment)
 
 
+def get_comments_by_menu(db: Session, menu_id: int, size: int, cursor: Optional[int] = None) -> CommentPageResponse:
+    """
+    메뉴의 댓글을 최신순으로 한 페이지 조회합니다.
+
+    `(menu_id, id)` 인덱스를 따라 `cursor`보다 작은 ID부터 읽으므로(keyset pagination),
+    페이지 위치와 관계없이 `size + 1`개의 인덱스 항목만 읽습니다.
+    첫 페이지(`cursor` 없음)는 `COMMENT_FIRST_PAGE_CACHE_SECONDS` 동안 캐싱됩니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        menu_id (int): 댓글을 조회할 메뉴 ID.
+        size (int): 페이지 크기.
+        cursor (Optional[int]): 이전 페이지 응답의 `next_cursor`. 없으면 첫 페이지를 조회합니다.
+
+    Returns:
+        CommentPageResponse: 댓글 목록과 다음 페이지 cursor.
+
+    Raises:
+        HTTPException: 메뉴가 존재하지 않을 경우 400 에러.
+    """
+    if cursor is None:
+        cached = first_page_cache.get((menu_id, size))
+        if cached is not None:
+            return cached
+
+    query = db.query(Comment).options(noload(Comment.menu)).filter(Comment.menu_id == menu_id)
+    if cursor is not None:
+        query = query.filter(Comment.id < cursor)
+    rows = query.order_by(Comment.id.desc()).limit(size + 1).all()
+
+    # 댓글이 있으면 메뉴가 존재하므로, 빈 페이지일 때만 메뉴를 확인합니다.
+    if not rows and not db.query(Menu.id).filter(Menu.id == menu_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid menu_id. Menu does not exist."
+        )
+
+    page = CommentPageResponse(
+        items=[CommentResponse.model_validate(row) for row in rows[:size]],
+        next_cursor=rows[size - 1].id if len(rows) > size else None
+    )
+    if cursor is None:
+        first_page_cache.set((menu_id, size), page)
+    return page
+
+
 def get_comment_count(db: Session, menu1_id: int, menu2_id: int) -> CommentCountResponse:
     """
     두 개의 메뉴에 대한 댓글 수를 계산합니다.
@@ -107,3 +180,50 @@ def get_comment_count(db: Session, menu1_id: int, menu2_id: int) -> CommentCount
         "menu2_id": menu2_id,
         "menu2_count": menu2_count,
     })
+
+
+def get_comments_after(
+    db: Session,
+    after_id: int,
+    limit: int,
+    until_id: Optional[int] = None
+) -> List[Tuple[int, str, Optional[int], datetime]]:
+    """
+    ID가 `after_id`보다 큰 댓글을 ID 순으로 조회합니다 (검색 색인/단어 집계 catch-up용).
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        after_id (int): 마지막으로 읽은 댓글 ID.
+        limit (int): 최대 조회 개수.
+        until_id (Optional[int]): 조회할 최대 댓글 ID (포함).
+
+    Returns:
+        List[Tuple[int, str, Optional[int], datetime]]: (댓글 ID, 내용, 메뉴 ID, 작성 시각) 목록.
+    """
+    query = db.query(Comment.id, Comment.comment, Comment.menu_id, Comment.created_at).filter(Comment.id > after_id)
+    if until_id is not None:
+        query = query.filter(Comment.id <= until_id)
+    rows = query.order_by(Comment.id).limit(limit).all()
+    return [tuple(row) for row in rows]
+
+
+def get_max_comment_id(db: Session) -> int:
+    """가장 큰 댓글 ID를 반환합니다 (댓글이 없으면 0)."""
+    return db.query(func.max(Comment.id)).scalar() or 0
+
+
+def get_comments_by_ids(db: Session, comment_ids: Sequence[int]) -> Dict[int, CommentResponse]:
+    """
+    여러 댓글을 ID로 한 번에 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        comment_ids (Sequence[int]): 조회할 댓글 ID 목록.
+
+    Returns:
+        Dict[int, CommentResponse]: 댓글 ID -> 댓글 정보 (존재하지 않는 ID는 제외).
+    """
+    if not comment_ids:
+        return {}
+    rows = db.query(Comment).options(noload(Comment.menu)).filter(Comment.id.in_(comment_ids)).all()
+    return {row.id: CommentResponse.model_validate(row) for row in rows}
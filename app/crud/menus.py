@@ -1,9 +1,10 @@
 from datetime import date
 from typing import List, Optional
 
-from sqlalchemy.sql import func
 from sqlalchemy.orm import Session, joinedload
 
+from app.cores.dates import day_range
+from app.cores.events import MenuPublished, emit
 from app.models.menus import Menu
 from app.schemas.menus import (
     MenuResponse, 
@@ -44,7 +45,13 @@ def get_menu_by_date(db: Session, date: date) -> List[MenuResponse]:
     Returns:
         List[MenuResponse]: 해당 날짜에 존재하는 모든 메뉴 리스트.
     """
-    menu_list = db.query(Menu).options(joinedload(Menu.foods)).filter(func.DATE(Menu.created_at) == date).all()
+    start, end = day_range(date)
+    menu_list = (
+        db.query(Menu)
+        .options(joinedload(Menu.foods))
+        .filter(Menu.created_at >= start, Menu.created_at < end)
+        .all()
+    )
 
     return [
         MenuResponse(
@@ -56,6 +63,24 @@ def get_menu_by_date(db: Session, date: date) -> List[MenuResponse]:
     ]
 
 
+def get_menu_ids_by_date(db: Session, date: date) -> List[int]:
+    """
+    특정 날짜의 메뉴 ID 목록을 조회합니다 (음식 목록은 불러오지 않음).
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        date (date): 조회할 날짜.
+
+    Returns:
+        List[int]: 메뉴 ID 목록.
+    """
+    start, end = day_range(date)
+    return [
+        menu_id for menu_id, in
+        db.query(Menu.id).filter(Menu.created_at >= start, Menu.created_at < end).order_by(Menu.id).all()
+    ]
+
+
 def create_menu(db: Session, menu: MenuCreateRequest) -> MenuResponse:
     """
     새로운 메뉴를 생성하고, 해당 메뉴에 포함된 음식 항목들을 연결하는 함수.
@@ -86,6 +111,12 @@ def create_menu(db: Session, menu: MenuCreateRequest) -> MenuResponse:
         db.execute(food_menu_table.insert().values(food_id=new_food.id, menu_id=new_menu.id))
         created_foods.append(FoodResponse(id=new_food.id, name=new_food.name))
 
+    emit(db, MenuPublished(
+        menu_id=new_menu.id,
+        date=new_menu.created_at,
+        food_ids=tuple(food.id for food in created_foods)
+    ))
+
     return MenuResponse(
         id=new_menu.id,
         foods=created_foods,
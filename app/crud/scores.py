@@ -1,11 +1,17 @@
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
 
 from fastapi import HTTPException, status
 
+from sqlalchemy import case, func, insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import and_
 
+from app.cores.events import ScoreCreated, emit
+from app.cores.score_journal import JournalFullError, ScoreJournal, get_score_journal
+from app.database import mark_user_write
+from app.models.id_blocks import IdBlock
 from app.models.scores import Score
 from app.schemas.scores import ScoreCreateRequest, ScoreResponse
 from app.models.foods import Food
@@ -16,6 +22,8 @@ def create_food_scores(db: Session, user_id: str, score_list: List[ScoreCreateRe
     """
     음식에 대한 평가 점수를 저장하는 함수.
 
+    `SCORE_WRITE_BEHIND`가 켜져 있으면 점수를 저널에 기록한 뒤 바로 반환하며, DB에는 flusher가 모아서 저장합니다.
+
     Args:
         db (Session): SQLAlchemy 세션 객체.
         user_id (str): 점수를 등록한 사용자 ID.
@@ -25,8 +33,14 @@ def create_food_scores(db: Session, user_id: str, score_list: List[ScoreCreateRe
         List[ScoreResponse]: 저장된 점수 정보 리스트.
 
     Raises:
-        HTTPException: 음식 ID가 존재하지 않을 경우 400 예외 발생.
+        HTTPException:
+            - 음식 ID가 존재하지 않을 경우 400 예외 발생.
+            - write-behind 저널의 저장 대기 점수가 가득 찬 경우 503 예외 발생.
     """
+    journal = get_score_journal()
+    if journal is not None:
+        return _journal_food_scores(db, journal, user_id, score_list)
+
     new_scores = []
 
     for score in score_list:
@@ -48,14 +62,142 @@ def create_food_scores(db: Session, user_id: str, score_list: List[ScoreCreateRe
         new_scores.append(new_score)
         db.add(new_score)
         db.flush()
+        emit(db, ScoreCreated(
+            score_id=new_score.id,
+            user_id=user_id,
+            food_id=new_score.food_id,
+            score=new_score.score,
+            created_at=new_score.created_at
+        ))
 
     return [ScoreResponse.model_validate(new_score) for new_score in new_scores]
 
 
+def _journal_food_scores(
+    db: Session,
+    journal: ScoreJournal,
+    user_id: str,
+    score_list: List[ScoreCreateRequest]
+) -> List[ScoreResponse]:
+    food_ids = {score.food_id for score in score_list}
+    existing = {food_id for food_id, in db.query(Food.id).filter(Food.id.in_(food_ids)).all()}
+    if existing != food_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid food_id. Food does not exist."
+        )
+
+    try:
+        records = journal.append(user_id, [(score.food_id, score.score) for score in score_list])
+    except JournalFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many scores are waiting to be saved. Please retry later."
+        )
+
+    # 저장 후 replica 지연 동안에도 자신의 점수를 볼 수 있도록 primary 조회 대상으로 기록합니다.
+    mark_user_write(user_id)
+    return [ScoreResponse.model_validate(record) for record in records]
+
+
+def reserve_score_ids(db: Session, count: int) -> int:
+    """
+    DB에 저장하기 전에 발급할 점수 ID 블록을 예약합니다. 커밋은 호출자가 수행합니다.
+
+    예약 범위는 항상 현재 `scores`의 최대 ID보다 크므로, write-behind를 껐다 켜도 ID가 겹치지 않습니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        count (int): 예약할 ID 수.
+
+    Returns:
+        int: 예약된 블록의 첫 ID (`[start, start + count)`).
+
+    Raises:
+        IntegrityError: 첫 블록을 다른 worker와 동시에 예약한 경우 (다시 시도하면 됩니다).
+    """
+    floor = (db.query(func.max(Score.id)).scalar() or 0) + 1
+    updated = (
+        db.query(IdBlock)
+        .filter(IdBlock.name == Score.__tablename__)
+        .update(
+            {IdBlock.next_id: case((IdBlock.next_id < floor, floor), else_=IdBlock.next_id) + count},
+            synchronize_session=False
+        )
+    )
+    if not updated:
+        db.add(IdBlock(name=Score.__tablename__, next_id=floor + count))
+        db.flush()
+        return floor
+
+    return db.query(IdBlock.next_id).filter(IdBlock.name == Score.__tablename__).scalar() - count
+
+
+def _is_same_score(saved: Row, record: Dict[str, Any]) -> bool:
+    # MySQL DATETIME은 초 미만을 반올림하여 저장하므로 1초 미만의 차이는 같은 시각으로 봅니다.
+    return (
+        saved.user_id == record["user_id"]
+        and saved.food_id == record["food_id"]
+        and saved.score == record["score"]
+        and abs(saved.created_at - record["created_at"]) < timedelta(seconds=1)
+    )
+
+
+def insert_journaled_scores(db: Session, records: List[Dict[str, Any]]) -> int:
+    """
+    write-behind 저널의 점수를 한 번의 INSERT로 저장합니다. 커밋은 호출자가 수행합니다.
+
+    같은 ID로 같은 점수(사용자, 음식, 점수, 등록 시각)가 이미 저장되어 있으면 replay로 보고 건너뜁니다.
+    write-behind를 끈 worker나 시드/관리 도구의 INSERT가 예약 블록의 ID를 먼저 사용한 경우에는
+    점수를 버리지 않고 새 ID로 저장합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        records (List[Dict[str, Any]]): `id`, `user_id`, `food_id`, `score`, `created_at`을 가진 점수 기록.
+
+    Returns:
+        int: 새로 저장한 점수 수.
+    """
+    if not records:
+        return 0
+
+    saved = {
+        score.id: score
+        for score in db.query(Score.id, Score.user_id, Score.food_id, Score.score, Score.created_at)
+        .filter(Score.id.in_([record["id"] for record in records]))
+        .all()
+    }
+    rows = [record for record in records if record["id"] not in saved]
+    if rows:
+        db.execute(insert(Score), rows)
+    for record in records:
+        if record["id"] in saved and not _is_same_score(saved[record["id"]], record):
+            new_score = Score(
+                user_id=record["user_id"],
+                food_id=record["food_id"],
+                score=record["score"],
+                created_at=record["created_at"]
+            )
+            db.add(new_score)
+            db.flush()
+            rows.append({**record, "id": new_score.id})
+    for row in rows:
+        emit(db, ScoreCreated(
+            score_id=row["id"],
+            user_id=row["user_id"],
+            food_id=row["food_id"],
+            score=row["score"],
+            created_at=row["created_at"]
+        ))
+    return len(rows)
+
+
 def get_recent_food_scores_by_menu(db: Session, user_id: str, menu_id: int) -> List[ScoreResponse]:
     """
     특정 메뉴에 포함된 음식들에 대해 사용자가 가장 최근에 등록한 점수를 조회합니다.
 
+    write-behind 저널에서 아직 DB에 저장되지 않은 점수도 포함합니다 (read-your-writes).
+
     Args:
         db (Session): SQLAlchemy 세션.
         user_id (str): 사용자 식별자.
@@ -84,7 +226,17 @@ def get_recent_food_scores_by_menu(db: Session, user_id: str, menu_id: int) -> L
             .order_by(Score.id.desc())
             .first())
     ]
-    
+
+    journal = get_score_journal()
+    if journal is not None:
+        latest = {score.food_id: score for score in scores}
+        menu_food_ids = {food.id for food in menu.foods}
+        for record in journal.pending_for_user(user_id):
+            current = latest.get(record["food_id"])
+            if record["food_id"] in menu_food_ids and (current is None or current.id < record["id"]):
+                latest[record["food_id"]] = ScoreResponse.model_validate(record)
+        scores = [latest[food.id] for food in menu.foods if food.id in latest]
+
     if not scores:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,24 +1,63 @@
 from collections import defaultdict
-from datetime import datetime
-import numpy as np
+from datetime import date, datetime
+from typing import Dict, List, Literal, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session, noload, selectinload
 from sqlalchemy.sql import func
 
+from app.config import get_settings
+from app.cores.cache import TTLCache
+from app.cores.dates import day_range
+from app.cores.events import ScoreCreated, event_bus
+from app.cores.tracing import trace_span
+from app.models.comment_terms import CommentTermCount, RollupCheckpoint
+from app.models.comments import Comment
+from app.models.food_menu import food_menu_table
 from app.models.menus import Menu
 from app.models.foods import Food
 from app.models.scores import Score
+from app.models.votes import Vote
 from app.schemas.statistics import (
     MenuStatisticResponse, 
     MenuMeanStatisticResponse,
     FoodStatisticResponse, 
     FoodMeanStatisticResponse,
     FoodStatisticsIncludingDuplicate,
-    FoodStatisticsWithoutDuplicate
+    FoodStatisticsWithoutDuplicate,
+    FoodLiveSummary,
+    MenuLiveSummaryResponse,
+    CommentTermCountResponse,
+    CommentTermsResponse,
+    FoodSeriesPoint,
+    FoodSeriesResponse
 )
 
+settings = get_settings()
+
+# 모델 관계가 모두 `selectin`이라 기본 조회는 음식의 모든 점수, 메뉴의 모든 댓글/투표까지 읽습니다.
+# 통계 함수는 ID와 메뉴의 음식 목록만 사용하므로 나머지 관계는 읽지 않습니다.
+_FOOD_ONLY = (noload(Food.scores), noload(Food.menus))
+_MENU_FOODS_ONLY = (
+    selectinload(Menu.foods).options(*_FOOD_ONLY),
+    noload(Menu.comments),
+    noload(Menu.votes),
+)
+
+# (food_id, bucket, date_from, date_to) -> 음식 점수 시계열
+food_series_cache = TTLCache(maxsize=1024, ttl=settings.FOOD_SERIES_CACHE_SECONDS, name="food_series")
+
+
+@event_bus.subscriber(ScoreCreated, batch=True)
+def _invalidate_food_series(events: List[ScoreCreated]) -> None:
+    """점수가 등록된 음식의 시계열 중 등록 날짜를 포함하는 캐시를 제거합니다."""
+    scored = {(event.food_id, event.created_at.date()) for event in events}
+    food_series_cache.invalidate(
+        lambda key: any(food_id == key[0] and key[2] <= day <= key[3] for food_id, day in scored)
+    )
+
 
 def get_menu_mean(db: Session, menu_id: int, date: datetime=None) -> MenuMeanStatisticResponse:
     """
@@ -35,7 +74,7 @@ def get_menu_mean(db: Session, menu_id: int, date: datetime=None) -> MenuMeanSta
     Raises:
         HTTPException: 메뉴가 존재하지 않을 경우 400 예외 발생.
     """
-    menu = db.query(Menu).filter(Menu.id == menu_id).first() 
+    menu = db.query(Menu).options(*_MENU_FOODS_ONLY).filter(Menu.id == menu_id).first()
     if not menu:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -69,7 +108,7 @@ def get_menu_statistics(db: Session, menu_id: int, date: datetime=None) -> MenuS
     Raises:
         HTTPException: 메뉴가 존재하지 않을 경우 400 예외 발생.
     """
-    menu = db.query(Menu).filter(Menu.id == menu_id).first() 
+    menu = db.query(Menu).options(*_MENU_FOODS_ONLY).filter(Menu.id == menu_id).first()
     if not menu:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -112,18 +151,24 @@ def get_food_mean(db: Session, food_id: int, date: datetime=None) -> FoodMeanSta
     Raises:
         HTTPException: 음식이 존재하지 않을 경우 404 예외 발생.
     """
-    food = db.query(Food).filter(Food.id == food_id).first()
+    food = db.query(Food).options(*_FOOD_ONLY).filter(Food.id == food_id).first()
     if not food:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Invalid food_id. Food does not exist."
         )
     
-    arr = np.array([score for _, score in _get_scores_without_duplicates(db, food, date)])
-    
+    import numpy as np
+
+    scores = _get_scores_without_duplicates(db, food, date)
+
+    with trace_span("numpy.food_mean", "numpy", food_id=food.id):
+        arr = np.array([score for _, score in scores])
+        mean = _safe_stat(float(np.mean(arr)))
+
     return FoodMeanStatisticResponse.model_validate({
         "food_id": food.id,
-        "mean": _safe_stat(float(np.mean(arr))),
+        "mean": mean,
     })
 
 
@@ -142,13 +187,15 @@ def get_food_statistics(db: Session, food_id: int, date: datetime=None) -> FoodS
     Raises:
         HTTPException: 음식이 존재하지 않거나 평가 점수가 없을 경우.
     """
-    food = db.query(Food).filter(Food.id == food_id).first()
+    food = db.query(Food).options(*_FOOD_ONLY).filter(Food.id == food_id).first()
     if not food:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Invalid food_id. Food does not exist."
         )
     
+    import numpy as np
+
     scores_including_duplicates_list = []
     scores_including_duplicates_dict = defaultdict(list)
     for user_id, score in _get_scores_including_duplicates(db, food, date):
@@ -161,13 +208,10 @@ def get_food_statistics(db: Session, food_id: int, date: datetime=None) -> FoodS
         scores_without_duplicates_dict[user_id] = score
         scores_without_duplicates_list.append(score)
 
-    arr_including_duplicates = np.array(scores_including_duplicates_list)
-    arr_without_duplicates = np.array(scores_without_duplicates_list)
-    
-    return FoodStatisticResponse.model_validate({
-        "food_id": food_id,
-        "statistics_including_duplicates": FoodStatisticsIncludingDuplicate.model_validate({
-            "scores": scores_including_duplicates_dict,
+    with trace_span("numpy.food_statistics", "numpy", food_id=food_id):
+        arr_including_duplicates = np.array(scores_including_duplicates_list)
+        arr_without_duplicates = np.array(scores_without_duplicates_list)
+        statistics_including_duplicates = {
             "total": len(arr_including_duplicates),
             "mean": _safe_stat(np.mean(arr_including_duplicates)),
             "median": _safe_stat(float(np.median(arr_including_duplicates))),
@@ -175,9 +219,8 @@ def get_food_statistics(db: Session, food_id: int, date: datetime=None) -> FoodS
             "quantile_75": float(np.percentile(arr_including_duplicates, 75)),
             "min": float(np.min(arr_including_duplicates)),
             "max": float(np.max(arr_including_duplicates))
-        }),
-        "statistics_without_duplicates": FoodStatisticsWithoutDuplicate.model_validate({
-            "scores": scores_without_duplicates_dict,
+        }
+        statistics_without_duplicates = {
             "total": len(arr_without_duplicates),
             "mean": _safe_stat(np.mean(arr_without_duplicates)),
             "median": _safe_stat(np.median(arr_without_duplicates)),
@@ -185,10 +228,410 @@ def get_food_statistics(db: Session, food_id: int, date: datetime=None) -> FoodS
             "quantile_75": float(np.percentile(arr_without_duplicates, 75)),
             "min": float(np.min(arr_without_duplicates)),
             "max": float(np.max(arr_without_duplicates))
+        }
+
+    return FoodStatisticResponse.model_validate({
+        "food_id": food_id,
+        "statistics_including_duplicates": FoodStatisticsIncludingDuplicate.model_validate({
+            "scores": scores_including_duplicates_dict,
+            **statistics_including_duplicates
+        }),
+        "statistics_without_duplicates": FoodStatisticsWithoutDuplicate.model_validate({
+            "scores": scores_without_duplicates_dict,
+            **statistics_without_duplicates
         })
     })
 
 
+def get_food_series(
+    db: Session,
+    food_id: int,
+    date_from: date,
+    date_to: date,
+    bucket: Literal["day", "week", "month"] = "day"
+) -> FoodSeriesResponse:
+    """
+    기간 내 음식 점수를 일/주/월 구간별로 집계합니다.
+
+    기간 내 (작성 시각, 사용자 ID, 점수)를 한 번에 조회한 뒤, NumPy로 구간별 평가 수/평균과
+    중복 제거 평균(구간 안에서 사용자별 평균을 낸 뒤의 평균)을 계산합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        food_id (int): 음식 ID.
+        date_from (date): 시작 날짜 (포함).
+        date_to (date): 끝 날짜 (포함).
+        bucket (str): 구간 단위. `week`는 월요일, `month`는 1일에 시작합니다.
+
+    Returns:
+        FoodSeriesResponse: 평가가 있는 구간의 통계.
+
+    Raises:
+        HTTPException:
+            - `date_from`이 `date_to`보다 늦거나 기간이 `FOOD_SERIES_MAX_DAYS`를 넘을 경우 400 에러.
+            - 음식이 존재하지 않을 경우 404 에러.
+    """
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be later than 'to'."
+        )
+    if (date_to - date_from).days + 1 > settings.FOOD_SERIES_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The range must not exceed {settings.FOOD_SERIES_MAX_DAYS} days."
+        )
+
+    key = (food_id, bucket, date_from, date_to)
+    cached = food_series_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if not db.query(Food.id).filter(Food.id == food_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Invalid food_id. Food does not exist."
+        )
+
+    start, _ = day_range(date_from)
+    _, end = day_range(date_to)
+    rows = (
+        db.query(Score.created_at, Score.user_id, Score.score)
+        .filter(Score.food_id == food_id, Score.created_at >= start, Score.created_at < end)
+        .all()
+    )
+
+    points = []
+    if rows:
+        import numpy as np
+
+        with trace_span("numpy.food_series", "numpy", food_id=food_id):
+            created_at, user_ids, scores = zip(*rows)
+            days = np.array(created_at, dtype="datetime64[D]")
+            if bucket == "week":
+                # 1970-01-01은 목요일이므로 (일 수 + 3) % 7이 월요일 기준 요일입니다.
+                days = days - (days.astype(np.int64) + 3) % 7
+            elif bucket == "month":
+                days = days.astype("datetime64[M]").astype("datetime64[D]")
+            scores = np.array(scores, dtype=np.float64)
+
+            starts, bucket_index = np.unique(days, return_inverse=True)
+            counts = np.bincount(bucket_index)
+            means = np.bincount(bucket_index, weights=scores) / counts
+
+            # (구간, 사용자) 쌍별 평균을 구한 뒤 구간별로 다시 평균을 냅니다.
+            users, user_index = np.unique(np.array(user_ids, dtype=object), return_inverse=True)
+            pairs, pair_index = np.unique(bucket_index * len(users) + user_index, return_inverse=True)
+            user_means = np.bincount(pair_index, weights=scores) / np.bincount(pair_index)
+            pair_bucket = pairs // len(users)
+            user_counts = np.bincount(pair_bucket, minlength=len(starts))
+            user_means = np.bincount(pair_bucket, weights=user_means, minlength=len(starts)) / user_counts
+
+            points = [
+                FoodSeriesPoint(
+                    start=day.item(),
+                    count=int(count),
+                    mean=_safe_stat(float(mean)),
+                    count_without_duplicates=int(user_count),
+                    mean_without_duplicates=_safe_stat(float(user_mean))
+                )
+                for day, count, mean, user_count, user_mean in zip(starts, counts, means, user_counts, user_means)
+            ]
+
+    series = FoodSeriesResponse(
+        food_id=food_id,
+        bucket=bucket,
+        date_from=date_from,
+        date_to=date_to,
+        points=points
+    )
+    food_series_cache.set(key, series)
+    return series
+
+
+def get_food_menu_ids(db: Session, food_ids: List[int], menu_ids: List[int]) -> List[Tuple[int, int]]:
+    """
+    음식이 포함된 메뉴를 주어진 메뉴 범위 안에서 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        food_ids (List[int]): 음식 ID 목록.
+        menu_ids (List[int]): 조회 대상 메뉴 ID 목록.
+
+    Returns:
+        List[Tuple[int, int]]: (음식 ID, 메뉴 ID) 목록.
+    """
+    if not food_ids or not menu_ids:
+        return []
+    return [
+        (food_id, menu_id) for food_id, menu_id in
+        db.query(food_menu_table.c.food_id, food_menu_table.c.menu_id)
+        .filter(food_menu_table.c.food_id.in_(food_ids), food_menu_table.c.menu_id.in_(menu_ids))
+        .all()
+    ]
+
+
+def get_menu_live_summaries(db: Session, menu_ids: List[int]) -> Dict[int, MenuLiveSummaryResponse]:
+    """
+    여러 메뉴의 투표 수, 댓글 수, 음식별 평가 수/평균을 한 번에 집계합니다.
+
+    메뉴 수와 관계없이 집계 쿼리 4개로 계산하므로, 실시간 푸시에서 변경된 메뉴를 모아 한 번에 다시 계산할 때 사용합니다.
+    존재하지 않는 메뉴 ID는 결과에서 제외됩니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        menu_ids (List[int]): 메뉴 ID 목록.
+
+    Returns:
+        Dict[int, MenuLiveSummaryResponse]: 메뉴 ID -> 요약.
+    """
+    if not menu_ids:
+        return {}
+
+    existing = [menu_id for menu_id, in db.query(Menu.id).filter(Menu.id.in_(menu_ids)).all()]
+    vote_counts = dict(
+        db.query(Vote.menu_id, func.count(Vote.id)).filter(Vote.menu_id.in_(existing)).group_by(Vote.menu_id).all()
+    )
+    comment_counts = dict(
+        db.query(Comment.menu_id, func.count(Comment.id))
+        .filter(Comment.menu_id.in_(existing))
+        .group_by(Comment.menu_id)
+        .all()
+    )
+
+    foods: Dict[int, List[FoodLiveSummary]] = defaultdict(list)
+    rows = (
+        db.query(food_menu_table.c.menu_id, food_menu_table.c.food_id, func.count(Score.id), func.avg(Score.score))
+        .outerjoin(Score, Score.food_id == food_menu_table.c.food_id)
+        .filter(food_menu_table.c.menu_id.in_(existing))
+        .group_by(food_menu_table.c.menu_id, food_menu_table.c.food_id)
+        .order_by(food_menu_table.c.menu_id, food_menu_table.c.food_id)
+        .all()
+    )
+    for menu_id, food_id, count, mean in rows:
+        foods[menu_id].append(FoodLiveSummary(food_id=food_id, count=count, mean=round(float(mean or 0.0), 5)))
+
+    return {
+        menu_id: MenuLiveSummaryResponse(
+            menu_id=menu_id,
+            vote_count=vote_counts.get(menu_id, 0),
+            comment_count=comment_counts.get(menu_id, 0),
+            foods=foods.get(menu_id, [])
+        )
+        for menu_id in existing
+    }
+
+
+def get_rollup_checkpoint(db: Session, name: str) -> int:
+    """
+    집계 작업이 마지막으로 반영한 원본 행 ID를 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        name (str): 집계 이름.
+
+    Returns:
+        int: 마지막으로 집계한 ID (처음이면 0).
+    """
+    return db.query(RollupCheckpoint.last_id).filter(RollupCheckpoint.name == name).scalar() or 0
+
+
+def advance_rollup_checkpoint(db: Session, name: str, last_id: int, new_last_id: int) -> bool:
+    """
+    집계 진행 위치를 `last_id`에서 `new_last_id`로 옮깁니다. 커밋은 호출자가 수행합니다.
+
+    진행 위치가 `last_id`일 때만 갱신하므로, 같은 범위를 동시에 집계한 worker 중 하나만 성공합니다.
+    집계 결과를 반영하기 전에 호출하여 진행 위치 행을 잠급니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        name (str): 집계 이름.
+        last_id (int): 조회했던 진행 위치.
+        new_last_id (int): 이번에 집계한 마지막 ID.
+
+    Returns:
+        bool: 갱신했으면 `True`, 다른 worker가 먼저 갱신했으면 `False`.
+
+    Raises:
+        IntegrityError: 첫 진행 위치를 다른 worker와 동시에 기록한 경우.
+    """
+    updated = (
+        db.query(RollupCheckpoint)
+        .filter(RollupCheckpoint.name == name, RollupCheckpoint.last_id == last_id)
+        .update({RollupCheckpoint.last_id: new_last_id}, synchronize_session=False)
+    )
+    if updated:
+        return True
+    if last_id == 0 and db.get(RollupCheckpoint, name) is None:
+        db.add(RollupCheckpoint(name=name, last_id=new_last_id))
+        db.flush()
+        return True
+    return False
+
+
+def add_comment_term_counts(db: Session, counts: Dict[Tuple[int, date, str], int]) -> None:
+    """
+    (메뉴 ID, 날짜, 단어)별 댓글 수를 누적합니다. 커밋은 호출자가 수행합니다.
+
+    기존 행을 읽지 않고 DB의 upsert(MySQL `ON DUPLICATE KEY UPDATE`, SQLite/PostgreSQL `ON CONFLICT`) 한 문장으로 더합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        counts (Dict[Tuple[int, date, str], int]): (메뉴 ID, 날짜, 단어) -> 더할 댓글 수.
+    """
+    if not counts:
+        return
+
+    table = CommentTermCount.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        statement = mysql.insert(table)
+        statement = statement.on_duplicate_key_update(count=table.c.count + statement.inserted["count"])
+    else:
+        statement = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.menu_id, table.c.day, table.c.term],
+            set_={"count": table.c.count + statement.excluded["count"]}
+        )
+    db.execute(statement, [
+        {"menu_id": menu_id, "day": day, "term": term, "count": count}
+        for (menu_id, day, term), count in counts.items()
+    ])
+
+
+def get_top_comment_terms(
+    db: Session,
+    date_from: date,
+    date_to: date,
+    menu_id: Optional[int] = None,
+    food_id: Optional[int] = None,
+    limit: int = 20
+) -> CommentTermsResponse:
+    """
+    기간 내 댓글에 가장 많이 등장한 단어를 단어 집계 테이블에서 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        date_from (date): 시작 날짜 (포함).
+        date_to (date): 끝 날짜 (포함).
+        menu_id (Optional[int]): 메뉴 ID 필터.
+        food_id (Optional[int]): 음식 ID 필터 (음식이 포함된 메뉴의 댓글).
+        limit (int): 반환할 단어 수.
+
+    Returns:
+        CommentTermsResponse: 댓글 수 내림차순 상위 단어.
+
+    Raises:
+        HTTPException:
+            - `date_from`이 `date_to`보다 늦을 경우 400 에러.
+            - 메뉴 또는 음식이 존재하지 않을 경우 400 에러.
+    """
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be later than 'to'."
+        )
+    if menu_id is not None and not db.query(Menu.id).filter(Menu.id == menu_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid menu_id. Menu does not exist."
+        )
+    if food_id is not None and not db.query(Food.id).filter(Food.id == food_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid food_id. Food does not exist."
+        )
+
+    total = func.sum(CommentTermCount.count).label("total")
+    query = (
+        db.query(CommentTermCount.term, total)
+        .filter(CommentTermCount.day >= date_from, CommentTermCount.day <= date_to)
+    )
+    if menu_id is not None:
+        query = query.filter(CommentTermCount.menu_id == menu_id)
+    if food_id is not None:
+        query = query.filter(CommentTermCount.menu_id.in_(
+            db.query(food_menu_table.c.menu_id).filter(food_menu_table.c.food_id == food_id)
+        ))
+    rows = query.group_by(CommentTermCount.term).order_by(total.desc(), CommentTermCount.term).limit(limit).all()
+
+    return CommentTermsResponse(
+        date_from=date_from,
+        date_to=date_to,
+        menu_id=menu_id,
+        food_id=food_id,
+        terms=[CommentTermCountResponse(term=term, count=count) for term, count in rows]
+    )
+
+
+def get_food_score_totals(
+    db: Session,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> List[Tuple[int, int, float]]:
+    """
+    기간 내 음식별 평가 수와 점수 합을 한 번의 GROUP BY로 조회합니다 (음식 순위표 생성용).
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        start (Optional[datetime]): 기간 시작 (포함). None이면 제한 없음.
+        end (Optional[datetime]): 기간 끝 (제외). None이면 제한 없음.
+
+    Returns:
+        List[Tuple[int, int, float]]: (음식 ID, 평가 수, 점수 합)의 리스트.
+    """
+    query = db.query(Score.food_id, func.count(Score.id), func.sum(Score.score)).filter(Score.food_id.isnot(None))
+    if start is not None:
+        query = query.filter(Score.created_at >= start)
+    if end is not None:
+        query = query.filter(Score.created_at < end)
+    rows = query.group_by(Score.food_id).all()
+    return [(food_id, count, float(total)) for food_id, count, total in rows]
+
+
+def get_food_scores_since(
+    db: Session,
+    start: datetime,
+    end: Optional[datetime] = None
+) -> List[Tuple[int, int, float]]:
+    """
+    최근 구간의 점수를 집계하지 않고 한 건씩 조회합니다 (음식 순위표 생성용).
+
+    순위표는 이 점수들을 ID로 기억하여, 같은 점수의 등록 이벤트가 다시 도착해도 두 번 더하지 않습니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        start (datetime): 구간 시작 (포함).
+        end (Optional[datetime]): 구간 끝 (제외). None이면 제한 없음.
+
+    Returns:
+        List[Tuple[int, int, float]]: (점수 ID, 음식 ID, 점수)의 리스트.
+    """
+    query = (
+        db.query(Score.id, Score.food_id, Score.score)
+        .filter(Score.food_id.isnot(None), Score.created_at >= start)
+    )
+    if end is not None:
+        query = query.filter(Score.created_at < end)
+    return [(score_id, food_id, float(score)) for score_id, food_id, score in query.all()]
+
+
+def get_food_names(db: Session, food_ids: List[int]) -> Dict[int, str]:
+    """
+    음식 ID 목록의 이름을 한 번의 IN 쿼리로 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 세션 객체.
+        food_ids (List[int]): 음식 ID 목록.
+
+    Returns:
+        Dict[int, str]: 음식 ID -> 이름. 존재하지 않는 음식은 포함되지 않습니다.
+    """
+    if not food_ids:
+        return {}
+    return dict(db.query(Food.id, Food.name).filter(Food.id.in_(food_ids)).all())
+
+
 def _get_scores_including_duplicates(db: Session, food: Food, date: datetime=None):
     """
     중복 포함 점수 목록을 조회합니다.
@@ -202,10 +645,11 @@ def _get_scores_including_duplicates(db: Session, food: Food, date: datetime=Non
         List[Tuple[int, float]]: (user_id, score)의 리스트.
     """
     if date:
+        start, end = day_range(date)
         return (
             db
             .query(Score.user_id, Score.score)
-            .filter(and_(Score.food_id == food.id), func.DATE(Score.created_at) == func.DATE(date))
+            .filter(and_(Score.food_id == food.id, Score.created_at >= start, Score.created_at < end))
             .all()
         )
     else:
@@ -230,10 +674,11 @@ def _get_scores_without_duplicates(db: Session, food: Food, date: datetime=None)
         List[Tuple[int, float]]: (user_id, 평균 점수)의 리스트.
     """
     if date:
+        start, end = day_range(date)
         return (
             db
             .query(Score.user_id, func.avg(Score.score))
-            .filter(and_(Score.food_id == food.id, func.DATE(Score.created_at) == func.DATE(date)))
+            .filter(and_(Score.food_id == food.id, Score.created_at >= start, Score.created_at < end))
             .group_by(Score.user_id)
             .all()
         )
@@ -249,6 +694,8 @@ def _get_scores_without_duplicates(db: Session, food: Food, date: datetime=None)
 
 def _safe_stat(value: float) -> float:
     """np.NaN, np.inf 방지 및 소숫점 5자리에서 반올림"""
+    import numpy as np
+
     if np.isnan(value) or np.isinf(value):
         return 0.0
     return round(value, 5)
@@ -2,23 +2,23 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from app.cores.security import get_password_hash
 from app.models.users import User
 from app.schemas.users import UserCreateRequest, UserResponse
 from app.models.roles import Role, RoleEnum
 
 
-def register(db: Session, user: UserCreateRequest) -> UserResponse:
+def register(db: Session, user: UserCreateRequest, hashed_password: str) -> UserResponse:
     """
     새로운 사용자 등록 함수.
 
     - `username`과 `email`을 사용하여 새로운 사용자를 생성합니다.
-    - 비밀번호는 해싱되어 저장됩니다.
+    - 비밀번호는 호출 측에서 해싱한 값(`hashed_password`)으로 저장됩니다.
     - 기본적으로 `user` 역할을 부여하며, 요청에 따라 `admin` 역할을 부여할 수도 있습니다.
 
     Args:
         db (Session): 데이터베이스 세션.
         user (UserCreateRequest): 사용자 생성 요청 데이터.
+        hashed_password (str): 해싱된 비밀번호.
 
     Returns:
         UserResponse: 생성된 사용자 정보.
@@ -29,7 +29,7 @@ def register(db: Session, user: UserCreateRequest) -> UserResponse:
     new_user = User(
         username=user.username,
         email=user.email,
-        hashed_password=get_password_hash(user.password)
+        hashed_password=hashed_password
     )
     db.add(new_user)
     db.flush()
@@ -63,4 +63,19 @@ def get_user(db: Session, username: str) -> Optional[User]:
     Returns:
         Optional[User]: 사용자가 존재하면 `User` 객체 반환, 없으면 `None` 반환.
     """
-    return db.query(User).filter(User.username == username).first()
\ No newline at end of file
+    return db.query(User).filter(User.username == username).first()
+
+
+def update_password_hash(db: Session, user: User, hashed_password: str) -> None:
+    """
+    사용자의 비밀번호 해시를 교체하는 함수.
+
+    - bcrypt cost가 변경되었을 때 로그인 과정에서 기존 해시를 재해싱하는 용도로 사용합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션.
+        user (User): 비밀번호 해시를 교체할 사용자 객체.
+        hashed_password (str): 새로 해싱된 비밀번호.
+    """
+    user.hashed_password = hashed_password
+    db.flush()
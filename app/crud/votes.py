@@ -3,6 +3,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import and_
 
+from app.cores.events import VoteChanged, emit
 from app.models.menus import Menu
 from app.models.votes import Vote
 from app.schemas.votes import (
@@ -50,6 +51,13 @@ def create_vote(db: Session, user_id: str, vote: VoteCreateRequest) -> VoteRepon
 
     db.add(new_vote)
     db.flush()
+    emit(db, VoteChanged(
+        vote_id=new_vote.id,
+        user_id=new_vote.user_id,
+        menu_id=new_vote.menu_id,
+        previous_menu_id=None,
+        created_at=new_vote.created_at
+    ))
 
     return VoteReponse.model_validate(new_vote)
 
@@ -139,6 +147,13 @@ def update_vote(db: Session, new_vote: VotePatchRequest) -> VoteReponse:
         )
 
     if vote.menu_id != new_vote.menu_id:
+        emit(db, VoteChanged(
+            vote_id=vote.id,
+            user_id=vote.user_id,
+            menu_id=new_vote.menu_id,
+            previous_menu_id=vote.menu_id,
+            created_at=new_vote.created_at
+        ))
         vote.created_at = new_vote.created_at
         vote.menu_id = new_vote.menu_id
 
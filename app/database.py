@@ -1,40 +1,285 @@
-from sqlalchemy import create_engine
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Dict, Optional
+
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.config import get_settings
+from app.cores.pool import InstrumentedQueuePool
+from app.cores.statements import instrument_engine
 
 settings = get_settings()
 
-engine = create_engine(settings.MYSQL_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 엔진은 import 시점이 아니라 각 worker 프로세스의 lifespan(`init_engines`)에서 생성됩니다.
+engine: Optional[Engine] = None
+read_engine: Optional[Engine] = None
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 Base: DeclarativeMeta = declarative_base()
 
+_engine_lock = threading.Lock()
+
+# 최근 쓰기를 수행한 사용자 ID -> 쓰기 시각 (time.monotonic)
+_recent_writes: Dict[str, float] = {}
+_recent_writes_lock = threading.Lock()
+
+# 이벤트 루프 -> SQLite 쓰기 세션 직렬화 잠금
+_sqlite_write_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def is_in_memory_sqlite(url: str) -> bool:
+    """
+    인메모리 SQLite URL(`sqlite://`, `sqlite:///:memory:`, `mode=memory` URI)인지 확인합니다.
+
+    Args:
+        url (str): DB URL.
+
+    Returns:
+        bool: 인메모리 SQLite이면 `True`.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return False
+    return parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+
+
+def _enable_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """SQLite 커넥션마다 WAL 모드와 잠금 대기 시간을 설정합니다."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    if settings.SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode = WAL")
+        # WAL 모드에서는 NORMAL로도 커밋된 트랜잭션이 손상되지 않습니다 (전원 장애 시 마지막 커밋만 유실 가능).
+        cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.close()
+
+
+def create_db_engine(url: str) -> Engine:
+    """
+    DB URL에 맞는 엔진을 생성합니다.
+
+    - MySQL 등: `InstrumentedQueuePool`과 profile별 커넥션 풀 설정을 사용합니다.
+    - SQLite 파일: 위와 같은 풀을 사용하며, 커넥션마다 WAL 모드(`SQLITE_WAL`)와 `busy_timeout`을 설정합니다.
+      SQLite는 한 번에 하나의 쓰기 트랜잭션만 허용하므로, 다른 쓰기는 커밋될 때까지 `busy_timeout` 동안 대기합니다.
+    - 인메모리 SQLite: 커넥션 하나를 공유하면 세션 간 트랜잭션이 섞이므로, 임시 디렉터리의 SQLite 파일로 대체하여
+      SQLite 파일과 같은 방식으로 엽니다. 파일은 엔진이 정리될 때(프로세스 종료 포함) 삭제됩니다.
+      worker마다 별도의 DB가 생기므로 테스트/벤치마크용이며 worker 하나로 실행해야 합니다.
+
+    Args:
+        url (str): SQLAlchemy DB URL.
+
+    Returns:
+        Engine: 생성된 엔진.
+    """
+    options = settings.db_engine_options
+    if make_url(url).get_backend_name() != "sqlite":
+        return create_engine(url, poolclass=InstrumentedQueuePool, **options)
+
+    directory = None
+    if is_in_memory_sqlite(url):
+        directory = tempfile.mkdtemp(prefix="app-sqlite-")
+        url = f"sqlite:///{os.path.join(directory, 'app.db')}"
+
+    # 세션을 연 스레드와 커밋하는 스레드(의존성 종료 처리)가 다를 수 있으므로 스레드 검사를 끕니다.
+    # 커넥션은 풀에서 한 번에 하나의 세션에만 할당됩니다.
+    sqlite_engine = create_engine(
+        url, poolclass=InstrumentedQueuePool, connect_args={"check_same_thread": False}, **options
+    )
+    event.listen(sqlite_engine, "connect", _enable_sqlite_pragmas)
+    if directory is not None:
+        weakref.finalize(sqlite_engine, shutil.rmtree, directory, True)
+    return sqlite_engine
+
+
+def init_engines() -> Engine:
+    """
+    primary/replica 엔진을 생성하고 세션 팩토리에 연결합니다.
+
+    이미 생성되어 있으면 기존 엔진을 그대로 반환합니다.
+    커넥션은 실제 사용 시점에 열리므로 이 함수는 DB 연결을 요구하지 않습니다.
+
+    Returns:
+        Engine: primary 엔진.
+    """
+    global engine, read_engine
+    with _engine_lock:
+        if engine is not None:
+            return engine
+
+        engine = create_db_engine(settings.db_url)
+        # replica가 설정되지 않은 경우 읽기 세션도 primary 엔진을 사용합니다.
+        read_engine = create_db_engine(settings.db_read_url) if settings.db_read_url else engine
+
+        instrument_engine(engine, "primary")
+        if read_engine is not engine:
+            instrument_engine(read_engine, "replica")
+
+        SessionLocal.configure(bind=engine)
+        ReadSessionLocal.configure(bind=read_engine)
+        return engine
+
+
+def dispose_engines() -> None:
+    """엔진의 커넥션 풀을 정리하고 세션 팩토리 연결을 해제합니다."""
+    global engine, read_engine
+    with _engine_lock:
+        if read_engine is not None and read_engine is not engine:
+            read_engine.dispose()
+        if engine is not None:
+            engine.dispose()
+        engine = read_engine = None
+        SessionLocal.configure(bind=None)
+        ReadSessionLocal.configure(bind=None)
+
+
+def get_engine() -> Engine:
+    """
+    primary 엔진을 반환합니다. 아직 생성되지 않았다면 생성합니다.
+
+    Returns:
+        Engine: primary 엔진.
+    """
+    return engine if engine is not None else init_engines()
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _mark_session_written(session, flush_context):
+    """flush가 발생한 세션에 쓰기 여부를 표시합니다."""
+    session.info["has_writes"] = True
+
+
+def mark_user_write(user_id: Optional[str]) -> None:
+    """
+    사용자가 방금 쓰기를 수행했음을 기록합니다.
+
+    `READ_YOUR_WRITES_SECONDS` 동안 해당 사용자의 조회는 primary로 전달됩니다.
+
+    Args:
+        user_id (Optional[str]): `user-id` 헤더 값.
+    """
+    if not user_id or user_id == "anonymous" or settings.READ_YOUR_WRITES_SECONDS <= 0:
+        return
+
+    now = time.monotonic()
+    with _recent_writes_lock:
+        _recent_writes[user_id] = now
+        if len(_recent_writes) > 10000:
+            expired = [
+                key for key, written_at in _recent_writes.items()
+                if now - written_at > settings.READ_YOUR_WRITES_SECONDS
+            ]
+            for key in expired:
+                del _recent_writes[key]
+
+
+def is_read_sticky(user_id: Optional[str]) -> bool:
+    """
+    사용자의 조회를 primary로 보내야 하는지 확인합니다.
+
+    Args:
+        user_id (Optional[str]): `user-id` 헤더 값.
+
+    Returns:
+        bool: 최근 쓰기 이후 stickiness 구간 안이면 `True`.
+    """
+    if not user_id:
+        return False
+
+    with _recent_writes_lock:
+        written_at = _recent_writes.get(user_id)
+    return written_at is not None and time.monotonic() - written_at < settings.READ_YOUR_WRITES_SECONDS
+
 
 def init_db():
     """
     데이터베이스 및 테이블 초기화 함수.
     `Base.metadata.create_all(bind=engine)`을 호출하여 테이블을 생성함.
     """
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
-def get_db():
+async def serialize_sqlite_writes() -> AsyncIterator[None]:
+    """
+    primary가 SQLite이면 요청의 쓰기 세션(`get_db`)을 worker 안에서 한 번에 하나만 열도록 직렬화하는 의존성 함수.
+
+    SQLite는 한 번에 하나의 쓰기 트랜잭션만 허용합니다. 핸들러는 이벤트 루프에서 동기 DB 호출을 하므로
+    두 요청이 동시에 쓰면 나중 요청의 `busy_timeout` 대기가 이벤트 루프를 막아 앞선 요청이 커밋하지 못하고
+    "database is locked"로 실패합니다. 대기는 이벤트 루프를 막지 않는 `asyncio.Lock`에서 하며,
+    잠금은 `get_db`가 커밋/롤백한 뒤에 해제됩니다. 다른 DB에서는 아무 일도 하지 않습니다.
+
+    Yields:
+        None
+    """
+    if get_engine().dialect.name != "sqlite":
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    lock = _sqlite_write_locks.get(loop)
+    if lock is None:
+        lock = _sqlite_write_locks[loop] = asyncio.Lock()
+    async with lock:
+        yield
+
+
+def get_db(request: Request = None, _writer: None = Depends(serialize_sqlite_writes)):
     """
     SQLAlchemy 세션을 제공하는 FastAPI 의존성 함수.
 
+    커밋된 세션에 쓰기가 있었다면 요청의 `user-id`를 read-your-writes 대상으로 기록합니다.
+    primary가 SQLite이면 `serialize_sqlite_writes`로 요청 간 쓰기 세션을 직렬화합니다.
+
+    Args:
+        request (Request, optional): FastAPI 요청 객체.
+
     Yields:
         Session: SQLAlchemy 데이터베이스 세션.
 
     Raises:
         Exception: 세션 중 오류 발생 시 롤백 후 예외 발생.
     """
+    get_engine()
     db = SessionLocal()
     try:
         yield db
         db.commit()
+        if request is not None and db.info.get("has_writes"):
+            mark_user_write(request.headers.get("user-id"))
     except Exception:
         db.rollback()
         raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db(request: Request):
+    """
+    조회 전용 SQLAlchemy 세션을 제공하는 FastAPI 의존성 함수.
+
+    replica가 설정되어 있으면 replica 세션을, `user-id`가 최근에 쓰기를 수행했다면
+    primary 세션을 제공합니다. 조회 전용이므로 커밋하지 않습니다.
+
+    Args:
+        request (Request): FastAPI 요청 객체.
+
+    Yields:
+        Session: SQLAlchemy 데이터베이스 세션.
+    """
+    get_engine()
+    if read_engine is not engine and not is_read_sticky(request.headers.get("user-id")):
+        db = ReadSessionLocal()
+    else:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
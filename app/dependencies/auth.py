@@ -1,63 +1,148 @@
+import time
+
 from jose import JWTError, jwt
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import get_db
+from app.cores.cache import TTLCache
 from app.cores.security import SECRET_KEY, ALGORITHM
 from app.crud.users import get_user
 from app.models.users import User
-from app.models.roles import RoleEnum
+from app.models.roles import Role, RoleEnum
+from app.schemas.users import AuthenticatedUser
+
+settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/token")
 
+# (username, 토큰 만료 시각) -> AuthenticatedUser
+principal_cache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS, name="auth_principal"
+)
+
+
+def invalidate_principal(username: str) -> None:
+    """
+    특정 사용자에 대해 캐싱된 인증 정보를 모두 제거합니다.
+
+    Args:
+        username (str): 캐시를 제거할 사용자의 `username`.
+    """
+    principal_cache.invalidate(lambda key: key[0] == username)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_principals(session, flush_context):
+    """계정 비활성화, 역할 변경, 삭제가 flush된 사용자를 세션에 기록합니다."""
+    changed = session.info.setdefault("changed_principals", set())
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User):
+            state = inspect(obj)
+            if obj in session.deleted or state.attrs.disabled.history.has_changes() \
+                    or state.attrs.username.history.has_changes():
+                changed.update(state.attrs.username.history.sum())
+        elif isinstance(obj, Role):
+            if obj in session.deleted or inspect(obj).attrs.role.history.has_changes():
+                if obj.user is not None:
+                    changed.add(obj.user.username)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session):
+    """커밋된 변경 사항에 해당하는 인증 캐시를 제거합니다."""
+    for username in session.info.pop("changed_principals", ()):
+        invalidate_principal(username)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_principals(session):
+    session.info.pop("changed_principals", None)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-) -> User:
+) -> AuthenticatedUser:
     """
     현재 사용자를 JWT 토큰을 통해 검증 후 반환.
 
+    - 토큰에 사용자 정보가 포함되어 있으면(`JWT_EMBED_CLAIMS`) DB를 조회하지 않습니다.
+    - 그 외에는 (`sub`, `exp`) 기준으로 캐싱된 사용자 정보를 사용하며,
+      캐시에 없을 때만 DB를 조회합니다.
+
     Args:
         token (str): 요청에서 전달된 JWT 토큰.
         db (Session): 데이터베이스 세션.
 
     Returns:
-        User: 인증된 사용자 객체.
+        AuthenticatedUser: 인증된 사용자 정보.
 
     Raises:
-        HTTPException: 토큰이 없거나, 유효하지 않거나, 사용자가 존재하지 않을 경우.
+        HTTPException: 토큰이 없거나, 유효하지 않거나, 사용자가 존재하지 않거나 비활성화된 경우.
     """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username = payload.get("sub")
-        if username is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        
-        user = get_user(db, username)
-        if user is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-        return user
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
 
+    username = payload.get("sub")
+    if username is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+
+    if settings.JWT_EMBED_CLAIMS and payload.get("uid") is not None:
+        return AuthenticatedUser(
+            id=payload["uid"],
+            username=username,
+            email=payload.get("email") or "",
+            role=payload["role"]
+        )
+
+    expires_at = payload.get("exp")
+    cache_key = (username, expires_at)
+    user = principal_cache.get(cache_key)
+
+    if user is None:
+        db_user = get_user(db, username)
+        if db_user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+        user = AuthenticatedUser(
+            id=db_user.id,
+            username=db_user.username,
+            email=db_user.email,
+            role=db_user.role.role,
+            disabled=bool(db_user.disabled)
+        )
+        ttl = settings.AUTH_CACHE_TTL_SECONDS
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        principal_cache.set(cache_key, user, ttl=ttl)
+
+    if user.disabled:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+    return user
+
 
-async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_admin(current_user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
     """
     관리자 권한을 가진 사용자만 접근 가능하도록 검증.
 
     Args:
-        current_user (User): 현재 인증된 사용자.
+        current_user (AuthenticatedUser): 현재 인증된 사용자.
 
     Returns:
-        User: 관리자 권한이 확인된 사용자 객체.
+        AuthenticatedUser: 관리자 권한이 확인된 사용자 정보.
 
     Raises:
         HTTPException: 사용자가 관리자 권한이 없을 경우 `403 Forbidden` 예외 발생.
     """
-    if current_user.role.role != RoleEnum.admin:
+    if current_user.role != RoleEnum.admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. Admins only.",
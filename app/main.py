@@ -1,45 +1,206 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from app.routers import auth, users, menus, foods, logs, statistics, votes, scores, comments
-from app.database import init_db
+from app.routers import admin, auth, users, menus, foods, live, logs, statistics, votes, scores, comments
+from app.database import init_db, init_engines, dispose_engines
 from app.config import get_settings
+from app.cores.comment_terms import start_comment_term_rollup, stop_comment_term_rollup
+from app.cores.events import event_bus, start_event_outbox, stop_event_outbox
+from app.cores.idempotency import IdempotencyStore
+from app.cores.leaderboard import start_leaderboard, stop_leaderboard
+from app.cores.live import start_live_hub, stop_live_hub
+from app.cores.logger.config import setup_logger, shutdown_logger
+from app.cores.metrics import render_metrics
+from app.cores.profiling import init_profiler
+from app.cores.score_journal import start_score_journal, stop_score_journal
+from app.cores.search import start_comment_search, stop_comment_search
+from app.cores.security import shutdown_password_executor
+from app.cores.slow_queries import start_slow_query_log, stop_slow_query_log
+from app.cores.tracing import InMemoryExporter, JsonLinesExporter, configure_tracing, instrument_crud, shutdown_tracing
+from app.dependencies.auth import principal_cache
+from app.middlewares.idempotency import IdempotencyMiddleware
 from app.middlewares.logging import LoggingMiddleware
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.profiling import ProfilingMiddleware
+from app.middlewares.queries import QueryCounterMiddleware
+from app.middlewares.tracing import TracingMiddleware, instrument_routes
 
 settings = get_settings()
-init_db()
-
-app = FastAPI(
-    title="My API",
-    description="FastAPI Backend for Food & Menu Management",
-    version="1.0.0"
-)
-
-origins = settings.cors_origin_list
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-app.add_middleware(LoggingMiddleware)
-app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
-app.include_router(users.router, prefix="/api/v1", tags=["users"])
-app.include_router(menus.router, prefix="/api/v1", tags=["menus"])
-app.include_router(foods.router, prefix="/api/v1", tags=["foods"])
-app.include_router(logs.router, prefix="/api/v1", tags=["logs"])
-app.include_router(statistics.router, prefix="/api/v1", tags=["statistics"])
-app.include_router(votes.router, prefix="/api/v1", tags=["votes"])
-app.include_router(scores.router, prefix="/api/v1", tags=["scores"])
-app.include_router(comments.router, prefix="/api/v1", tags=["comments"])
-
-
-@app.get("/api/v1/health", tags=["system"])
-async def health_check():
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    API Health Check 엔드포인트.
-    서버가 정상적으로 실행 중인지 확인하기 위해 사용됨.
+    worker 프로세스 단위로 공유 자원을 생성하고 정리하는 lifespan 핸들러.
+
+    - 시작: DB 엔진/커넥션 풀 생성, slow query log 등록, (`DB_AUTO_CREATE` 시) 테이블 생성, 로그 저장 스레드 시작,
+      이벤트 버스/outbox relay, 점수 저널 replay 및 flusher, 댓글 검색 색인, 댓글 단어 집계, 실시간 통계 전달 task 시작.
+    - 종료: 저널의 점수 저장, 검색 색인 catch-up/단어 집계 종료, 실시간 구독 종료, 비동기 이벤트 구독자 대기 및 outbox 전달 완료 표시, 대기 중인 로그 저장,
+      캐시/해싱/EXPLAIN 스레드 풀 정리, 커넥션 풀 해제.
+
+    서버가 worker를 fork한 뒤 실행되므로 커넥션이 프로세스 간에 공유되지 않습니다.
     """
-    return {"status": "OK"}
+    init_engines()
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        start_slow_query_log(
+            settings.SLOW_QUERY_THRESHOLD_MS,
+            settings.SLOW_QUERY_LOG_SIZE,
+            settings.SLOW_QUERY_EXPLAIN
+        )
+    if settings.DB_AUTO_CREATE:
+        await run_in_threadpool(init_db)
+    setup_logger()
+    event_bus.bind_loop(asyncio.get_running_loop())
+    if settings.EVENT_OUTBOX_ENABLED:
+        start_event_outbox(
+            settings.EVENT_OUTBOX_FLUSH_MS / 1000,
+            settings.EVENT_OUTBOX_REPLAY_AFTER_SECONDS,
+            settings.EVENT_OUTBOX_RETENTION_HOURS * 3600
+        )
+    if settings.SCORE_WRITE_BEHIND:
+        await run_in_threadpool(
+            start_score_journal,
+            settings.SCORE_JOURNAL_DIR,
+            settings.SCORE_JOURNAL_FLUSH_MS / 1000,
+            settings.SCORE_JOURNAL_BATCH_SIZE,
+            settings.SCORE_JOURNAL_MAX_PENDING,
+            settings.SCORE_JOURNAL_FSYNC,
+            settings.SCORE_ID_BLOCK_SIZE
+        )
+    if settings.SEARCH_ENABLED:
+        start_comment_search(settings.SEARCH_REFRESH_SECONDS, settings.SEARCH_BATCH_SIZE)
+    if settings.COMMENT_TERMS_ENABLED:
+        start_comment_term_rollup(settings.COMMENT_TERMS_INTERVAL_SECONDS, settings.COMMENT_TERMS_BATCH_SIZE)
+    if settings.LEADERBOARD_ENABLED:
+        start_leaderboard(
+            settings.LEADERBOARD_PRIOR_WEIGHT,
+            settings.LEADERBOARD_REFRESH_SECONDS,
+            settings.LEADERBOARD_MAX_BOARDS
+        )
+    if settings.LIVE_ENABLED:
+        start_live_hub(
+            settings.LIVE_COALESCE_MS / 1000,
+            settings.LIVE_SLOW_CLIENT_SECONDS,
+            settings.LIVE_MAX_SUBSCRIPTIONS
+        )
+
+    yield
+
+    await run_in_threadpool(stop_score_journal)
+    await run_in_threadpool(stop_comment_search)
+    await run_in_threadpool(stop_comment_term_rollup)
+    stop_leaderboard()
+    await stop_live_hub()
+    await event_bus.close()
+    await stop_event_outbox()
+    shutdown_logger()
+    principal_cache.clear()
+    shutdown_password_executor()
+    stop_slow_query_log()
+    shutdown_tracing()
+    dispose_engines()
+
+
+def create_app() -> FastAPI:
+    """
+    FastAPI 애플리케이션을 생성하는 팩토리 함수.
+
+    미들웨어와 라우터만 등록하며, DB 연결 등 부수 효과는 lifespan에서 수행합니다.
+    `uvicorn --factory app.main:create_app`으로도 실행할 수 있습니다.
+
+    Returns:
+        FastAPI: 설정이 완료된 애플리케이션 객체.
+    """
+    app = FastAPI(
+        title="My API",
+        description="FastAPI Backend for Food & Menu Management",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+
+    origins = settings.cors_origin_list
+
+    if settings.PROFILING_ENABLED:
+        # 가장 안쪽에 등록하여 라우터 처리와 응답 직렬화만 프로파일링합니다.
+        profiler = init_profiler(
+            settings.PROFILING_SECRET or settings.SECRET_KEY,
+            settings.PROFILING_SAMPLE_RATE,
+            settings.PROFILING_MAX_PROFILES
+        )
+        app.add_middleware(ProfilingMiddleware, profiler=profiler)
+    if settings.IDEMPOTENCY_ENABLED:
+        # CORS/로깅 미들웨어 안쪽에 등록하여 보관된 응답과 409/422 응답에도 CORS 헤더가 붙고 로그에 기록되도록 합니다.
+        app.add_middleware(
+            IdempotencyMiddleware,
+            store=IdempotencyStore(
+                settings.IDEMPOTENCY_MAX_KEYS,
+                settings.IDEMPOTENCY_TTL_SECONDS,
+                settings.IDEMPOTENCY_MAX_BODY_BYTES
+            )
+        )
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(LoggingMiddleware)
+    if settings.TRACING_ENABLED:
+        # 로깅 미들웨어보다 바깥에 등록하여 `back_logs`에 추적 ID가 기록되도록 합니다.
+        app.add_middleware(TracingMiddleware, sample_rate=settings.TRACING_SAMPLE_RATE)
+    if settings.SQL_REPEAT_THRESHOLD or settings.sql_debug_headers:
+        app.add_middleware(
+            QueryCounterMiddleware,
+            repeat_threshold=settings.SQL_REPEAT_THRESHOLD,
+            debug_headers=settings.sql_debug_headers
+        )
+    if settings.METRICS_ENABLED:
+        # 가장 바깥에 등록하여 로깅 미들웨어를 포함한 전체 처리 시간을 측정합니다.
+        app.add_middleware(MetricsMiddleware)
+    app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
+    app.include_router(users.router, prefix="/api/v1", tags=["users"])
+    app.include_router(menus.router, prefix="/api/v1", tags=["menus"])
+    app.include_router(foods.router, prefix="/api/v1", tags=["foods"])
+    app.include_router(logs.router, prefix="/api/v1", tags=["logs"])
+    app.include_router(statistics.router, prefix="/api/v1", tags=["statistics"])
+    app.include_router(votes.router, prefix="/api/v1", tags=["votes"])
+    app.include_router(scores.router, prefix="/api/v1", tags=["scores"])
+    app.include_router(comments.router, prefix="/api/v1", tags=["comments"])
+    app.include_router(live.router, prefix="/api/v1", tags=["live"])
+    app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
+
+    if settings.TRACING_ENABLED:
+        configure_tracing(
+            JsonLinesExporter(settings.TRACING_JSONL_PATH)
+            if settings.TRACING_EXPORTER == "jsonl" else InMemoryExporter()
+        )
+        instrument_crud()
+        instrument_routes(app)
+
+    @app.get("/api/v1/health", tags=["system"])
+    async def health_check():
+        """
+        API Health Check 엔드포인트.
+        서버가 정상적으로 실행 중인지 확인하기 위해 사용됨.
+        """
+        return {"status": "OK"}
+
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            """
+            Prometheus scrape 엔드포인트.
+            요청/SQL/커넥션 풀/로그 큐/캐시 metric을 worker 프로세스 단위로 반환함.
+            """
+            return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,131 @@
+import json
+from typing import List
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cores.idempotency import (
+    IdempotencyKeyInUse,
+    IdempotencyKeyMismatch,
+    IdempotencyStore,
+    StoredResponse,
+    request_fingerprint,
+)
+
+
+class IdempotencyMiddleware:
+    """
+    등록 API의 `Idempotency-Key` 헤더를 처리하는 ASGI 미들웨어.
+
+    같은 사용자(`user-id` 헤더)가 같은 경로에 같은 키로 다시 요청하면, 라우터와 DB를 거치지 않고
+    보관된 첫 응답을 헤더까지 `Idempotent-Replayed: true` 헤더와 함께 그대로 반환합니다.
+    이 미들웨어가 직접 보내는 응답에도 CORS 헤더가 붙도록 `CORSMiddleware` 안쪽에 등록해야 합니다.
+
+    - 키를 다른 요청 본문에 재사용하면 422 에러를 반환합니다.
+    - 첫 요청이 처리 중일 때 도착한 재시도에는 409 에러를 반환합니다 (`Retry-After` 포함).
+    - 헤더가 없는 요청은 그대로 처리합니다.
+
+    Attributes:
+        PATHS (frozenset): 키를 처리하는 POST 경로.
+        MAX_KEY_LENGTH (int): 허용하는 키 최대 길이.
+    """
+    PATHS = frozenset({"/api/v1/scores/", "/api/v1/votes/", "/api/v1/comments/"})
+    MAX_KEY_LENGTH = 255
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore) -> None:
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get("idempotency-key")
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > self.MAX_KEY_LENGTH:
+            await self._send_error(send, 400, f"Idempotency-Key must be 1 to {self.MAX_KEY_LENGTH} characters.")
+            return
+
+        body = await self._read_body(receive)
+        fingerprint = request_fingerprint(body)
+        key = (headers.get("user-id", "anonymous"), scope["path"], idempotency_key)
+        try:
+            stored = self.store.begin(key, fingerprint)
+        except IdempotencyKeyMismatch:
+            await self._send_error(send, 422, "Idempotency-Key was already used with a different request body.")
+            return
+        except IdempotencyKeyInUse:
+            await self._send_error(
+                send, 409, "A request with this Idempotency-Key is still in progress.", [(b"retry-after", b"1")]
+            )
+            return
+
+        if stored is not None:
+            await self._send_stored(send, stored)
+            return
+
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        response = {"status": 500, "headers": []}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = [
+                    (name, value) for name, value in message.get("headers", []) if name.lower() != b"content-length"
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self.store.complete(key, StoredResponse(
+                        fingerprint, response["status"], response["headers"], b"".join(chunks)
+                    ))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, capture)
+        finally:
+            # 응답을 끝까지 보내지 못했으면 재시도가 다시 처리되도록 키를 해제합니다.
+            self.store.release(key)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _send_stored(send: Send, stored: StoredResponse) -> None:
+        headers = [
+            *stored.headers,
+            (b"content-length", str(len(stored.body)).encode()),
+            (b"idempotent-replayed", b"true"),
+        ]
+        await send({"type": "http.response.start", "status": stored.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": stored.body})
+
+    @staticmethod
+    async def _send_error(send: Send, status: int, detail: str, extra_headers=()) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        headers = [
+            (b"content-length", str(len(body)).encode()),
+            (b"content-type", b"application/json"),
+            *extra_headers,
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
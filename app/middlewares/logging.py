@@ -5,6 +5,8 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from app.cores.logger.logger import record_log
+from app.cores.tracing import current_trace_id
+from app.models.logs import BackLog
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
@@ -19,8 +21,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
     Attributes:
         EXCLUDE_PATH (List[str]): 로깅 대상에서 제외할 경로 목록 (헬스체크, Swagger 등).
+        STREAM_PREFIX (tuple): 응답을 버퍼링하지 않고 그대로 전달하는 스트리밍 경로 (로그를 남기지 않음).
+        REQUEST_API_MAX_LENGTH (int): `request_api` 컬럼 길이 (쿼리 문자열 포함 여부 판단에 사용).
     """
-    EXCLUDE_PATH = ["/health", "/openapi.json", "/api/v1/health", "/favicon.ico"]
+    EXCLUDE_PATH = ["/health", "/openapi.json", "/api/v1/health", "/favicon.ico", "/metrics"]
+    STREAM_PREFIX = ("/api/v1/live/",)
+    REQUEST_API_MAX_LENGTH = BackLog.request_api.type.length
 
     async def dispatch(self, request: Request, call_next):
         """
@@ -35,8 +41,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         """
         user_id = request.headers.get("user-id", "anonymous")
         request_api = f"{request.method} {request.url.path}"
+        # 트래픽 재생(replay)을 위해 쿼리 문자열도 기록하되, 컬럼 길이를 넘으면 경로만 기록합니다.
+        if request.url.query and len(request_api) + len(request.url.query) < self.REQUEST_API_MAX_LENGTH:
+            request_api = f"{request_api}?{request.url.query}"
         request.state.user_id = user_id
 
+        if request.url.path.startswith(self.STREAM_PREFIX):
+            return await call_next(request)
+
         try:
             request_body = await request.body()
             request_body_decoded = request_body.decode("utf-8") if request_body else None
@@ -57,7 +69,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 media_type=response.media_type
             )
 
-            decoded_body = response_body.decode("utf-8")
+            decoded_body = response_body.decode("utf-8", errors="replace")
             if decoded_body.strip() and request.url.path not in self.EXCLUDE_PATH:
                 try:
                     record_log(
@@ -67,7 +79,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                         request_body=json.loads(request_body_decoded) if request_body_decoded else None,
                         status_code=response.status_code,
                         response=json.loads(decoded_body),
-                        is_success=response.status_code < 400
+                        is_success=response.status_code < 400,
+                        trace_id=current_trace_id()
                     )
                 except json.JSONDecodeError:
                     pass
@@ -0,0 +1,47 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cores.metrics import observe_request
+from app.cores.queries import track_queries
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 수와 처리 시간, 요청별 SQL 문 수와 SQL 실행 시간을 라우트 템플릿 기준으로 기록하는 ASGI 미들웨어.
+
+    경로 파라미터가 포함된 실제 경로(`/menus/2025-03-03`) 대신 라우트 템플릿(`/menus/{date}`)을
+    라벨로 사용하여 metric 수가 요청 경로 수만큼 늘어나지 않도록 합니다.
+    응답 본문을 버퍼링하지 않도록 `BaseHTTPMiddleware` 대신 순수 ASGI로 구현합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                observe_request(
+                    scope["method"],
+                    getattr(route, "path", None) or "unmatched",
+                    status_code,
+                    time.perf_counter() - start,
+                    stats.count,
+                    stats.duration
+                )
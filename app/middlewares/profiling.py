@@ -0,0 +1,60 @@
+import time
+from datetime import datetime
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cores.profiling import Profiler
+
+
+class ProfilingMiddleware:
+    """
+    서명된 `X-Profile` 헤더 또는 샘플링 비율에 따라 요청을 cProfile로 프로파일링하는 ASGI 미들웨어.
+
+    SQL, NumPy 연산, 응답 직렬화가 모두 포함되도록 가장 안쪽에 등록합니다.
+    `PROFILING_ENABLED`가 꺼져 있으면 등록되지 않으므로 오버헤드가 없습니다.
+
+    Attributes:
+        EXCLUDE_PREFIX (tuple): 프로파일링하지 않는 경로 (프로파일 조회 API, 장시간 유지되는 스트리밍 API 등).
+    """
+    EXCLUDE_PREFIX = ("/api/v1/admin/profil", "/api/v1/live/", "/metrics", "/docs", "/openapi.json")
+
+    def __init__(self, app: ASGIApp, profiler: Profiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.EXCLUDE_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        trigger = self.profiler.should_profile(scope["headers"])
+        profile = self.profiler.acquire() if trigger else None
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        started_at = datetime.now()
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            route = scope.get("route")
+            self.profiler.release(
+                profile,
+                method=scope["method"],
+                path=scope["path"],
+                route=getattr(route, "path", None),
+                status_code=status_code,
+                trigger=trigger,
+                started_at=started_at,
+                duration_ms=round(duration_ms, 3)
+            )
@@ -0,0 +1,49 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cores.queries import track_queries
+
+sql_logger = logging.getLogger("app.sql")
+
+
+class QueryCounterMiddleware:
+    """
+    요청마다 실행된 SQL 문 수를 집계하고 N+1 패턴을 감지하는 ASGI 미들웨어.
+
+    - 같은 형태(정규화 기준)의 SQL 문이 `repeat_threshold`번 이상 실행되면 경고 로그를 남깁니다.
+    - `debug_headers`가 켜져 있으면 응답에 `X-SQL-Count`, `X-SQL-Time-Ms`, `X-SQL-Max-Repeat` 헤더를 추가합니다.
+
+    Attributes:
+        repeat_threshold (int): N+1 경고 기준 반복 횟수 (0이면 감지하지 않음).
+        debug_headers (bool): 응답 헤더 추가 여부.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 10, debug_headers: bool = False) -> None:
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        self.debug_headers = debug_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-SQL-Count"] = str(stats.count)
+                    headers["X-SQL-Time-Ms"] = f"{stats.duration * 1000:.3f}"
+                    headers["X-SQL-Max-Repeat"] = str(stats.max_repeat)
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers if self.debug_headers else send)
+
+        if self.repeat_threshold:
+            for statement, count in stats.repeated(self.repeat_threshold):
+                sql_logger.warning(
+                    "Possible N+1 query on %s %s: %d executions of %s",
+                    scope["method"], scope["path"], count, statement
+                )
@@ -0,0 +1,122 @@
+import functools
+import inspect
+import random
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cores.tracing import record_span, start_trace, trace_span
+
+# 라우터 핸들러가 끝난 시각 (직렬화 구간의 시작)
+_handler_finished: ContextVar[Optional[List[float]]] = ContextVar("handler_finished", default=None)
+
+
+class TracingMiddleware:
+    """
+    요청마다 추적(trace)을 시작하고 응답에 `X-Trace-Id` 헤더를 추가하는 ASGI 미들웨어.
+
+    로깅 미들웨어가 `back_logs`에 추적 ID를 기록할 수 있도록 로깅 미들웨어보다 바깥에 등록합니다.
+
+    Attributes:
+        sample_rate (float): 추적할 요청 비율 (0~1).
+        EXCLUDE_PATH (tuple): 추적하지 않는 경로.
+    """
+    EXCLUDE_PATH = ("/health", "/api/v1/health", "/metrics", "/openapi.json", "/favicon.ico")
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] in self.EXCLUDE_PATH
+            or (self.sample_rate < 1.0 and random.random() >= self.sample_rate)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        with start_trace(f"{scope['method']} {scope['path']}", method=scope["method"], path=scope["path"]) as span:
+            async def send_with_trace_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.attributes["status_code"] = message["status"]
+                    MutableHeaders(scope=message)["X-Trace-Id"] = span.trace_id
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = scope.get("route")
+                if getattr(route, "path", None):
+                    span.name = f"{scope['method']} {route.path}"
+                    span.attributes["route"] = route.path
+
+
+class _TracedRouteApp:
+    """라우트 ASGI 앱을 감싸 핸들러 종료부터 응답 시작까지를 `serialize` 구간으로 기록합니다."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        finished: List[float] = []
+        token = _handler_finished.set(finished)
+
+        async def send_with_serialize_span(message: Message) -> None:
+            if message["type"] == "http.response.start" and finished:
+                duration = time.perf_counter() - finished[0]
+                record_span("serialize", "serialize", time.time() - duration, duration)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_serialize_span)
+        finally:
+            _handler_finished.reset(token)
+
+
+def _traced_handler(func: Callable, name: str) -> Callable:
+    def mark_finished() -> None:
+        finished = _handler_finished.get()
+        if finished is not None:
+            finished.append(time.perf_counter())
+
+    # FastAPI는 라우트 생성 시점에 핸들러의 동기/비동기 여부를 판단하므로 같은 종류의 함수로 감쌉니다.
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def handler(*args, **kwargs):
+            try:
+                with trace_span(name, "handler"):
+                    return await func(*args, **kwargs)
+            finally:
+                mark_finished()
+    else:
+        @functools.wraps(func)
+        def handler(*args, **kwargs):
+            try:
+                with trace_span(name, "handler"):
+                    return func(*args, **kwargs)
+            finally:
+                mark_finished()
+    handler.__traced__ = True
+    return handler
+
+
+def instrument_routes(app: FastAPI) -> None:
+    """
+    등록된 모든 API 라우트의 핸들러를 `handler` 구간으로 감싸고, 응답 직렬화 구간을 기록하도록 합니다.
+
+    라우터를 모두 등록한 뒤 호출해야 하며, 여러 번 호출해도 한 번만 적용됩니다.
+
+    Args:
+        app (FastAPI): 대상 애플리케이션.
+    """
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or getattr(route.dependant.call, "__traced__", False):
+            continue
+        route.dependant.call = _traced_handler(route.dependant.call, f"{route.endpoint.__module__}.{route.name}")
+        route.app = _TracedRouteApp(route.app)
@@ -0,0 +1,75 @@
+"""
+스키마 마이그레이션 CLI.
+
+애플리케이션 import/기동 시에는 실행되지 않으며, 배포 절차에서 명시적으로 실행합니다.
+
+사용법:
+    python -m app.migrations status
+    python -m app.migrations upgrade [--to REVISION] [--create-tables]
+    python -m app.migrations downgrade --to REVISION|base
+    python -m app.migrations verify
+"""
+import argparse
+import sys
+
+from app.database import get_engine
+from app.migrations import runner
+from app.models import Base
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations", description="Database schema migrations.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="적용 현황 조회")
+    subparsers.add_parser("verify", help="적용된 마이그레이션을 EXPLAIN으로 검증")
+
+    upgrade_parser = subparsers.add_parser("upgrade", help="마이그레이션 적용")
+    upgrade_parser.add_argument("--to", help="이 버전까지만 적용")
+    upgrade_parser.add_argument("--create-tables", action="store_true", help="누락된 테이블을 먼저 생성")
+
+    downgrade_parser = subparsers.add_parser("downgrade", help="마이그레이션 되돌리기")
+    downgrade_parser.add_argument("--to", required=True, help="남겨둘 마지막 버전 (base: 모두 되돌림)")
+
+    args = parser.parse_args()
+    engine = get_engine()
+
+    if args.command == "status":
+        applied = runner.applied_revisions(engine)
+        for migration in runner.load_migrations():
+            applied_at = applied.get(migration.revision)
+            state = f"applied {applied_at:%Y-%m-%d %H:%M:%S}" if applied_at else "pending"
+            print(f"{migration.revision}  {migration.description:<40} {state}")
+
+    elif args.command == "verify":
+        applied = runner.applied_revisions(engine)
+        failed = False
+        for migration in runner.load_migrations():
+            if migration.revision not in applied:
+                continue
+            problems = runner.verify(engine, migration)
+            print(f"{migration.revision}  {'OK' if not problems else 'FAILED'}")
+            for problem in problems:
+                print(f"    {problem}")
+            failed = failed or bool(problems)
+        return 1 if failed else 0
+
+    elif args.command == "upgrade":
+        if args.create_tables:
+            Base.metadata.create_all(bind=engine)
+        try:
+            upgraded = runner.upgrade(engine, args.to)
+        except RuntimeError as error:
+            print(error, file=sys.stderr)
+            return 1
+        print("Applied: " + (", ".join(upgraded) if upgraded else "nothing to apply"))
+
+    elif args.command == "downgrade":
+        downgraded = runner.downgrade(engine, args.to)
+        print("Reverted: " + (", ".join(downgraded) if downgraded else "nothing to revert"))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
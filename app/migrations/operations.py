@@ -0,0 +1,210 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Column, Index, MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection
+
+
+def create_table(conn: Connection, table: Table) -> bool:
+    """
+    테이블이 없으면 생성합니다 (테이블에 정의된 인덱스 포함).
+
+    Args:
+        conn (Connection): DB 커넥션.
+        table (Table): 생성할 테이블 정의.
+
+    Returns:
+        bool: 새로 생성했으면 `True`, 이미 존재하면 `False`.
+    """
+    if inspect(conn).has_table(table.name):
+        return False
+
+    table.create(bind=conn)
+    return True
+
+
+def drop_table(conn: Connection, table_name: str) -> bool:
+    """
+    테이블이 있으면 삭제합니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        table_name (str): 테이블 이름.
+
+    Returns:
+        bool: 삭제했으면 `True`, 존재하지 않으면 `False`.
+    """
+    if not inspect(conn).has_table(table_name):
+        return False
+
+    Table(table_name, MetaData(), autoload_with=conn).drop(bind=conn)
+    return True
+
+
+def index_exists(conn: Connection, table_name: str, index_name: str) -> bool:
+    """
+    테이블에 지정한 이름의 인덱스가 존재하는지 확인합니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        table_name (str): 테이블 이름.
+        index_name (str): 인덱스 이름.
+
+    Returns:
+        bool: 인덱스가 존재하면 `True`.
+    """
+    return any(index["name"] == index_name for index in inspect(conn).get_indexes(table_name))
+
+
+def create_index(conn: Connection, index_name: str, table_name: str, columns: Sequence[str]) -> bool:
+    """
+    인덱스가 없으면 생성합니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        index_name (str): 인덱스 이름.
+        table_name (str): 테이블 이름.
+        columns (Sequence[str]): 인덱스 컬럼 목록 (순서 유지).
+
+    Returns:
+        bool: 새로 생성했으면 `True`, 이미 존재하면 `False`.
+    """
+    if index_exists(conn, table_name, index_name):
+        return False
+
+    table = Table(table_name, MetaData(), autoload_with=conn)
+    Index(index_name, *(table.c[column] for column in columns)).create(bind=conn)
+    return True
+
+
+def drop_index(conn: Connection, index_name: str, table_name: str) -> bool:
+    """
+    인덱스가 있으면 삭제합니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        index_name (str): 인덱스 이름.
+        table_name (str): 테이블 이름.
+
+    Returns:
+        bool: 삭제했으면 `True`, 존재하지 않으면 `False`.
+    """
+    if not index_exists(conn, table_name, index_name):
+        return False
+
+    table = Table(table_name, MetaData(), autoload_with=conn)
+    Index(index_name, _table=table).drop(bind=conn)
+    return True
+
+
+def column_exists(conn: Connection, table_name: str, column_name: str) -> bool:
+    """
+    테이블에 지정한 이름의 컬럼이 존재하는지 확인합니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        table_name (str): 테이블 이름.
+        column_name (str): 컬럼 이름.
+
+    Returns:
+        bool: 컬럼이 존재하면 `True`.
+    """
+    return any(column["name"] == column_name for column in inspect(conn).get_columns(table_name))
+
+
+def add_column(conn: Connection, table_name: str, column: Column) -> bool:
+    """
+    컬럼이 없으면 추가합니다. 기존 행에는 NULL이 채워지므로 nullable 컬럼만 추가할 수 있습니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        table_name (str): 테이블 이름.
+        column (Column): 추가할 컬럼 정의.
+
+    Returns:
+        bool: 새로 추가했으면 `True`, 이미 존재하면 `False`.
+    """
+    if column_exists(conn, table_name, column.name):
+        return False
+
+    preparer = conn.dialect.identifier_preparer
+    column_type = column.type.compile(dialect=conn.dialect)
+    conn.execute(text(
+        f"ALTER TABLE {preparer.quote(table_name)} ADD COLUMN {preparer.quote(column.name)} {column_type} NULL"
+    ))
+    return True
+
+
+def drop_column(conn: Connection, table_name: str, column_name: str) -> bool:
+    """
+    컬럼이 있으면 삭제합니다. 컬럼을 사용하는 인덱스는 먼저 삭제해야 합니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        table_name (str): 테이블 이름.
+        column_name (str): 컬럼 이름.
+
+    Returns:
+        bool: 삭제했으면 `True`, 존재하지 않으면 `False`.
+    """
+    if not column_exists(conn, table_name, column_name):
+        return False
+
+    preparer = conn.dialect.identifier_preparer
+    conn.execute(text(f"ALTER TABLE {preparer.quote(table_name)} DROP COLUMN {preparer.quote(column_name)}"))
+    return True
+
+
+def explain(conn: Connection, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    쿼리의 실행 계획을 조회합니다.
+
+    - MySQL: `EXPLAIN <sql>`
+    - SQLite: `EXPLAIN QUERY PLAN <sql>`
+
+    Args:
+        conn (Connection): DB 커넥션.
+        sql (str): 실행 계획을 확인할 SELECT 문.
+        params (Optional[Dict[str, Any]]): 바인딩 파라미터.
+
+    Returns:
+        List[Dict[str, Any]]: 실행 계획 행 목록.
+    """
+    prefix = "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite" else "EXPLAIN"
+    result = conn.execute(text(f"{prefix} {sql}"), params or {})
+    return [dict(row._mapping) for row in result]
+
+
+def explain_uses_index(
+    conn: Connection,
+    index_name: str,
+    sql: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
+    """
+    쿼리 실행 계획이 지정한 인덱스를 사용하는지 검사합니다.
+
+    MySQL은 통계가 부족한 작은 테이블에서 인덱스 대신 전체 스캔을 고를 수 있으므로,
+    `key`로 선택되지 않았더라도 `possible_keys` 후보에 있으면 통과로 봅니다.
+
+    Args:
+        conn (Connection): DB 커넥션.
+        index_name (str): 사용되어야 하는 인덱스 이름.
+        sql (str): 검사할 SELECT 문.
+        params (Optional[Dict[str, Any]]): 바인딩 파라미터.
+
+    Returns:
+        Optional[str]: 문제가 없으면 `None`, 있으면 실행 계획을 포함한 오류 메시지.
+    """
+    plan = explain(conn, sql, params)
+
+    if conn.dialect.name == "sqlite":
+        if any(index_name in str(row.get("detail", "")) for row in plan):
+            return None
+    else:
+        for row in plan:
+            if row.get("key") == index_name:
+                return None
+            if index_name in str(row.get("possible_keys") or "").split(","):
+                return None
+
+    return f"{index_name} is not used by `{sql}`: {plan}"
@@ -0,0 +1,151 @@
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from datetime import datetime
+from types import ModuleType
+from typing import Dict, List, Optional
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Engine
+
+from app.migrations import versions
+
+# 적용된 마이그레이션 버전을 기록하는 테이블
+migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass
+class Migration:
+    """
+    마이그레이션 한 건.
+
+    각 버전 모듈은 `REVISION`, `DESCRIPTION`, `upgrade(conn)`, `downgrade(conn)`,
+    `verify(conn) -> List[str]`을 정의합니다.
+
+    Attributes:
+        revision (str): 버전 (정렬 순서대로 적용).
+        description (str): 설명.
+        module (ModuleType): 버전 모듈.
+    """
+    revision: str
+    description: str
+    module: ModuleType
+
+
+def load_migrations() -> List[Migration]:
+    """
+    `app.migrations.versions` 패키지의 모든 마이그레이션을 버전 순으로 불러옵니다.
+
+    Returns:
+        List[Migration]: 버전 오름차순 마이그레이션 목록.
+    """
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        migrations.append(Migration(module.REVISION, module.DESCRIPTION, module))
+    return sorted(migrations, key=lambda migration: migration.revision)
+
+
+def applied_revisions(engine: Engine) -> Dict[str, datetime]:
+    """
+    적용된 마이그레이션 버전과 적용 시각을 조회합니다.
+
+    Args:
+        engine (Engine): 대상 DB 엔진.
+
+    Returns:
+        Dict[str, datetime]: 버전 -> 적용 시각.
+    """
+    migration_metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        rows = conn.execute(select(schema_migrations.c.version, schema_migrations.c.applied_at)).all()
+    return {version: applied_at for version, applied_at in rows}
+
+
+def verify(engine: Engine, migration: Migration) -> List[str]:
+    """
+    마이그레이션의 EXPLAIN 기반 검증을 실행합니다.
+
+    Args:
+        engine (Engine): 대상 DB 엔진.
+        migration (Migration): 검증할 마이그레이션.
+
+    Returns:
+        List[str]: 발견된 문제 목록 (없으면 빈 리스트).
+    """
+    with engine.connect() as conn:
+        return migration.module.verify(conn)
+
+
+def upgrade(engine: Engine, target: Optional[str] = None) -> List[str]:
+    """
+    적용되지 않은 마이그레이션을 순서대로 적용하고 각각 검증합니다.
+
+    Args:
+        engine (Engine): 대상 DB 엔진.
+        target (Optional[str]): 이 버전까지만 적용. 없으면 최신까지 적용.
+
+    Returns:
+        List[str]: 새로 적용된 버전 목록.
+
+    Raises:
+        RuntimeError: 적용 후 검증에 실패한 경우.
+    """
+    applied = applied_revisions(engine)
+    if not {"menus", "foods", "scores", "votes", "comments", "users"} <= set(inspect(engine).get_table_names()):
+        raise RuntimeError("Base tables do not exist. Run with --create-tables first.")
+
+    upgraded = []
+    for migration in load_migrations():
+        if migration.revision in applied:
+            continue
+        if target is not None and migration.revision > target:
+            break
+
+        with engine.begin() as conn:
+            migration.module.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=migration.revision,
+                description=migration.description,
+                applied_at=datetime.now()
+            ))
+        upgraded.append(migration.revision)
+
+        problems = verify(engine, migration)
+        if problems:
+            raise RuntimeError(f"Migration {migration.revision} failed verification:\n" + "\n".join(problems))
+
+    return upgraded
+
+
+def downgrade(engine: Engine, target: str) -> List[str]:
+    """
+    `target` 이후에 적용된 마이그레이션을 역순으로 되돌립니다.
+
+    Args:
+        engine (Engine): 대상 DB 엔진.
+        target (str): 남겨둘 마지막 버전 (`base`이면 모두 되돌림).
+
+    Returns:
+        List[str]: 되돌린 버전 목록.
+    """
+    applied = applied_revisions(engine)
+
+    downgraded = []
+    for migration in reversed(load_migrations()):
+        if migration.revision not in applied or (target != "base" and migration.revision <= target):
+            continue
+
+        with engine.begin() as conn:
+            migration.module.downgrade(conn)
+            conn.execute(schema_migrations.delete().where(schema_migrations.c.version == migration.revision))
+        downgraded.append(migration.revision)
+
+    return downgraded
@@ -0,0 +1,71 @@
+"""
+CRUD 계층의 주요 조회 경로에 필요한 인덱스를 추가합니다.
+"""
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import create_index, drop_index, explain_uses_index
+
+REVISION = "0001"
+DESCRIPTION = "hot path indexes"
+
+# (인덱스 이름, 테이블, 컬럼, 인덱스를 사용해야 하는 대표 쿼리, 파라미터)
+_NOW = datetime(2025, 1, 1)
+INDEXES = [
+    (
+        "ix_scores_food_id_created_at", "scores", ("food_id", "created_at"),
+        "SELECT user_id, score FROM scores WHERE food_id = :food_id AND created_at >= :start AND created_at < :end",
+        {"food_id": 1, "start": _NOW, "end": _NOW + timedelta(days=1)},
+    ),
+    (
+        "ix_scores_user_id_food_id_id", "scores", ("user_id", "food_id", "id"),
+        "SELECT id FROM scores WHERE user_id = :user_id AND food_id = :food_id ORDER BY id DESC LIMIT 1",
+        {"user_id": "user", "food_id": 1},
+    ),
+    (
+        "ix_votes_menu_id_user_id", "votes", ("menu_id", "user_id"),
+        "SELECT id FROM votes WHERE menu_id = :menu_id AND user_id = :user_id",
+        {"menu_id": 1, "user_id": "user"},
+    ),
+    (
+        "ix_comments_user_id_menu_id_id", "comments", ("user_id", "menu_id", "id"),
+        "SELECT id FROM comments WHERE user_id = :user_id AND menu_id = :menu_id ORDER BY id DESC LIMIT 1",
+        {"user_id": "user", "menu_id": 1},
+    ),
+    (
+        "ix_menus_created_at", "menus", ("created_at",),
+        "SELECT id FROM menus WHERE created_at >= :start AND created_at < :end",
+        {"start": _NOW, "end": _NOW + timedelta(days=1)},
+    ),
+    (
+        "ix_foods_name", "foods", ("name",),
+        "SELECT id FROM foods WHERE name = :name",
+        {"name": "food"},
+    ),
+    (
+        "ix_users_username", "users", ("username",),
+        "SELECT id FROM users WHERE username = :username",
+        {"username": "user"},
+    ),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for index_name, table_name, columns, _, _ in INDEXES:
+        create_index(conn, index_name, table_name, columns)
+
+
+def downgrade(conn: Connection) -> None:
+    for index_name, table_name, _, _, _ in INDEXES:
+        drop_index(conn, index_name, table_name)
+
+
+def verify(conn: Connection) -> List[str]:
+    problems = []
+    for index_name, _, _, sql, params in INDEXES:
+        problem = explain_uses_index(conn, index_name, sql, params)
+        if problem:
+            problems.append(problem)
+    return problems
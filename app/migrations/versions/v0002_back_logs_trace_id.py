@@ -0,0 +1,31 @@
+"""
+`back_logs`에 요청 추적 ID(`trace_id`) 컬럼과 인덱스를 추가합니다.
+"""
+from typing import List
+
+from sqlalchemy import Column, String
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import add_column, create_index, drop_column, drop_index, explain_uses_index
+
+REVISION = "0002"
+DESCRIPTION = "back_logs trace_id"
+
+INDEX_NAME = "ix_back_logs_trace_id"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "back_logs", Column("trace_id", String(32), nullable=True))
+    create_index(conn, INDEX_NAME, "back_logs", ("trace_id",))
+
+
+def downgrade(conn: Connection) -> None:
+    drop_index(conn, INDEX_NAME, "back_logs")
+    drop_column(conn, "back_logs", "trace_id")
+
+
+def verify(conn: Connection) -> List[str]:
+    problem = explain_uses_index(
+        conn, INDEX_NAME, "SELECT id FROM back_logs WHERE trace_id = :trace_id", {"trace_id": "0" * 32}
+    )
+    return [problem] if problem else []
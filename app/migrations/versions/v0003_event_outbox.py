@@ -0,0 +1,39 @@
+"""
+도메인 이벤트 outbox 테이블(`event_outbox`)을 추가합니다 (`EVENT_OUTBOX_ENABLED` 사용 시 필요).
+"""
+from typing import List
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, MetaData, String, Table
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import create_table, drop_table, explain_uses_index
+
+REVISION = "0003"
+DESCRIPTION = "event outbox"
+
+INDEX_NAME = "ix_event_outbox_dispatched_at_id"
+
+
+def upgrade(conn: Connection) -> None:
+    table = Table(
+        "event_outbox",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("event_type", String(50), nullable=False),
+        Column("payload", JSON, nullable=False),
+        Column("created_at", DateTime, nullable=False),
+        Column("dispatched_at", DateTime, nullable=True),
+        Index(INDEX_NAME, "dispatched_at", "id"),
+    )
+    create_table(conn, table)
+
+
+def downgrade(conn: Connection) -> None:
+    drop_table(conn, "event_outbox")
+
+
+def verify(conn: Connection) -> List[str]:
+    problem = explain_uses_index(
+        conn, INDEX_NAME, "SELECT id FROM event_outbox WHERE dispatched_at IS NULL ORDER BY id LIMIT 10"
+    )
+    return [problem] if problem else []
@@ -0,0 +1,30 @@
+"""
+DB 저장 전 ID 발급을 위한 ID 블록 예약 테이블(`id_blocks`)을 추가합니다 (`SCORE_WRITE_BEHIND` 사용 시 필요).
+"""
+from typing import List
+
+from sqlalchemy import BigInteger, Column, MetaData, String, Table
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import create_table, drop_table
+
+REVISION = "0004"
+DESCRIPTION = "id blocks"
+
+
+def upgrade(conn: Connection) -> None:
+    table = Table(
+        "id_blocks",
+        MetaData(),
+        Column("name", String(50), primary_key=True),
+        Column("next_id", BigInteger, nullable=False),
+    )
+    create_table(conn, table)
+
+
+def downgrade(conn: Connection) -> None:
+    drop_table(conn, "id_blocks")
+
+
+def verify(conn: Connection) -> List[str]:
+    return []
@@ -0,0 +1,30 @@
+"""
+메뉴별 댓글 목록(keyset pagination)에 필요한 `comments (menu_id, id)` 인덱스를 추가합니다.
+"""
+from typing import List
+
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import create_index, drop_index, explain_uses_index
+
+REVISION = "0005"
+DESCRIPTION = "comments menu_id id index"
+
+INDEX_NAME = "ix_comments_menu_id_id"
+
+
+def upgrade(conn: Connection) -> None:
+    create_index(conn, INDEX_NAME, "comments", ("menu_id", "id"))
+
+
+def downgrade(conn: Connection) -> None:
+    drop_index(conn, INDEX_NAME, "comments")
+
+
+def verify(conn: Connection) -> List[str]:
+    problem = explain_uses_index(
+        conn, INDEX_NAME,
+        "SELECT id FROM comments WHERE menu_id = :menu_id AND id < :before ORDER BY id DESC LIMIT 21",
+        {"menu_id": 1, "before": 100}
+    )
+    return [problem] if problem else []
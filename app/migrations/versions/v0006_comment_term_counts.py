@@ -0,0 +1,49 @@
+"""
+댓글 단어 집계 테이블(`comment_term_counts`)과 집계 진행 위치 테이블(`rollup_checkpoints`)을 추가합니다
+(`COMMENT_TERMS_ENABLED` 사용 시 필요).
+"""
+from datetime import date
+from typing import List
+
+from sqlalchemy import BigInteger, Column, Date, Index, Integer, MetaData, String, Table
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import create_table, drop_table, explain_uses_index
+
+REVISION = "0006"
+DESCRIPTION = "comment term counts"
+
+INDEX_NAME = "ix_comment_term_counts_day"
+
+
+def upgrade(conn: Connection) -> None:
+    metadata = MetaData()
+    create_table(conn, Table(
+        "comment_term_counts",
+        metadata,
+        Column("menu_id", Integer, primary_key=True),
+        Column("day", Date, primary_key=True),
+        Column("term", String(50), primary_key=True),
+        Column("count", Integer, nullable=False),
+        Index(INDEX_NAME, "day"),
+    ))
+    create_table(conn, Table(
+        "rollup_checkpoints",
+        metadata,
+        Column("name", String(50), primary_key=True),
+        Column("last_id", BigInteger, nullable=False),
+    ))
+
+
+def downgrade(conn: Connection) -> None:
+    drop_table(conn, "rollup_checkpoints")
+    drop_table(conn, "comment_term_counts")
+
+
+def verify(conn: Connection) -> List[str]:
+    problem = explain_uses_index(
+        conn, INDEX_NAME,
+        "SELECT term, SUM(count) FROM comment_term_counts WHERE day >= :start AND day <= :end GROUP BY term",
+        {"start": date(2025, 1, 1), "end": date(2025, 1, 7)}
+    )
+    return [problem] if problem else []
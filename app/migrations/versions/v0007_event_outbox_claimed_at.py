@@ -0,0 +1,24 @@
+"""
+`event_outbox`에 재전달 선점 시각(`claimed_at`) 컬럼을 추가합니다.
+"""
+from typing import List
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import add_column, drop_column
+
+REVISION = "0007"
+DESCRIPTION = "event_outbox claimed_at"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "event_outbox", Column("claimed_at", DateTime, nullable=True))
+
+
+def downgrade(conn: Connection) -> None:
+    drop_column(conn, "event_outbox", "claimed_at")
+
+
+def verify(conn: Connection) -> List[str]:
+    return []
@@ -0,0 +1,37 @@
+"""
+SQLAlchemy 모델 패키지.
+
+패키지를 불러오면 모든 모델 모듈이 함께 불러와져 `Base.metadata`에 전체 테이블이 등록됩니다.
+마이그레이션 CLI나 벤치마크 데이터 생성처럼 전체 스키마가 필요한 곳은 `from app.models import Base`를 사용합니다.
+"""
+from app.database import Base
+from app.models import (
+    comment_terms,
+    comments,
+    events,
+    food_menu,
+    foods,
+    id_blocks,
+    logs,
+    menus,
+    roles,
+    scores,
+    users,
+    votes,
+)
+
+__all__ = [
+    "Base",
+    "comment_terms",
+    "comments",
+    "events",
+    "food_menu",
+    "foods",
+    "id_blocks",
+    "logs",
+    "menus",
+    "roles",
+    "scores",
+    "users",
+    "votes",
+]
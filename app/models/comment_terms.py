@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Integer, String, Date, BigInteger, Index
+from app.database import Base
+
+
+class CommentTermCount(Base):
+    """
+    CommentTermCount (댓글 단어 집계) 테이블 모델.
+
+    댓글을 단어로 나누어 (메뉴, 작성 날짜, 단어)별로 그 단어를 포함한 댓글 수를 누적합니다.
+    기간별 상위 단어 조회 시 댓글 내용을 다시 읽지 않습니다.
+
+    Attributes:
+        menu_id (Integer): 댓글이 달린 메뉴 ID (Primary Key)
+        day (Date): 댓글 작성 날짜 (Primary Key)
+        term (String(50)): 단어 (소문자, Primary Key)
+        count (Integer): 단어를 포함한 댓글 수
+    """
+    __tablename__ = "comment_term_counts"
+    __table_args__ = (
+        Index("ix_comment_term_counts_day", "day"),
+    )
+
+    menu_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    term = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """객체 정보를 문자열로 반환 (디버깅용)."""
+        return f"<CommentTermCount(menu_id={self.menu_id}, day={self.day}, term='{self.term}', count={self.count})>"
+
+
+class RollupCheckpoint(Base):
+    """
+    RollupCheckpoint (집계 진행 위치) 테이블 모델.
+
+    집계 작업이 마지막으로 반영한 원본 행 ID를 기록합니다. 집계 반영과 같은 트랜잭션에서
+    조건부로 갱신하여, 여러 worker가 동시에 실행해도 같은 행이 두 번 집계되지 않습니다.
+
+    Attributes:
+        name (String(50)): 집계 이름 (`comment_terms` 등, Primary Key)
+        last_id (BigInteger): 마지막으로 집계한 원본 행 ID
+    """
+    __tablename__ = "rollup_checkpoints"
+
+    name = Column(String(50), primary_key=True)
+    last_id = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        """객체 정보를 문자열로 반환 (디버깅용)."""
+        return f"<RollupCheckpoint(name='{self.name}', last_id={self.last_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -16,6 +16,10 @@ class Comment(Base):
         menu (Menu): 해당 댓글이 달린 메뉴 객체 (1:N 관계)
     """
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_user_id_menu_id_id", "user_id", "menu_id", "id"),
+        Index("ix_comments_menu_id_id", "menu_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(100), nullable=False)
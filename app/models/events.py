@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from app.database import Base
+
+
+class OutboxEvent(Base):
+    """
+    OutboxEvent (도메인 이벤트 outbox) 테이블 모델.
+
+    `EVENT_OUTBOX_ENABLED`가 켜져 있으면 도메인 이벤트를 쓰기와 같은 트랜잭션에 기록하여,
+    커밋 직후 프로세스가 종료되어 구독자에게 전달되지 못한 이벤트를 다시 전달할 수 있도록 합니다.
+
+    Attributes:
+        id (Integer): 이벤트 고유 ID (Primary Key)
+        event_type (String(50)): 이벤트 타입 이름 (`ScoreCreated` 등)
+        payload (JSON): 이벤트 필드
+        created_at (DateTime): 이벤트 기록 시간
+        dispatched_at (DateTime): 구독자에게 전달된 시간 (전달 전이면 NULL)
+        claimed_at (DateTime): relay가 재전달을 위해 선점한 시간 (`EVENT_OUTBOX_REPLAY_AFTER_SECONDS`가 지나면 만료)
+    """
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        Index("ix_event_outbox_dispatched_at_id", "dispatched_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    dispatched_at = Column(DateTime, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        """객체 정보를 문자열로 반환 (디버깅용)."""
+        return f"<OutboxEvent(id={self.id}, event_type='{self.event_type}', dispatched_at={self.dispatched_at})>"
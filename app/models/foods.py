@@ -16,7 +16,7 @@ class Food(Base):
     __tablename__ = "foods"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False, index=True)
 
     menus = relationship("Menu", secondary=food_menu_table, back_populates="foods", lazy="selectin")
     scores = relationship("Score", back_populates="food", lazy="selectin")
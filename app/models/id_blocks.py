@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, BigInteger
+from app.database import Base
+
+
+class IdBlock(Base):
+    """
+    IdBlock (ID 블록 예약) 테이블 모델.
+
+    DB에 저장하기 전에 ID를 발급해야 하는 쓰기(점수 write-behind 등)를 위해,
+    worker가 다음 ID부터 일정 개수의 ID 블록을 예약합니다.
+
+    Attributes:
+        name (String(50)): 대상 이름 (`scores` 등, Primary Key)
+        next_id (BigInteger): 다음에 예약할 ID
+    """
+    __tablename__ = "id_blocks"
+
+    name = Column(String(50), primary_key=True)
+    next_id = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        """객체 정보를 문자열로 반환 (디버깅용)."""
+        return f"<IdBlock(name='{self.name}', next_id={self.next_id})>"
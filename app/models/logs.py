@@ -46,6 +46,7 @@ class BackLog(Base):
         status_code (Integer): HTTP 응답 상태 코드
         response (JSON): 응답 본문 (JSON 형식)
         is_success (Boolean): 요청 성공 여부 (`True`/`False`)
+        trace_id (String(32)): 요청의 추적 ID (`TRACING_ENABLED` 시, `X-Trace-Id` 응답 헤더와 동일)
         time (DateTime): 로그 기록 시간
     """
     __tablename__ = "back_logs"
@@ -58,6 +59,7 @@ class BackLog(Base):
     status_code = Column(Integer, nullable=False)
     response = Column(JSON, nullable=False)
     is_success = Column(Boolean, nullable=False)
+    trace_id = Column(String(32), nullable=True, index=True)
     time = Column(DateTime, default=datetime.now)
 
     def __repr__(self):
@@ -18,7 +18,7 @@ class Menu(Base):
     __tablename__ = "menus"
 
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, index=True)
 
     foods = relationship("Food", secondary=food_menu_table, back_populates="menus", lazy="selectin")
     comments = relationship("Comment", back_populates="menu", lazy="selectin")
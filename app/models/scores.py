@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -16,6 +16,10 @@ class Score(Base):
         food (Food): 해당 점수 매겨진 음식 객체 (1:N 관계)
     """
     __tablename__ = "scores"
+    __table_args__ = (
+        Index("ix_scores_food_id_created_at", "food_id", "created_at"),
+        Index("ix_scores_user_id_food_id_id", "user_id", "food_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(100), nullable=False)
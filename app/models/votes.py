@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -15,6 +15,9 @@ class Vote(Base):
         menu (Menu): 투표한 메뉴 객체 (1:N 관계)
     """
     __tablename__ = "votes"
+    __table_args__ = (
+        Index("ix_votes_menu_id_user_id", "menu_id", "user_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(100), nullable=False)
@@ -0,0 +1,298 @@
+import time
+from datetime import date, datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, Response
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.cores.profiling import Profiler, get_profiler, sign_profile_token
+from app.cores.search import CommentSearch, contains_query, get_comment_search
+from app.cores.slow_queries import SlowQueryLog, get_slow_query_log
+from app.crud import comments
+from app.database import get_engine, get_read_db
+from app.dependencies.auth import get_current_admin
+from app.schemas.admin import (
+    PoolStatusResponse,
+    ProfileResponse,
+    ProfileTokenResponse,
+    ProfilingSettingsResponse,
+    ProfilingSettingsUpdateRequest,
+    SlowQueryResponse,
+)
+from app.schemas.comments import CommentSearchHit, CommentSearchResponse
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(get_current_admin)],
+    responses={403: {"description": "Admins only"}},
+)
+
+
+@router.get("/db/pool", response_model=PoolStatusResponse, status_code=status.HTTP_200_OK)
+async def get_pool_status():
+    """
+    DB 커넥션 풀의 실시간 상태와 누적 체크아웃 대기 통계를 조회하는 API (관리자 권한 필요).
+
+    `checked_out`, `overflow`, 대기 시간 통계를 근거로
+    `DB_POOL_SIZE`, `DB_MAX_OVERFLOW` 값을 조정할 수 있습니다.
+
+    Returns:
+        PoolStatusResponse: 커넥션 풀 상태 및 대기 통계.
+
+    Raises:
+        HTTPException: 커넥션 풀을 사용하지 않는 DB(인메모리 SQLite)인 경우 (404).
+    """
+    pool = get_engine().pool
+    if not hasattr(pool, "status_snapshot"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Connection pool statistics are not available for this database."
+        )
+    return PoolStatusResponse.model_validate({
+        "profile": settings.APP_PROFILE,
+        **pool.status_snapshot()
+    })
+
+
+def _require_slow_query_log() -> SlowQueryLog:
+    slow_query_log = get_slow_query_log()
+    if slow_query_log is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Slow query log is disabled. Set SLOW_QUERY_THRESHOLD_MS above 0."
+        )
+    return slow_query_log
+
+
+@router.get("/db/slow-queries", response_model=List[SlowQueryResponse], status_code=status.HTTP_200_OK)
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    slow_query_log: SlowQueryLog = Depends(_require_slow_query_log)
+):
+    """
+    실행 시간이 `SLOW_QUERY_THRESHOLD_MS`를 넘은 SQL 문을 최근 순으로 조회하는 API (관리자 권한 필요).
+
+    정규화된 SQL 문, 가려진 파라미터, 실행 시간, 호출한 CRUD 함수와 실행 계획을 반환합니다.
+    실행 계획은 비동기로 채워지므로 기록 직후에는 비어 있을 수 있습니다.
+    기록은 worker 프로세스 메모리에 보관됩니다.
+
+    Args:
+        limit (int): 반환할 최대 기록 수.
+
+    Returns:
+        List[SlowQueryResponse]: slow query 기록 목록.
+    """
+    return slow_query_log.list(limit)
+
+
+@router.delete("/db/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(slow_query_log: SlowQueryLog = Depends(_require_slow_query_log)):
+    """
+    보관 중인 slow query 기록을 모두 삭제하는 API (관리자 권한 필요).
+    """
+    slow_query_log.clear()
+
+
+def _require_profiler() -> Profiler:
+    profiler = get_profiler()
+    if profiler is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profiling is disabled. Set PROFILING_ENABLED=true."
+        )
+    return profiler
+
+
+def _get_profile(profile_id: int, profiler: Profiler):
+    record = profiler.store.get(profile_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile with id {profile_id} not found."
+        )
+    return record
+
+
+@router.get("/profiling", response_model=ProfilingSettingsResponse, status_code=status.HTTP_200_OK)
+async def get_profiling_settings(profiler: Profiler = Depends(_require_profiler)):
+    """
+    요청 프로파일링 설정을 조회하는 API (관리자 권한 필요).
+
+    Returns:
+        ProfilingSettingsResponse: 헤더 사용 가능 여부, 샘플링 비율, 보관 개수.
+    """
+    return profiler.settings()
+
+
+@router.put("/profiling", response_model=ProfilingSettingsResponse, status_code=status.HTTP_200_OK)
+async def update_profiling_settings(
+    request: ProfilingSettingsUpdateRequest,
+    profiler: Profiler = Depends(_require_profiler)
+):
+    """
+    요청 프로파일링 샘플링 비율을 변경하는 API (관리자 권한 필요).
+
+    변경은 요청을 처리한 worker 프로세스에만 적용되며 재시작하면 `PROFILING_SAMPLE_RATE`로 돌아갑니다.
+
+    Args:
+        request (ProfilingSettingsUpdateRequest): 변경할 샘플링 비율.
+
+    Returns:
+        ProfilingSettingsResponse: 변경된 설정.
+    """
+    profiler.sample_rate = request.sample_rate
+    return profiler.settings()
+
+
+@router.post("/profiling/token", response_model=ProfileTokenResponse, status_code=status.HTTP_201_CREATED)
+async def create_profile_token(
+    ttl_seconds: int = Query(300, ge=1, le=86400),
+    profiler: Profiler = Depends(_require_profiler)
+):
+    """
+    특정 요청을 프로파일링하기 위한 서명된 `X-Profile` 헤더 값을 발급하는 API (관리자 권한 필요).
+
+    발급된 값은 만료 전까지 모든 worker에서 유효합니다.
+
+    Args:
+        ttl_seconds (int): 헤더 값 유효 시간 (초).
+
+    Returns:
+        ProfileTokenResponse: 헤더 이름, 값, 만료 시각.
+    """
+    expires_at = int(time.time()) + ttl_seconds
+    return {
+        "header": "X-Profile",
+        "value": sign_profile_token(profiler.secret, expires_at),
+        "expires_at": datetime.fromtimestamp(expires_at),
+    }
+
+
+@router.get("/profiles", response_model=List[ProfileResponse], status_code=status.HTTP_200_OK)
+async def list_profiles(profiler: Profiler = Depends(_require_profiler)):
+    """
+    보관 중인 프로파일 결과 목록을 최근 순으로 조회하는 API (관리자 권한 필요).
+
+    Returns:
+        List[ProfileResponse]: 요청 경로, 라우트, 상태 코드, 처리 시간 등 메타데이터 목록.
+    """
+    return profiler.store.list()
+
+
+@router.get("/profiles/{profile_id}", status_code=status.HTTP_200_OK, response_class=Response)
+async def download_profile(profile_id: int, profiler: Profiler = Depends(_require_profiler)):
+    """
+    프로파일 결과를 `.prof` 파일로 내려받는 API (관리자 권한 필요).
+
+    `python -m pstats <file>` 또는 `snakeviz <file>`로 열 수 있습니다.
+
+    Args:
+        profile_id (int): 프로파일 ID.
+
+    Returns:
+        Response: marshal 형식의 cProfile 결과.
+
+    Raises:
+        HTTPException: 프로파일이 없거나 이미 제거된 경우 (404).
+    """
+    record = _get_profile(profile_id, profiler)
+    return Response(
+        content=record.stats,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="profile-{record.id}.prof"'}
+    )
+
+
+@router.get("/profiles/{profile_id}/summary", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+async def get_profile_summary(
+    profile_id: int,
+    sort: Literal["cumulative", "tottime", "ncalls"] = "cumulative",
+    limit: int = Query(40, ge=1, le=500),
+    profiler: Profiler = Depends(_require_profiler)
+):
+    """
+    프로파일 결과의 텍스트 요약(pstats)을 조회하는 API (관리자 권한 필요).
+
+    Args:
+        profile_id (int): 프로파일 ID.
+        sort (str): 정렬 기준.
+        limit (int): 출력할 함수 수.
+
+    Returns:
+        PlainTextResponse: 함수별 호출 횟수와 누적 시간.
+
+    Raises:
+        HTTPException: 프로파일이 없거나 이미 제거된 경우 (404).
+    """
+    record = _get_profile(profile_id, profiler)
+    return PlainTextResponse(record.summary(sort, limit))
+
+
+def _require_comment_search() -> CommentSearch:
+    search = get_comment_search()
+    if search is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment search is disabled. Set SEARCH_ENABLED=true."
+        )
+    if not search.index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Comment search index is still being built."
+        )
+    return search
+
+
+@router.get("/comments/search", response_model=CommentSearchResponse, status_code=status.HTTP_200_OK)
+async def search_comments(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백으로 나눈 모든 단어를 포함)"),
+    menu_id: Optional[int] = None,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10000),
+    db: Session = Depends(get_read_db),
+    search: CommentSearch = Depends(_require_comment_search)
+):
+    """
+    모든 메뉴의 댓글을 검색하는 API (관리자 권한 필요).
+
+    댓글 내용의 글자 bigram 색인에서 검색어의 모든 단어를 포함하는 댓글을 찾아 BM25 점수순(같으면 최신순)으로 반환합니다.
+    "양 적음"은 "양"과 "적음"을 모두 포함하는 댓글과 일치합니다.
+    색인에서 찾은 후보 중 검색어의 단어를 실제로 포함하지 않는 댓글(bigram만 흩어져 일치)은 결과에서 빠지므로,
+    `total`은 후보 수(상한)이고 한 페이지의 결과가 `limit`보다 적을 수 있습니다.
+    점수는 검색어 토큰의 IDF 합에 댓글 길이만 반영한 BM25(토큰 빈도 1)이며, 같으면 최신순입니다.
+    색인은 worker 프로세스 메모리에 있으며, 다른 worker에서 등록된 댓글은 `SEARCH_REFRESH_SECONDS` 이내에 반영됩니다.
+
+    Args:
+        q (str): 검색어.
+        menu_id (Optional[int]): 메뉴 ID 필터.
+        date_from (Optional[date]): 작성 날짜 시작 (포함, 쿼리 파라미터 `from`).
+        date_to (Optional[date]): 작성 날짜 끝 (포함, 쿼리 파라미터 `to`).
+        limit (int): 반환할 최대 개수.
+        offset (int): 건너뛸 개수.
+
+    Returns:
+        CommentSearchResponse: 일치한 전체 댓글 수와 검색 결과.
+
+    Raises:
+        HTTPException:
+            - 검색이 비활성화된 경우 (404).
+            - 색인을 만드는 중인 경우 (503).
+    """
+    total, hits = search.index.search(q, menu_id, date_from, date_to, limit, offset)
+    found = comments.get_comments_by_ids(db, [comment_id for comment_id, _ in hits])
+    return CommentSearchResponse(
+        total=total,
+        items=[
+            CommentSearchHit(**found[comment_id].model_dump(), score=score)
+            for comment_id, score in hits
+            if comment_id in found and contains_query(q, found[comment_id].comment)
+        ]
+    )
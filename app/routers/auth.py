@@ -4,8 +4,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 from app.database import get_db
-from app.cores.security import verify_password, create_access_token
-from app.crud.users import get_user
+from app.cores.security import (
+    create_access_token,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async
+)
+from app.crud.users import get_user, update_password_hash
 from app.schemas.tokens import TokenCreateRequest, TokenResponse
 
 
@@ -25,6 +30,7 @@ async def login(
     사용자 로그인 엔드포인트.
 
     사용자의 `username`과 `password`를 검증하여 액세스 토큰을 발급합니다.
+    저장된 해시의 bcrypt cost가 현재 설정과 다르면 새 cost로 재해싱하여 저장합니다.
 
     Args:
         form_data (OAuth2PasswordRequestForm): 로그인 폼 데이터 (username, password).
@@ -34,12 +40,15 @@ async def login(
         TokenResponse: 발급된 액세스 토큰 및 토큰 유형.
 
     Raises:
-        HTTPException: 로그인 실패 시 `401 Unauthorized` 응답 반환.
+        HTTPException: 로그인 실패 시 `401 Unauthorized`, 인증 요청 과다 시 `503` 응답 반환.
     """
     user = get_user(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect username or password")
-    
-    token_data = TokenCreateRequest(sub=user.username, role=user.role.role)
+
+    if password_needs_rehash(user.hashed_password):
+        update_password_hash(db, user, await get_password_hash_async(form_data.password))
+
+    token_data = TokenCreateRequest(sub=user.username, role=user.role.role, uid=user.id, email=user.email)
     access_token = create_access_token(token_data)
     return TokenResponse(access_token=access_token, token_type="bearer")
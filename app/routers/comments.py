@@ -1,11 +1,16 @@
+from typing import Optional
+
 from sqlalchemy.orm import Session
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_db, get_read_db
 from app.dependencies.user import get_user_id
 from app.crud import comments
-from app.schemas.comments import CommentCreateRequest, CommentCountResponse, CommentResponse
+from app.schemas.comments import CommentCreateRequest, CommentCountResponse, CommentPageResponse, CommentResponse
+
+settings = get_settings()
 
 
 router = APIRouter(
@@ -46,35 +51,11 @@ async def create_comment(
     return new_comment
 
 
-@router.get("/{menu_id}", response_model=CommentResponse, status_code=status.HTTP_200_OK)
-async def get_comment_by_menu(
-    menu_id: int,
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_user_id)
-):
-    """
-    특정 메뉴에 대해 사용자가 가장 최근에 작성한 댓글을 조회하는 API.
-
-    Args:
-        menu_id (int): 조회 대상 메뉴 ID.
-        db (Session): SQLAlchemy 세션 객체.
-        user_id (str): 요청 사용자 ID (헤더에서 추출).
-
-    Returns:
-        CommentResponse: 최근 댓글 정보.
-
-    Raises:
-        HTTPException: 해당 메뉴에 대한 댓글이 존재하지 않을 경우.
-    """
-    comment = comments.get_comment_by_menu(db, user_id, menu_id)
-    return comment
-
-
 @router.get("/count", response_model=CommentCountResponse, status_code=status.HTTP_200_OK)
 async def get_comment_count(
     menu1_id: int,
     menu2_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     두 개의 메뉴에 대한 댓글 수를 조회하는 API.
@@ -94,3 +75,61 @@ async def get_comment_count(
     """
     comment_count = comments.get_comment_count(db, menu1_id, menu2_id)
     return comment_count
+
+
+@router.get("/menu/{menu_id}", response_model=CommentPageResponse, status_code=status.HTTP_200_OK)
+async def get_comments_by_menu(
+    menu_id: int,
+    response: Response,
+    cursor: Optional[int] = Query(None, ge=1, description="이전 페이지 응답의 next_cursor"),
+    size: int = Query(settings.COMMENT_PAGE_SIZE, ge=1, le=settings.COMMENT_PAGE_MAX_SIZE),
+    db: Session = Depends(get_read_db)
+):
+    """
+    메뉴의 댓글을 최신순으로 페이지 단위로 조회하는 API.
+
+    응답의 `next_cursor`를 다음 요청의 `cursor`로 전달하면 이어지는 페이지를 조회합니다.
+    페이지를 넘기는 사이에 등록된 댓글은 첫 페이지에만 나타나므로 항목이 중복되거나 누락되지 않습니다.
+    첫 페이지는 서버에서 캐싱되며, 새 댓글이 바로 보이도록 `Cache-Control: private, no-cache` 헤더와 함께 반환됩니다.
+
+    Args:
+        menu_id (int): 댓글을 조회할 메뉴 ID.
+        cursor (Optional[int]): 다음 페이지 cursor.
+        size (int): 페이지 크기 (기본 `COMMENT_PAGE_SIZE`, 최대 `COMMENT_PAGE_MAX_SIZE`).
+        db (Session): SQLAlchemy 세션 객체.
+
+    Returns:
+        CommentPageResponse: 댓글 목록과 다음 페이지 cursor.
+
+    Raises:
+        HTTPException: 메뉴가 존재하지 않을 경우 400 에러.
+    """
+    page = comments.get_comments_by_menu(db, menu_id, size, cursor)
+    if cursor is None:
+        # 댓글 등록 시 서버 캐시만 제거되므로 브라우저/공유 캐시가 첫 페이지를 재사용하지 않도록 합니다.
+        response.headers["Cache-Control"] = "private, no-cache"
+    return page
+
+
+@router.get("/{menu_id}", response_model=CommentResponse, status_code=status.HTTP_200_OK)
+async def get_comment_by_menu(
+    menu_id: int,
+    db: Session = Depends(get_read_db),
+    user_id: str = Depends(get_user_id)
+):
+    """
+    특정 메뉴에 대해 사용자가 가장 최근에 작성한 댓글을 조회하는 API.
+
+    Args:
+        menu_id (int): 조회 대상 메뉴 ID.
+        db (Session): SQLAlchemy 세션 객체.
+        user_id (str): 요청 사용자 ID (헤더에서 추출).
+
+    Returns:
+        CommentResponse: 최근 댓글 정보.
+
+    Raises:
+        HTTPException: 해당 메뉴에 대한 댓글이 존재하지 않을 경우.
+    """
+    comment = comments.get_comment_by_menu(db, user_id, menu_id)
+    return comment
@@ -0,0 +1,129 @@
+import json
+from datetime import date
+from typing import AsyncIterator, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.cores.live import LiveHub, get_live_hub
+from app.crud import menus, statistics
+from app.database import get_read_db
+from app.schemas.statistics import MenuLiveSummaryResponse
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/live",
+    tags=["live"],
+    responses={404: {"description": "Not found"}},
+)
+
+# 프록시(nginx 등)가 응답을 버퍼링하지 않도록 합니다.
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _require_live_hub() -> LiveHub:
+    hub = get_live_hub()
+    if hub is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Live statistics are disabled. Set LIVE_ENABLED=true."
+        )
+    return hub
+
+
+def _format_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _stream(hub: LiveHub, snapshot: Dict[int, MenuLiveSummaryResponse]) -> StreamingResponse:
+    subscription = hub.subscribe(snapshot)
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live subscribers. Fall back to polling."
+        )
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            for summary in snapshot.values():
+                yield _format_event("snapshot", summary.model_dump())
+            while not subscription.closed:
+                messages = await subscription.next(settings.LIVE_HEARTBEAT_SECONDS)
+                if not messages and not subscription.closed:
+                    # 연결 유지 및 끊어진 연결 감지를 위한 주석 이벤트
+                    yield ": heartbeat\n\n"
+                for message in messages:
+                    yield _format_event("update", message)
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=STREAM_HEADERS)
+
+
+@router.get("/menus/{menu_id}", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def subscribe_menu(
+    menu_id: int,
+    db: Session = Depends(get_read_db),
+    hub: LiveHub = Depends(_require_live_hub)
+):
+    """
+    메뉴의 투표 수, 댓글 수, 음식별 평가 수/평균을 Server-Sent Events로 구독하는 API.
+
+    연결 직후 현재 값을 `snapshot` 이벤트로 보내고, 이후 평가/투표/댓글이 등록되면
+    `LIVE_COALESCE_MS` 간격으로 모은 변경 수(`delta`)와 다시 계산한 요약(`summary`)을 `update` 이벤트로 보냅니다.
+    변경이 없으면 `LIVE_HEARTBEAT_SECONDS`마다 주석(heartbeat)을 보냅니다.
+
+    Args:
+        menu_id (int): 구독할 메뉴 ID.
+
+    Returns:
+        StreamingResponse: `text/event-stream` 응답.
+
+    Raises:
+        HTTPException:
+            - 메뉴가 존재하지 않을 경우 400 에러.
+            - 구독 수가 `LIVE_MAX_SUBSCRIPTIONS`를 넘은 경우 503 에러.
+    """
+    snapshot = statistics.get_menu_live_summaries(db, [menu_id])
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid menu_id. Menu does not exist."
+        )
+    return _stream(hub, snapshot)
+
+
+@router.get("/dates/{date}", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def subscribe_date(
+    date: date,
+    db: Session = Depends(get_read_db),
+    hub: LiveHub = Depends(_require_live_hub)
+):
+    """
+    특정 날짜의 모든 메뉴를 Server-Sent Events로 구독하는 API.
+
+    구독 대상 메뉴는 연결 시점에 결정됩니다. 이벤트 형식은 `/live/menus/{menu_id}`와 같으며,
+    메뉴마다 `snapshot` 이벤트를 하나씩 보냅니다.
+
+    Args:
+        date (date): 구독할 날짜.
+
+    Returns:
+        StreamingResponse: `text/event-stream` 응답.
+
+    Raises:
+        HTTPException:
+            - 해당 날짜에 메뉴가 없을 경우 400 에러.
+            - 구독 수가 `LIVE_MAX_SUBSCRIPTIONS`를 넘은 경우 503 에러.
+    """
+    menu_ids: List[int] = menus.get_menu_ids_by_date(db, date)
+    snapshot = statistics.get_menu_live_summaries(db, menu_ids)
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No menus found for this date."
+        )
+    return _stream(hub, snapshot)
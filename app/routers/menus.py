@@ -6,10 +6,10 @@ from sqlalchemy.orm import Session
 from fastapi import APIRouter, HTTPException, Depends, Path, status
 from fastapi_pagination import add_pagination
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies.auth import get_current_admin
 from app.crud import menus
-from app.models.users import User
+from app.schemas.users import AuthenticatedUser
 from app.schemas.menus import (
     MenuResponse, 
     MenuCreateRequest
@@ -27,7 +27,7 @@ add_pagination(router)
 @router.get("/{date}", response_model=List[MenuResponse])
 async def get_menu_by_date(
     date: date = Path(..., description="조회할 날짜 (YYYY-MM-DD 형식)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     특정 날짜의 메뉴 목록을 조회하는 API.
@@ -57,7 +57,7 @@ async def get_menu_by_date(
 async def create_menu(
     menu: MenuCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthenticatedUser = Depends(get_current_admin)
 ):
     """
     새로운 메뉴를 생성하는 API (관리자 권한 필요).
@@ -65,7 +65,7 @@ async def create_menu(
     Args:
         menu (MenuCreateRequest): 생성할 메뉴 정보.
         db (Session): SQLAlchemy 세션 객체.
-        current_user (User): 관리자 권한이 있는 사용자 객체.
+        current_user (AuthenticatedUser): 관리자 권한이 있는 사용자 객체.
 
     Returns:
         MenuResponse: 생성된 메뉴 정보.
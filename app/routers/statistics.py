@@ -1,16 +1,21 @@
-from typing import Optional
-from datetime import datetime
+from typing import Dict, List, Literal, Optional
+from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.cores.leaderboard import Leaderboard, LeaderboardService, Period, get_leaderboard
+from app.database import get_read_db
 from app.crud import statistics
 from app.schemas.statistics import (
     MenuStatisticResponse, 
     MenuMeanStatisticResponse,
     FoodStatisticResponse,
-    FoodMeanStatisticResponse
+    FoodMeanStatisticResponse,
+    CommentTermsResponse,
+    FoodSeriesResponse,
+    LeaderboardEntry,
+    LeaderboardResponse
 )
 
 router = APIRouter(
@@ -24,7 +29,7 @@ router = APIRouter(
 async def get_menu_statistics(
     menu_id: int,
     date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 메뉴에 포함된 음식들의 통계 정보를 조회합니다.
@@ -48,7 +53,7 @@ async def get_menu_statistics(
 async def get_menu_mean(
     menu_id: int,
     date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 메뉴에 포함된 음식들의 평균 점수를 조회합니다.
@@ -68,7 +73,7 @@ async def get_menu_mean(
 @router.get("/foods/{food_id}", response_model=FoodStatisticResponse, status_code=status.HTTP_200_OK)
 async def get_food_statistics(
     food_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 음식의 점수 통계를 조회합니다.
@@ -87,11 +92,41 @@ async def get_food_statistics(
     return statistic
 
 
+@router.get("/foods/{food_id}/series", response_model=FoodSeriesResponse, status_code=status.HTTP_200_OK)
+async def get_food_series(
+    food_id: int,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    bucket: Literal["day", "week", "month"] = "day",
+    db: Session = Depends(get_read_db)
+):
+    """
+    기간 내 음식 점수를 일/주/월 구간별로 조회합니다 (메뉴에 다시 나올 때마다의 점수 변화 차트용).
+
+    구간마다 평가 수와 평균(중복 포함), 사용자 수와 중복 제거 평균을 반환하며, 평가가 없는 구간은 생략합니다.
+
+    Args:
+        food_id (int): 음식 ID.
+        date_from (date): 시작 날짜 (포함, 쿼리 파라미터 `from`).
+        date_to (date): 끝 날짜 (포함, 쿼리 파라미터 `to`).
+        bucket (str): 구간 단위 (`day`, `week`(월요일 시작), `month`).
+        db (Session): 데이터베이스 세션 (의존성 주입).
+
+    Returns:
+        FoodSeriesResponse: 구간별 점수 통계.
+
+    Raises:
+        HTTPException: 기간이 잘못되었거나(400) 음식이 존재하지 않는 경우(404).
+    """
+    series = statistics.get_food_series(db, food_id, date_from, date_to, bucket)
+    return series
+
+
 @router.get("/mean/foods/{food_id}", response_model=FoodMeanStatisticResponse, status_code=status.HTTP_200_OK)
 async def get_food_mean(
     food_id: int,
     date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 음식의 평균 점수를 조회합니다.
@@ -109,3 +144,147 @@ async def get_food_mean(
     """
     statistic = statistics.get_food_mean(db, food_id, date)
     return statistic
+
+
+@router.get("/comments/terms", response_model=CommentTermsResponse, status_code=status.HTTP_200_OK)
+async def get_comment_terms(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    menu_id: Optional[int] = None,
+    food_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_read_db)
+):
+    """
+    기간 내 댓글에 가장 많이 등장한 단어를 조회합니다 (주간 리포트 등).
+
+    댓글 내용을 다시 읽지 않고 (메뉴, 날짜, 단어)별 집계 테이블에서 합산합니다.
+    단어별 값은 그 단어를 포함한 댓글 수이며, 집계는 `COMMENT_TERMS_ENABLED`일 때 주기적으로 갱신됩니다.
+
+    Args:
+        date_from (date): 시작 날짜 (포함, 쿼리 파라미터 `from`).
+        date_to (date): 끝 날짜 (포함, 쿼리 파라미터 `to`).
+        menu_id (Optional[int]): 메뉴 ID 필터.
+        food_id (Optional[int]): 음식 ID 필터 (음식이 포함된 메뉴의 댓글).
+        limit (int): 반환할 단어 수.
+        db (Session): 데이터베이스 세션 (의존성 주입).
+
+    Returns:
+        CommentTermsResponse: 댓글 수 내림차순 상위 단어.
+
+    Raises:
+        HTTPException: 기간이 잘못되었거나 메뉴/음식이 존재하지 않는 경우 400 에러.
+    """
+    terms = statistics.get_top_comment_terms(db, date_from, date_to, menu_id, food_id, limit)
+    return terms
+
+
+def _require_leaderboard() -> LeaderboardService:
+    leaderboard = get_leaderboard()
+    if leaderboard is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Food leaderboard is disabled. Set LEADERBOARD_ENABLED=true."
+        )
+    return leaderboard
+
+
+def _leaderboard_response(
+    db: Session,
+    period: Period,
+    board: Leaderboard,
+    entries: List[Dict[str, float]]
+) -> LeaderboardResponse:
+    names = statistics.get_food_names(db, [entry["food_id"] for entry in entries])
+    return LeaderboardResponse(
+        period=period,
+        start=board.start,
+        end=board.end,
+        prior_mean=round(board.prior_mean, 5),
+        prior_weight=board.prior_weight,
+        total=len(board),
+        entries=[
+            LeaderboardEntry(
+                rank=entry["rank"],
+                food_id=entry["food_id"],
+                food_name=names[entry["food_id"]],
+                count=entry["count"],
+                mean=round(entry["mean"], 5),
+                score=round(entry["score"], 5)
+            )
+            for entry in entries if entry["food_id"] in names
+        ]
+    )
+
+
+@router.get("/leaderboard/foods", response_model=LeaderboardResponse, status_code=status.HTTP_200_OK)
+async def get_food_leaderboard(
+    period: Period = "week",
+    anchor: Optional[date] = Query(None, alias="date"),
+    order: Literal["best", "worst"] = "best",
+    min_count: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    leaderboard: LeaderboardService = Depends(_require_leaderboard)
+):
+    """
+    기간 내 음식 순위를 Bayesian 평균 점수순으로 조회합니다.
+
+    Bayesian 평균은 평가가 적은 음식의 평균을 기간 전체 평균 쪽으로 당긴 값으로,
+    평가 한두 개로 순위가 정해지지 않도록 합니다 (`LEADERBOARD_PRIOR_WEIGHT`).
+    순위표는 worker 메모리에 정렬된 상태로 보관되며, 이 worker의 점수 등록은 바로,
+    다른 worker의 점수 등록은 `LEADERBOARD_REFRESH_SECONDS` 이내에 반영됩니다.
+
+    Args:
+        period (Period): 기간 단위 (`day`, `week`(월요일 시작), `month`, `all`).
+        anchor (Optional[date]): 기간을 정하는 기준 날짜 (쿼리 파라미터 `date`, 기본값은 오늘).
+        order (str): `best`(높은 순) 또는 `worst`(낮은 순).
+        min_count (int): 최소 평가 수. 미만인 음식은 목록에서 제외합니다 (순위는 유지).
+        limit (int): 반환할 최대 개수.
+        db (Session): 데이터베이스 세션 (의존성 주입).
+
+    Returns:
+        LeaderboardResponse: 기간 정보와 순위 항목.
+
+    Raises:
+        HTTPException: 순위표가 비활성화된 경우 (404).
+    """
+    board, entries = leaderboard.top(
+        db, period, anchor or date.today(), limit, min_count, worst=order == "worst"
+    )
+    return _leaderboard_response(db, period, board, entries)
+
+
+@router.get("/leaderboard/foods/{food_id}", response_model=LeaderboardResponse, status_code=status.HTTP_200_OK)
+async def get_food_rank(
+    food_id: int,
+    period: Period = "week",
+    anchor: Optional[date] = Query(None, alias="date"),
+    db: Session = Depends(get_read_db),
+    leaderboard: LeaderboardService = Depends(_require_leaderboard)
+):
+    """
+    기간 내 특정 음식의 순위를 조회합니다.
+
+    Args:
+        food_id (int): 음식 ID.
+        period (Period): 기간 단위 (`day`, `week`(월요일 시작), `month`, `all`).
+        anchor (Optional[date]): 기간을 정하는 기준 날짜 (쿼리 파라미터 `date`, 기본값은 오늘).
+        db (Session): 데이터베이스 세션 (의존성 주입).
+
+    Returns:
+        LeaderboardResponse: 기간 정보와 해당 음식의 순위 항목 하나.
+
+    Raises:
+        HTTPException:
+            - 순위표가 비활성화된 경우 (404).
+            - 음식이 존재하지 않거나 기간 내 평가가 없는 경우 (400).
+    """
+    board, entry = leaderboard.rank(db, period, anchor or date.today(), food_id)
+    response = _leaderboard_response(db, period, board, [entry] if entry is not None else [])
+    if not response.entries:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid food_id. Food does not exist or has no scores in this period."
+        )
+    return response
@@ -3,9 +3,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.cores.security import get_password_hash_async
 from app.dependencies.auth import get_current_user
 from app.crud import users
-from app.schemas.users import UserCreateRequest, UserResponse
+from app.schemas.users import AuthenticatedUser, UserCreateRequest, UserResponse
 
 router = APIRouter(
     prefix="/users", 
@@ -31,25 +32,26 @@ async def register(
         UserResponse: 생성된 사용자 정보.
 
     Raises:
-        HTTPException: 이미 존재하는 `username`일 경우 400 Bad Request 반환.
+        HTTPException: 이미 존재하는 `username`일 경우 400 Bad Request, 해싱 요청 과다 시 503 반환.
     """
     existing_user = users.get_user(db, user.username)
     if existing_user:
         raise HTTPException(status_code=400, detail="Username already exists")
     
-    new_user = users.register(db, user)
+    hashed_password = await get_password_hash_async(user.password)
+    new_user = users.register(db, user, hashed_password)
     return UserResponse.model_validate(new_user)
 
 
 @router.get("/me")
-async def get_me(current_user: dict = Depends(get_current_user)):
+async def get_me(current_user: AuthenticatedUser = Depends(get_current_user)):
     """
     현재 로그인한 사용자 정보 조회 API.
 
     - 액세스 토큰을 통해 인증된 사용자 정보를 반환.
 
     Args:
-        current_user (UserResponse): 현재 인증된 사용자.
+        current_user (AuthenticatedUser): 현재 인증된 사용자.
 
     Returns:
         UserResponse: 현재 로그인한 사용자 정보.
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, status
 
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies.user import get_user_id
 from app.crud import votes
 from app.schemas.votes import (
@@ -48,7 +48,7 @@ async def create_vote(
 async def get_vote_count(
     menu1_id: int,
     menu2_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     두 개의 메뉴에 대한 투표 수를 조회하는 API.
@@ -73,7 +73,7 @@ async def get_vote_count(
 @router.get("/{menu_id}", response_model=VoteReponse, status_code=status.HTTP_200_OK)
 async def get_vote(
     menu_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_id: str = Depends(get_user_id)
 ):
     """
@@ -0,0 +1,128 @@
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PoolStatusResponse(BaseModel):
+    """
+    DB 커넥션 풀 상태 응답 모델.
+
+    Attributes:
+        profile (str): 현재 적용된 실행 환경 profile (dev, test, prod).
+        size (int): 풀에 유지되는 기본 커넥션 수 (`pool_size`).
+        checked_in (int): 현재 풀에서 대기 중인 커넥션 수.
+        checked_out (int): 현재 사용 중인 커넥션 수.
+        overflow (int): 현재 생성된 overflow 커넥션 수.
+        max_overflow (int): 허용되는 최대 overflow 커넥션 수.
+        timeout (float): 체크아웃 대기 제한 시간 (초).
+        checkouts (int): 누적 체크아웃 횟수.
+        timeouts (int): 누적 체크아웃 타임아웃 횟수.
+        total_wait_ms (float): 누적 체크아웃 대기 시간 (ms).
+        avg_wait_ms (float): 평균 체크아웃 대기 시간 (ms).
+        max_wait_ms (float): 최대 체크아웃 대기 시간 (ms).
+    """
+    profile: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    timeout: float
+    checkouts: int
+    timeouts: int
+    total_wait_ms: float
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class ProfilingSettingsResponse(BaseModel):
+    """
+    요청 프로파일링 설정 응답 모델.
+
+    Attributes:
+        header_enabled (bool): 서명된 `X-Profile` 헤더로 프로파일링할 수 있는지 여부.
+        sample_rate (float): 무작위로 프로파일링하는 요청 비율 (0~1).
+        max_profiles (int): worker마다 보관하는 최근 프로파일 결과 수.
+    """
+    header_enabled: bool
+    sample_rate: float
+    max_profiles: int
+
+
+class ProfilingSettingsUpdateRequest(BaseModel):
+    """
+    요청 프로파일링 설정 변경 요청 모델.
+
+    Attributes:
+        sample_rate (float): 무작위로 프로파일링할 요청 비율 (0이면 샘플링 비활성).
+    """
+    sample_rate: float = Field(ge=0.0, le=1.0)
+
+
+class ProfileTokenResponse(BaseModel):
+    """
+    프로파일링 요청 헤더 발급 응답 모델.
+
+    Attributes:
+        header (str): 헤더 이름 (`X-Profile`).
+        value (str): 헤더 값 (`<만료 시각>.<서명>`).
+        expires_at (datetime): 헤더 값 만료 시각.
+    """
+    header: str
+    value: str
+    expires_at: datetime
+
+
+class ProfileResponse(BaseModel):
+    """
+    프로파일링된 요청의 메타데이터 응답 모델.
+
+    Attributes:
+        id (int): 프로파일 ID.
+        method (str): HTTP 메서드.
+        path (str): 요청 경로.
+        route (Optional[str]): 라우트 템플릿.
+        status_code (int): 응답 상태 코드.
+        trigger (str): 프로파일링 계기 (`header` 또는 `sample`).
+        started_at (datetime): 요청 시작 시각.
+        duration_ms (float): 처리 시간 (ms, 프로파일러 오버헤드 포함).
+    """
+    id: int
+    method: str
+    path: str
+    route: Optional[str]
+    status_code: int
+    trigger: Literal["header", "sample"]
+    started_at: datetime
+    duration_ms: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlowQueryResponse(BaseModel):
+    """
+    slow query 기록 응답 모델.
+
+    Attributes:
+        id (int): 기록 ID.
+        engine (str): 엔진 이름 (`primary`, `replica`).
+        statement (str): 정규화된 SQL 문.
+        parameters (Any): 문자열 값이 가려진 바인드 파라미터.
+        duration_ms (float): 실행 시간 (ms).
+        caller (Optional[str]): SQL 문을 실행한 함수 (`app.crud.statistics.get_food_mean` 등).
+        occurred_at (datetime): 실행 완료 시각.
+        explain (Optional[List[Dict[str, Any]]]): 실행 계획 (`EXPLAIN` 결과 행 목록).
+        explain_error (Optional[str]): 실행 계획 조회 실패/생략 사유.
+    """
+    id: int
+    engine: str
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: Optional[str]
+    occurred_at: datetime
+    explain: Optional[List[Dict[str, Any]]]
+    explain_error: Optional[str]
+
+    model_config = ConfigDict(from_attributes=True)
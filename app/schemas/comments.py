@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import List, Optional
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -37,14 +39,50 @@ class CommentResponse(BaseModel):
     댓글 응답 모델.
 
     Attributes:
+        id (int): 댓글 ID.
         user_id (str): 댓글 작성자의 사용자 ID.
         comment (str): 댓글 내용.
         created_at (datetime): 댓글 작성 시간.
         menu_id (int): 댓글이 달린 메뉴 ID.
     """
+    id: int
     user_id: str
     comment: str
     created_at: datetime
     menu_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class CommentPageResponse(BaseModel):
+    """
+    메뉴별 댓글 목록의 한 페이지 응답 모델.
+
+    Attributes:
+        items (List[CommentResponse]): 최신순 댓글 목록.
+        next_cursor (Optional[int]): 다음 페이지 요청 시 `cursor`로 전달할 값 (마지막 페이지이면 None).
+    """
+    items: List[CommentResponse]
+    next_cursor: Optional[int] = None
+
+
+class CommentSearchHit(CommentResponse):
+    """
+    댓글 검색 결과 항목.
+
+    Attributes:
+        score (float): 검색 점수 (BM25, 높을수록 상위).
+    """
+    score: float
+
+
+class CommentSearchResponse(BaseModel):
+    """
+    댓글 검색 응답 모델.
+
+    Attributes:
+        total (int): 조건에 일치한 전체 후보 댓글 수 (상한).
+        items (List[CommentSearchHit]): 점수순 검색 결과.
+    """
+    total: int
+    items: List[CommentSearchHit]
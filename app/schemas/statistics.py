@@ -1,5 +1,5 @@
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel, ConfigDict
 
 
@@ -105,3 +105,143 @@ class MenuStatisticResponse(BaseModel):
     total_avg_without_duplicates: float
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FoodLiveSummary(BaseModel):
+    """
+    실시간 푸시용 음식 점수 요약 모델.
+
+    Attributes:
+        food_id (int): 음식 ID.
+        count (int): 평가 수 (중복 포함).
+        mean (float): 평균 점수 (중복 포함, 평가가 없으면 0).
+    """
+    food_id: int
+    count: int
+    mean: float
+
+
+class MenuLiveSummaryResponse(BaseModel):
+    """
+    실시간 푸시용 메뉴 요약 모델.
+
+    결과 화면이 주기적으로 조회하던 투표 수, 댓글 수, 음식별 평가 수/평균을 한 번에 담습니다.
+
+    Attributes:
+        menu_id (int): 메뉴 ID.
+        vote_count (int): 투표 수.
+        comment_count (int): 댓글 수.
+        foods (List[FoodLiveSummary]): 음식별 점수 요약.
+    """
+    menu_id: int
+    vote_count: int
+    comment_count: int
+    foods: List[FoodLiveSummary]
+
+
+class CommentTermCountResponse(BaseModel):
+    """
+    댓글 단어 집계 항목.
+
+    Attributes:
+        term (str): 단어.
+        count (int): 기간 내 이 단어를 포함한 댓글 수.
+    """
+    term: str
+    count: int
+
+
+class CommentTermsResponse(BaseModel):
+    """
+    기간별 댓글 상위 단어 응답 모델.
+
+    Attributes:
+        date_from (date): 집계 시작 날짜 (포함).
+        date_to (date): 집계 끝 날짜 (포함).
+        menu_id (Optional[int]): 메뉴 ID 필터.
+        food_id (Optional[int]): 음식 ID 필터 (음식이 포함된 메뉴의 댓글).
+        terms (List[CommentTermCountResponse]): 댓글 수 내림차순 상위 단어.
+    """
+    date_from: date
+    date_to: date
+    menu_id: Optional[int] = None
+    food_id: Optional[int] = None
+    terms: List[CommentTermCountResponse]
+
+
+class LeaderboardEntry(BaseModel):
+    """
+    음식 순위표 항목.
+
+    Attributes:
+        rank (int): 기간 내 평가된 모든 음식 중 순위 (1부터).
+        food_id (int): 음식 ID.
+        food_name (str): 음식 이름.
+        count (int): 기간 내 평가 수.
+        mean (float): 기간 내 평균 점수.
+        score (float): 순위 기준인 Bayesian 평균 점수.
+    """
+    rank: int
+    food_id: int
+    food_name: str
+    count: int
+    mean: float
+    score: float
+
+
+class LeaderboardResponse(BaseModel):
+    """
+    음식 순위표 응답 모델.
+
+    Attributes:
+        period (str): 기간 단위 (`day`, `week`, `month`, `all`).
+        start (Optional[datetime]): 기간 시작 (포함). `all`이면 None.
+        end (Optional[datetime]): 기간 끝 (제외). `all`이면 None.
+        prior_mean (float): Bayesian 평균의 사전 평균 (기간 전체 평균 점수).
+        prior_weight (float): 사전 평균에 부여하는 평가 수.
+        total (int): 기간 내 평가된 음식 수.
+        entries (List[LeaderboardEntry]): 순위 항목.
+    """
+    period: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    prior_mean: float
+    prior_weight: float
+    total: int
+    entries: List[LeaderboardEntry]
+
+
+class FoodSeriesPoint(BaseModel):
+    """
+    음식 점수 시계열의 구간 항목.
+
+    Attributes:
+        start (date): 구간 시작 날짜 (주는 월요일, 월은 1일). 첫/마지막 구간은 조회 기간에 포함된 날짜만 집계합니다.
+        count (int): 평가 수 (중복 포함).
+        mean (float): 평균 점수 (중복 포함).
+        count_without_duplicates (int): 평가한 사용자 수.
+        mean_without_duplicates (float): 사용자별 평균 점수의 평균 (중복 제거).
+    """
+    start: date
+    count: int
+    mean: float
+    count_without_duplicates: int
+    mean_without_duplicates: float
+
+
+class FoodSeriesResponse(BaseModel):
+    """
+    음식 점수 시계열 응답 모델.
+
+    Attributes:
+        food_id (int): 음식 ID.
+        bucket (str): 구간 단위 (`day`, `week`, `month`).
+        date_from (date): 조회 시작 날짜 (포함).
+        date_to (date): 조회 끝 날짜 (포함).
+        points (List[FoodSeriesPoint]): 평가가 있는 구간만 시작 날짜순으로 담습니다.
+    """
+    food_id: int
+    bucket: str
+    date_from: date
+    date_to: date
+    points: List[FoodSeriesPoint]
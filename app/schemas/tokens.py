@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 from app.models.roles import RoleEnum
@@ -20,6 +22,10 @@ class TokenCreateRequest(BaseModel):
 
     - `sub`: 사용자 고유 식별자 (보통 username).
     - `role`: 사용자의 역할 (`admin` 또는 `user`).
+    - `uid`: 사용자 고유 ID (`JWT_EMBED_CLAIMS` 활성화 시 토큰에 포함).
+    - `email`: 사용자 이메일 (`JWT_EMBED_CLAIMS` 활성화 시 토큰에 포함).
     """
     sub: str
     role: RoleEnum
+    uid: Optional[int] = None
+    email: Optional[str] = None
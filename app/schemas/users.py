@@ -32,3 +32,22 @@ class UserCreateRequest(BaseModel):
     role: RoleEnum
 
     model_config = ConfigDict(use_enum_values=True)
+
+
+class AuthenticatedUser(BaseModel):
+    """
+    인증된 사용자(principal) 모델.
+
+    인증 의존성이 반환하며, 세션과 무관하게 캐싱할 수 있도록 ORM 객체 대신 사용됩니다.
+
+    - `id`: 사용자 고유 ID.
+    - `username`: 사용자 로그인 ID.
+    - `email`: 사용자 이메일.
+    - `role`: 사용자 역할 (`admin` 또는 `user`).
+    - `disabled`: 계정 비활성화 여부.
+    """
+    id: int
+    username: str
+    email: str
+    role: RoleEnum
+    disabled: bool = False
@@ -0,0 +1,268 @@
+"""
+API 주요 경로 벤치마크.
+
+시드 데이터를 생성한 DB에 대해 각 엔드포인트를 in-process ASGI 클라이언트(httpx)로 호출하고,
+처리량, p50/p95/p99 지연 시간, 요청당 SQL 문 수, 최대 메모리 사용량(RSS, `--trace-memory` 시
+시나리오별 tracemalloc 최대 할당량)을 측정하여
+커밋 간 비교할 수 있는 JSON으로 저장합니다.
+
+사용법 (반드시 비어 있는 벤치마크 전용 DB를 대상으로 실행):
+    python -m benchmarks.api --reset --days 30 --users 500 --scores-per-food 50 --output bench.json
+    python -m benchmarks.compare base.json bench.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import resource
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from app.cores.queries import track_queries
+from app.database import get_engine
+from app.main import create_app
+from benchmarks.seed import SeedConfig, SeedResult, describe, seed
+
+
+@dataclass
+class Scenario:
+    """
+    벤치마크 시나리오.
+
+    Attributes:
+        name (str): 시나리오 이름 (결과 키).
+        method (str): HTTP 메서드.
+        build (Callable[[random.Random, SeedResult], Dict[str, Any]]): 요청 인자(url, json, headers) 생성 함수.
+    """
+    name: str
+    method: str
+    build: Callable[[random.Random, SeedResult], Dict[str, Any]]
+
+
+def _user_headers(rng: random.Random, data: SeedResult) -> Dict[str, str]:
+    return {"user-id": rng.choice(data.user_ids)}
+
+
+def _score_request(rng: random.Random, data: SeedResult) -> Dict[str, Any]:
+    menu_id = rng.choice(data.menu_ids)
+    return {
+        "url": "/api/v1/scores/",
+        "json": [{"food_id": food_id, "score": float(rng.randint(1, 5))} for food_id in data.menu_foods[menu_id]],
+        "headers": _user_headers(rng, data),
+    }
+
+
+def _front_log_request(rng: random.Random, data: SeedResult) -> Dict[str, Any]:
+    return {
+        "url": "/api/v1/logs/front",
+        "json": [{
+            "user_id": rng.choice(data.user_ids),
+            "event_name": "click",
+            "event_value": {"target": "score", "index": index},
+            "page_name": "menu",
+            "event_time": datetime.now().isoformat(),
+        } for index in range(5)],
+    }
+
+
+def _menu_pair(rng: random.Random, data: SeedResult) -> str:
+    # 같은 날의 두 메뉴를 비교합니다. 메뉴가 하나뿐이면 같은 메뉴끼리 비교합니다.
+    if len(data.menu_ids) < 2:
+        return f"menu1_id={data.menu_ids[0]}&menu2_id={data.menu_ids[0]}"
+    index = rng.randrange(0, len(data.menu_ids) - 1, 2)
+    return f"menu1_id={data.menu_ids[index]}&menu2_id={data.menu_ids[index + 1]}"
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("menus_by_date", "GET", lambda rng, data: {"url": f"/api/v1/menus/{rng.choice(data.dates)}"}),
+    Scenario("menu_statistics", "GET", lambda rng, data: {"url": f"/api/v1/statistics/menus/{rng.choice(data.menu_ids)}"}),
+    Scenario("menu_mean", "GET", lambda rng, data: {"url": f"/api/v1/statistics/mean/menus/{rng.choice(data.menu_ids)}"}),
+    Scenario("food_statistics", "GET", lambda rng, data: {"url": f"/api/v1/statistics/foods/{rng.choice(data.served_food_ids)}"}),
+    Scenario("food_mean", "GET", lambda rng, data: {"url": f"/api/v1/statistics/mean/foods/{rng.choice(data.served_food_ids)}"}),
+    Scenario("score_submission", "POST", _score_request),
+    Scenario("recent_scores", "GET", lambda rng, data: {
+        "url": f"/api/v1/scores/{rng.choice(data.menu_ids)}", "headers": _user_headers(rng, data)
+    }),
+    Scenario("vote_count", "GET", lambda rng, data: {"url": f"/api/v1/votes/count?{_menu_pair(rng, data)}"}),
+    Scenario("comment_count", "GET", lambda rng, data: {"url": f"/api/v1/comments/count?{_menu_pair(rng, data)}"}),
+    Scenario("front_log_ingestion", "POST", _front_log_request),
+]
+
+
+async def _request(client: httpx.AsyncClient, scenario: Scenario, request: Dict[str, Any]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    with track_queries() as stats:
+        response = await client.request(scenario.method, **request)
+    return {"elapsed": time.perf_counter() - start, "status": response.status_code, "statements": stats.count}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    data: SeedResult,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    rng: random.Random
+) -> Dict[str, Any]:
+    """
+    시나리오 하나를 실행하고 측정 결과를 반환합니다.
+
+    Args:
+        client (httpx.AsyncClient): ASGI 클라이언트.
+        scenario (Scenario): 실행할 시나리오.
+        data (SeedResult): 시드 데이터 요약.
+        requests (int): 측정 요청 수.
+        concurrency (int): 동시 요청 수.
+        warmup (int): 측정 전 워밍업 요청 수.
+        rng (random.Random): 요청 파라미터 난수 생성기.
+
+    Returns:
+        Dict[str, Any]: 처리량, 지연 시간 분위수, SQL 문 수, 오류 수.
+    """
+    for _ in range(warmup):
+        await _request(client, scenario, scenario.build(rng, data))
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> Dict[str, Any]:
+        async with semaphore:
+            return await _request(client, scenario, scenario.build(rng, data))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(limited() for _ in range(requests)))
+    wall = time.perf_counter() - started
+
+    latencies = np.array([result["elapsed"] for result in results]) * 1000
+    statements = np.array([result["statements"] for result in results])
+    statuses: Dict[str, int] = {}
+    for result in results:
+        statuses[str(result["status"])] = statuses.get(str(result["status"]), 0) + 1
+
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / wall, 3),
+        "latency_ms": {
+            "mean": round(float(latencies.mean()), 3),
+            "p50": round(float(np.percentile(latencies, 50)), 3),
+            "p95": round(float(np.percentile(latencies, 95)), 3),
+            "p99": round(float(np.percentile(latencies, 99)), 3),
+            "max": round(float(latencies.max()), 3),
+        },
+        "sql_statements": {
+            "mean": round(float(statements.mean()), 3),
+            "max": int(statements.max()),
+        },
+        "status_codes": statuses,
+        "errors": sum(1 for result in results if result["status"] >= 400),
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """시드 데이터를 생성하고 선택된 시나리오를 모두 실행합니다."""
+    config = SeedConfig(
+        days=args.days,
+        menus_per_day=args.menus_per_day,
+        foods_per_menu=args.foods_per_menu,
+        food_pool=args.food_pool,
+        user_count=args.users,
+        scores_per_food=args.scores_per_food,
+        votes_per_menu=args.votes_per_menu,
+        comments_per_menu=args.comments_per_menu,
+        seed=args.seed,
+    )
+    selected = [scenario for scenario in SCENARIOS if not args.only or scenario.name in args.only]
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        engine = get_engine()
+        seed_started = time.perf_counter()
+        data = seed(engine, config, reset=args.reset)
+        seed_seconds = time.perf_counter() - seed_started
+
+        rng = random.Random(args.seed)
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        results = {}
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for scenario in selected:
+                if tracemalloc.is_tracing():
+                    tracemalloc.reset_peak()
+                results[scenario.name] = await run_scenario(
+                    client, scenario, data, args.requests, args.concurrency, args.warmup, rng
+                )
+                results[scenario.name]["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                if tracemalloc.is_tracing():
+                    results[scenario.name]["peak_memory_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                print(f"{scenario.name:<22} {results[scenario.name]['throughput_rps']:>10.1f} req/s  "
+                      f"p95 {results[scenario.name]['latency_ms']['p95']:>8.2f} ms  "
+                      f"sql {results[scenario.name]['sql_statements']['mean']:>6.1f}")
+
+    return {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "dialect": engine.dialect.name,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "trace_memory": args.trace_memory,
+            "seed": describe(config),
+            "seed_rows": data.rows,
+            "seed_seconds": round(seed_seconds, 3),
+        },
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark API hot paths in-process.")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--menus-per-day", type=int, default=2)
+    parser.add_argument("--foods-per-menu", type=int, default=5)
+    parser.add_argument("--food-pool", type=int, default=120)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--scores-per-food", type=int, default=50)
+    parser.add_argument("--votes-per-menu", type=int, default=100)
+    parser.add_argument("--comments-per-menu", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 측정 요청 수")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="tracemalloc으로 시나리오별 최대 할당량 측정 (지연 시간에 오버헤드 포함)"
+    )
+    parser.add_argument("--only", nargs="*", help="실행할 시나리오 이름")
+    parser.add_argument("--reset", action="store_true", help="대상 DB의 테이블을 삭제 후 다시 생성")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    if args.trace_memory:
+        # tracemalloc은 스레드가 생기기 전에 시작해야 안전합니다.
+        tracemalloc.start()
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
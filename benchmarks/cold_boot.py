@@ -0,0 +1,98 @@
+"""
+worker 콜드 부팅 시간 벤치마크.
+
+새 인터프리터 프로세스에서 `app.main` import, `create_app()`, lifespan 시작/종료까지 걸리는
+시간을 여러 번 측정하여 중앙값과 최댓값을 출력합니다.
+
+사용법:
+    python -m benchmarks.cold_boot --runs 10 --output cold_boot.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+_PROBE = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+application = app.main.create_app()
+t2 = time.perf_counter()
+
+async def boot():
+    async with application.router.lifespan_context(application):
+        started = time.perf_counter()
+    return started, time.perf_counter()
+
+t3, t4 = asyncio.run(boot())
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "create_app_ms": (t2 - t1) * 1000,
+    "startup_ms": (t3 - t2) * 1000,
+    "shutdown_ms": (t4 - t3) * 1000,
+    "numpy_loaded": "numpy" in sys.modules,
+}))
+"""
+
+
+def run_once(env: Dict[str, str]) -> Dict[str, Any]:
+    """
+    새 프로세스에서 부팅 과정을 한 번 측정합니다.
+
+    Args:
+        env (Dict[str, str]): 하위 프로세스 환경 변수.
+
+    Returns:
+        Dict[str, Any]: 단계별 소요 시간(ms)과 인터프리터 시작을 포함한 전체 시간.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["total_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """측정 결과를 단계별 중앙값/최댓값으로 요약합니다."""
+    summary: Dict[str, Any] = {"runs": len(runs), "numpy_loaded": runs[-1]["numpy_loaded"]}
+    for key in ("import_ms", "create_app_ms", "startup_ms", "shutdown_ms", "total_ms"):
+        values = [run[key] for run in runs]
+        summary[key] = {
+            "median": round(statistics.median(values), 3),
+            "max": round(max(values), 3),
+        }
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold boot time of the API worker.")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # 부팅 시간만 측정하도록 테이블 생성은 비활성화합니다.
+    env.setdefault("DB_AUTO_CREATE", "false")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+
+    summary = summarize([run_once(env) for _ in range(args.runs)])
+    print(json.dumps(summary, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(summary, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+두 벤치마크 결과(JSON)를 비교하여 시나리오별 변화율을 출력합니다.
+
+사용법:
+    python -m benchmarks.compare base.json head.json [--threshold 10]
+
+`--threshold`(%)보다 나빠진 지표가 있으면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+# (지표 경로, 값이 클수록 좋은지 여부)
+METRICS: List[Tuple[Tuple[str, ...], bool]] = [
+    (("throughput_rps",), True),
+    (("latency_ms", "p50"), False),
+    (("latency_ms", "p95"), False),
+    (("latency_ms", "p99"), False),
+    (("sql_statements", "mean"), False),
+    (("peak_memory_kb",), False),
+    (("peak_rss_kb",), False),
+]
+
+
+def _get(result: Dict[str, Any], path: Tuple[str, ...]) -> float:
+    for key in path:
+        result = result[key]
+    return float(result)
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float) -> bool:
+    """
+    결과를 비교해 출력하고, 임계값을 넘는 성능 저하가 있었는지 반환합니다.
+
+    Args:
+        base (Dict[str, Any]): 기준 결과.
+        head (Dict[str, Any]): 비교 대상 결과.
+        threshold (float): 성능 저하로 판단할 변화율 (%).
+
+    Returns:
+        bool: 성능 저하가 있으면 `True`.
+    """
+    regressed = False
+    print(f"base {base['meta'].get('revision')}  ->  head {head['meta'].get('revision')}")
+    for name, head_result in head["scenarios"].items():
+        base_result = base["scenarios"].get(name)
+        if base_result is None:
+            print(f"{name:<22} (new)")
+            continue
+
+        cells = []
+        for path, higher_is_better in METRICS:
+            try:
+                before, after = _get(base_result, path), _get(head_result, path)
+            except (KeyError, TypeError):
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            worse = -change if higher_is_better else change
+            flag = "!" if worse > threshold else " "
+            regressed = regressed or worse > threshold
+            cells.append(f"{'.'.join(path)} {after:.2f} ({change:+.1f}%){flag}")
+        print(f"{name:<22} " + "  ".join(cells))
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports.")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="성능 저하 판단 기준 (%)")
+    args = parser.parse_args()
+
+    with open(args.base) as base_file, open(args.head) as head_file:
+        regressed = compare(json.load(base_file), json.load(head_file), args.threshold)
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+"""
+부하 테스트용 대용량 합성 데이터 생성기.
+
+수년치 일별 메뉴, 수천 명의 사용자, 음식별 인기도 편차(Zipf 분포), 같은 사용자의 반복 평가를 포함한
+`Menu`, `Food`, `food_menu_table`, `Score`, `Vote`, `Comment`, `FrontLog` 데이터를 API를 거치지 않고
+DB에 직접 기록합니다.
+
+- 같은 `--seed`와 옵션으로 실행하면 항상 같은 데이터가 생성됩니다.
+- 행은 메모리에 모두 올리지 않고 `--batch-size` 단위로 나누어 multi-row INSERT(executemany)로 기록합니다.
+- MySQL과 SQLite를 지원하며, 적재 중에는 세션 단위로 제약 검사/동기화를 완화합니다.
+
+사용 예:
+    python -m benchmarks.datagen --url sqlite:////tmp/load.db --days 1095 --scores-per-food 3000 --reset
+"""
+import argparse
+import json
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Table, create_engine, func, select
+from sqlalchemy.engine import Connection, Engine
+
+from app.models import Base
+from app.models.comments import Comment
+from app.models.food_menu import food_menu_table
+from app.models.foods import Food
+from app.models.logs import FrontLog
+from app.models.menus import Menu
+from app.models.scores import Score
+from app.models.votes import Vote
+
+_FOOD_BASES = [
+    "김치찌개", "된장찌개", "부대찌개", "순두부찌개", "제육볶음", "불고기", "닭갈비", "비빔밥", "돈까스", "카레라이스",
+    "짜장면", "짬뽕", "떡볶이", "잡채", "갈비찜", "닭볶음탕", "고등어구이", "오징어볶음", "미역국", "소고기무국",
+    "콩나물국", "어묵탕", "계란말이", "감자조림", "멸치볶음", "시금치나물", "김치볶음밥", "오므라이스", "냉면", "칼국수",
+]
+_FOOD_PREFIXES = ["", "매콤 ", "치즈 ", "수제 ", "옛날 ", "얼큰 ", "한우 ", "버섯 "]
+_COMMENT_PHRASES = [
+    "정말 맛있어요", "너무 짜요", "양이 적어요", "또 먹고 싶어요", "간이 딱 좋아요", "조금 싱거워요",
+    "오늘 메뉴 최고", "식었어요", "맵지만 맛있어요", "다음에도 나왔으면 좋겠어요", "별로였어요", "양이 많아서 좋아요",
+]
+_FRONT_EVENTS = [
+    ("page_view", "home"), ("page_view", "menu"), ("click_menu", "menu"), ("submit_score", "menu"),
+    ("submit_vote", "vote"), ("submit_comment", "menu"), ("page_view", "statistics"),
+]
+
+
+@dataclass
+class DatagenConfig:
+    """
+    합성 데이터 규모 및 분포 설정.
+
+    Attributes:
+        days (int): 메뉴를 생성할 일수.
+        start (date): 첫 메뉴 날짜.
+        menus_per_day (int): 하루 메뉴 수 (투표 대상).
+        foods_per_menu (int): 메뉴당 음식 수.
+        foods (int): 서로 다른 음식 종류 수.
+        user_count (int): 사용자 수.
+        scores_per_food (float): 메뉴에 포함된 음식 하나가 받는 평균 점수 수 (인기도에 따라 증감).
+        popularity_skew (float): 음식 인기도 Zipf 지수 (클수록 소수 음식에 평가가 몰림).
+        activity_skew (float): 사용자 활동량 Zipf 지수.
+        repeat_ratio (float): 같은 사용자가 같은 음식을 다시 평가하는 비율.
+        vote_ratio (float): 하루 투표에 참여하는 사용자 비율.
+        comments_per_menu (float): 메뉴당 평균 댓글 수.
+        front_logs_per_day (int): 하루 프론트엔드 로그 수.
+        batch_size (int): INSERT 한 번에 기록할 행 수.
+        seed (int): 난수 시드.
+    """
+    days: int = 730
+    start: date = date(2023, 3, 2)
+    menus_per_day: int = 2
+    foods_per_menu: int = 6
+    foods: int = 400
+    user_count: int = 5000
+    scores_per_food: float = 120.0
+    popularity_skew: float = 1.1
+    activity_skew: float = 1.2
+    repeat_ratio: float = 0.15
+    vote_ratio: float = 0.3
+    comments_per_menu: float = 15.0
+    front_logs_per_day: int = 2000
+    batch_size: int = 10000
+    seed: int = 42
+
+
+class _BulkWriter:
+    """
+    테이블 하나에 대한 버퍼링된 bulk INSERT.
+
+    SQLAlchemy 컴파일 과정을 거치지 않고 DBAPI `executemany`로 튜플을 전달합니다.
+    pymysql은 이를 multi-row `INSERT ... VALUES (...), (...)`로 재작성하고,
+    sqlite3는 준비된 문장을 재사용합니다.
+    """
+
+    def __init__(self, conn: Connection, table: Table, columns: Sequence[str], batch_size: int) -> None:
+        preparer = conn.dialect.identifier_preparer
+        placeholder = "?" if conn.dialect.paramstyle == "qmark" else "%s"
+        self.sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            preparer.format_table(table),
+            ", ".join(preparer.quote(column) for column in columns),
+            ", ".join([placeholder] * len(columns)),
+        )
+        self.conn = conn
+        self.batch_size = batch_size
+        self.buffer: List[Tuple[Any, ...]] = []
+        self.count = 0
+
+    def extend(self, rows: List[Tuple[Any, ...]]) -> None:
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for offset in range(0, len(self.buffer), self.batch_size):
+            chunk = self.buffer[offset:offset + self.batch_size]
+            self.conn.exec_driver_sql(self.sql, chunk)
+            self.count += len(chunk)
+        self.buffer = []
+        self.conn.commit()
+
+
+def _zipf_cdf(size: int, skew: float, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """임의 순서의 Zipf 가중치와 그 누적 분포를 반환합니다."""
+    weights = 1.0 / np.arange(1, size + 1) ** skew
+    weights = weights[rng.permutation(size)]
+    weights /= weights.sum()
+    return weights, np.cumsum(weights)
+
+
+def _sample(cdf: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+    return np.minimum(np.searchsorted(cdf, rng.random(size)), len(cdf) - 1)
+
+
+def _food_names(count: int) -> List[str]:
+    names = [prefix + base for prefix in _FOOD_PREFIXES for base in _FOOD_BASES]
+    return [names[index] if index < len(names) else f"{names[index % len(names)]} {index // len(names) + 1}"
+            for index in range(count)]
+
+
+def _time_labels(dialect: str) -> List[str]:
+    """
+    하루의 초(0 ~ 86399) -> 시각 문자열 조회표.
+
+    SQLite에서는 SQLAlchemy `DateTime`의 저장 형식(마이크로초 포함)과 같아야
+    날짜 범위 비교가 문자열 비교로 올바르게 동작합니다.
+    """
+    suffix = ".000000" if dialect == "sqlite" else ""
+    return [f"{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}{suffix}" for second in range(86400)]
+
+
+def _tune_session(conn: Connection) -> None:
+    if conn.dialect.name == "mysql":
+        conn.exec_driver_sql("SET SESSION unique_checks = 0")
+        conn.exec_driver_sql("SET SESSION foreign_key_checks = 0")
+    elif conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        conn.exec_driver_sql("PRAGMA temp_store = MEMORY")
+    conn.commit()
+
+
+def _restore_session(conn: Connection) -> None:
+    if conn.dialect.name == "mysql":
+        conn.exec_driver_sql("SET SESSION unique_checks = 1")
+        conn.exec_driver_sql("SET SESSION foreign_key_checks = 1")
+        conn.commit()
+
+
+def generate(
+    engine: Engine,
+    config: DatagenConfig,
+    reset: bool = False,
+    defer_indexes: bool = False,
+    progress: bool = True
+) -> Dict[str, int]:
+    """
+    설정에 따라 합성 데이터를 생성하여 DB에 기록합니다.
+
+    Args:
+        engine (Engine): 대상 DB 엔진.
+        config (DatagenConfig): 데이터 규모 및 분포 설정.
+        reset (bool): `True`이면 기존 테이블을 삭제 후 다시 생성합니다.
+        defer_indexes (bool): `True`이면 대용량 테이블의 보조 인덱스를 적재 후에 생성합니다.
+        progress (bool): 진행 상황을 stderr에 출력할지 여부.
+
+    Returns:
+        Dict[str, int]: 테이블별 생성 행 수.
+
+    Raises:
+        RuntimeError: `reset` 없이 메뉴가 이미 존재하는 DB에 실행한 경우.
+    """
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    rng = np.random.default_rng(config.seed)
+    started = time.perf_counter()
+
+    def report(message: str) -> None:
+        if progress:
+            print(f"[{time.perf_counter() - started:8.1f}s] {message}", file=sys.stderr)
+
+    bulk_tables = [Score.__table__, Vote.__table__, Comment.__table__, FrontLog.__table__]
+    deferred = [index for table in bulk_tables for index in table.indexes] if defer_indexes else []
+
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(Menu)).scalar():
+            raise RuntimeError("Target database already has menus. Use --reset on a scratch database.")
+        for index in deferred:
+            index.drop(conn)
+        _tune_session(conn)
+
+        user_ids = np.array(
+            [str(uuid.UUID(bytes=rng.bytes(16), version=4)) for _ in range(config.user_count)], dtype=object
+        )
+        _, user_cdf = _zipf_cdf(config.user_count, config.activity_skew, rng)
+        popularity, food_cdf = _zipf_cdf(config.foods, config.popularity_skew, rng)
+        # 인기 음식은 메뉴에도 자주 오르므로 메뉴당 평가 수에는 인기도를 완화(제곱근)하여 반영하고,
+        # 메뉴에 오른 음식 기준 기대값이 1이 되도록 정규화합니다.
+        popularity = np.sqrt(popularity)
+        popularity /= np.dot(popularity ** 2, popularity)
+        quality = np.clip(rng.normal(3.6, 0.5, config.foods), 1.5, 4.8)
+
+        labels = _time_labels(conn.dialect.name)
+        writers = {
+            "foods": _BulkWriter(conn, Food.__table__, ["id", "name"], config.batch_size),
+            "menus": _BulkWriter(conn, Menu.__table__, ["id", "created_at"], config.batch_size),
+            "food_menu": _BulkWriter(conn, food_menu_table, ["food_id", "menu_id"], config.batch_size),
+            "scores": _BulkWriter(conn, Score.__table__, ["user_id", "score", "created_at", "food_id"], config.batch_size),
+            "votes": _BulkWriter(conn, Vote.__table__, ["user_id", "created_at", "menu_id"], config.batch_size),
+            "comments": _BulkWriter(conn, Comment.__table__, ["user_id", "comment", "created_at", "menu_id"], config.batch_size),
+            "front_logs": _BulkWriter(
+                conn, FrontLog.__table__,
+                ["user_id", "event_name", "event_value", "page_name", "event_time"], config.batch_size
+            ),
+        }
+
+        food_names = _food_names(config.foods)
+        writers["foods"].extend([(index + 1, name) for index, name in enumerate(food_names)])
+        writers["foods"].flush()
+
+        menu_id = 0
+        for day in range(config.days):
+            served = config.start + timedelta(days=day)
+            prefix = served.isoformat() + " "
+            menu_time = prefix + labels[11 * 3600]
+            day_menus: List[Tuple[int, np.ndarray]] = []
+
+            for _ in range(config.menus_per_day):
+                menu_id += 1
+                foods = np.unique(_sample(food_cdf, config.foods_per_menu * 3, rng))[:config.foods_per_menu]
+                day_menus.append((menu_id, foods))
+                writers["menus"].extend([(menu_id, menu_time)])
+                writers["food_menu"].extend([(int(food) + 1, menu_id) for food in foods])
+
+                for food in foods:
+                    total = int(rng.poisson(config.scores_per_food * popularity[food]))
+                    if not total:
+                        continue
+                    repeats = int(total * config.repeat_ratio)
+                    raters = _sample(user_cdf, total - repeats, rng)
+                    if repeats and len(raters):
+                        raters = np.concatenate([raters, rng.choice(raters, repeats)])
+                    values = np.clip(np.rint(rng.normal(quality[food], 0.9, len(raters))), 1, 5)
+                    # 점심 시간(11시) 직후에 몰리는 평가 시각
+                    seconds = np.minimum(11 * 3600 + rng.gamma(2.0, 900.0, len(raters)).astype(np.int64), 86399)
+                    writers["scores"].extend(list(zip(
+                        user_ids[raters].tolist(),
+                        values.tolist(),
+                        [prefix + labels[second] for second in seconds.tolist()],
+                        [int(food) + 1] * len(raters),
+                    )))
+
+                comment_count = int(rng.poisson(config.comments_per_menu))
+                if comment_count:
+                    commenters = _sample(user_cdf, comment_count, rng)
+                    targets = rng.choice(foods, comment_count)
+                    phrases = rng.integers(0, len(_COMMENT_PHRASES), comment_count)
+                    seconds = np.minimum(11 * 3600 + rng.gamma(2.0, 1200.0, comment_count).astype(np.int64), 86399)
+                    writers["comments"].extend([
+                        (user_ids[user], f"{food_names[target]} {_COMMENT_PHRASES[phrase]}", prefix + labels[second], menu_id)
+                        for user, target, phrase, second in zip(
+                            commenters.tolist(), targets.tolist(), phrases.tolist(), seconds.tolist()
+                        )
+                    ])
+
+            voters = rng.choice(config.user_count, int(config.user_count * config.vote_ratio), replace=False)
+            if len(voters):
+                appeal = np.exp(np.array([quality[foods].mean() for _, foods in day_menus]))
+                choices = rng.choice(len(day_menus), len(voters), p=appeal / appeal.sum())
+                seconds = rng.integers(9 * 3600, 11 * 3600, len(voters))
+                writers["votes"].extend([
+                    (user_ids[user], prefix + labels[second], day_menus[choice][0])
+                    for user, choice, second in zip(voters.tolist(), choices.tolist(), seconds.tolist())
+                ])
+
+            if config.front_logs_per_day:
+                actors = _sample(user_cdf, config.front_logs_per_day, rng)
+                events = rng.integers(0, len(_FRONT_EVENTS), config.front_logs_per_day)
+                seconds = rng.integers(9 * 3600, 14 * 3600, config.front_logs_per_day)
+                menus = rng.integers(0, len(day_menus), config.front_logs_per_day)
+                writers["front_logs"].extend([
+                    (
+                        user_ids[user],
+                        _FRONT_EVENTS[event][0],
+                        json.dumps({"menu_id": day_menus[menu][0]}),
+                        _FRONT_EVENTS[event][1],
+                        prefix + labels[second],
+                    )
+                    for user, event, second, menu in zip(
+                        actors.tolist(), events.tolist(), seconds.tolist(), menus.tolist()
+                    )
+                ])
+
+            if progress and (day + 1) % 30 == 0:
+                report(f"{served.isoformat()}  scores={writers['scores'].count + len(writers['scores'].buffer):,}")
+
+        for writer in writers.values():
+            writer.flush()
+        _restore_session(conn)
+
+        for index in deferred:
+            report(f"creating index {index.name}")
+            index.create(conn)
+        conn.commit()
+
+    rows = {
+        "foods": writers["foods"].count,
+        "menus": writers["menus"].count,
+        "food_menu_table": writers["food_menu"].count,
+        "scores": writers["scores"].count,
+        "votes": writers["votes"].count,
+        "comments": writers["comments"].count,
+        "front_logs": writers["front_logs"].count,
+    }
+    elapsed = time.perf_counter() - started
+    report(f"done: {sum(rows.values()):,} rows in {elapsed:.1f}s ({sum(rows.values()) / elapsed:,.0f} rows/s)")
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.datagen", description=__doc__.strip().splitlines()[0])
+    defaults = DatagenConfig()
+    parser.add_argument("--url", help="대상 DB URL (기본: 애플리케이션 설정의 DB)")
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument("--start", type=date.fromisoformat, default=defaults.start)
+    parser.add_argument("--menus-per-day", type=int, default=defaults.menus_per_day)
+    parser.add_argument("--foods-per-menu", type=int, default=defaults.foods_per_menu)
+    parser.add_argument("--foods", type=int, default=defaults.foods)
+    parser.add_argument("--users", dest="user_count", type=int, default=defaults.user_count)
+    parser.add_argument("--scores-per-food", type=float, default=defaults.scores_per_food)
+    parser.add_argument("--popularity-skew", type=float, default=defaults.popularity_skew)
+    parser.add_argument("--activity-skew", type=float, default=defaults.activity_skew)
+    parser.add_argument("--repeat-ratio", type=float, default=defaults.repeat_ratio)
+    parser.add_argument("--vote-ratio", type=float, default=defaults.vote_ratio)
+    parser.add_argument("--comments-per-menu", type=float, default=defaults.comments_per_menu)
+    parser.add_argument("--front-logs-per-day", type=int, default=defaults.front_logs_per_day)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--reset", action="store_true", help="기존 테이블을 삭제 후 다시 생성")
+    parser.add_argument("--defer-indexes", action="store_true", help="보조 인덱스를 적재 후에 생성")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    config = DatagenConfig(**{
+        key: getattr(args, key) for key in asdict(defaults)
+    })
+    if args.url:
+        url = args.url
+    else:
+        from app.config import get_settings
+        url = get_settings().db_url
+
+    engine = create_engine(url)
+    try:
+        rows = generate(engine, config, reset=args.reset, defer_indexes=args.defer_indexes, progress=not args.quiet)
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+    finally:
+        engine.dispose()
+
+    print(json.dumps({"config": {**asdict(config), "start": config.start.isoformat()}, "rows": rows}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
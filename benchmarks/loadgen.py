@@ -0,0 +1,460 @@
+"""
+점심 시간 트래픽 모델 기반 부하 생성기.
+
+가상 사용자가 목표 도착률(초당 journey 수, Poisson 도착)로 유입되어 사용자 여정(journey)을 순서대로 수행합니다.
+각 사용자는 이전 응답을 받은 뒤 think time만큼 기다렸다가 다음 요청을 보내는 closed-loop 방식으로 동작합니다.
+
+도착률을 단계적으로 올리며(ramp) 단계별로 엔드포인트별 지연 시간 히스토그램/분위수와 오류율을 측정하고,
+SLO(p95 지연 시간, 오류율)를 만족하지 못하는 단계에서 멈춰 직전 단계의 처리량을 포화 처리량으로 보고합니다.
+
+사용법:
+    # 실행 중인 서버 대상 (worker/풀 크기 용량 산정)
+    python -m benchmarks.loadgen --base-url http://127.0.0.1:8000 --date 2025-03-03 --output load.json
+    # in-process 앱 대상 (부하 생성기와 앱이 같은 프로세스의 CPU를 공유합니다)
+    python -m benchmarks.loadgen --date 2025-03-03 --think-scale 0.1
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+# 지연 시간 히스토그램 버킷 상한 (ms). 마지막 버킷은 상한 없음.
+HISTOGRAM_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class JourneyState:
+    """
+    가상 사용자 한 명의 여정 상태.
+
+    Attributes:
+        user_id (str): 요청 헤더(`user-id`)로 전달되는 사용자 식별자.
+        date (str): 조회할 메뉴 날짜 (`YYYY-MM-DD`).
+        menus (List[Tuple[int, List[int]]]): 조회된 (메뉴 ID, 음식 ID 목록).
+        menu_index (Optional[int]): 사용자가 고른 메뉴의 인덱스.
+    """
+    user_id: str
+    date: str
+    menus: List[Tuple[int, List[int]]] = field(default_factory=list)
+    menu_index: Optional[int] = None
+
+    def menu(self, rng: random.Random) -> Optional[Tuple[int, List[int]]]:
+        if not self.menus:
+            return None
+        if self.menu_index is None:
+            self.menu_index = rng.randrange(len(self.menus))
+        return self.menus[self.menu_index]
+
+
+@dataclass
+class Action:
+    """
+    journey를 구성하는 요청 종류.
+
+    Attributes:
+        endpoint (str): 결과 집계에 사용하는 라우트 템플릿.
+        build (Callable[[JourneyState, random.Random], Optional[Dict[str, Any]]]):
+            요청 인자(method, url, json) 생성 함수. 전제 조건(조회된 메뉴 등)이 없으면 `None`을 반환하여 건너뜁니다.
+        ok (Tuple[int, ...]): 정상으로 간주하는 상태 코드 (중복 투표 400 등 예상된 응답 포함).
+        observe (Optional[Callable[[JourneyState, httpx.Response], None]]): 응답으로 여정 상태를 갱신하는 함수.
+    """
+    endpoint: str
+    build: Callable[[JourneyState, random.Random], Optional[Dict[str, Any]]]
+    ok: Tuple[int, ...] = (200,)
+    observe: Optional[Callable[[JourneyState, httpx.Response], None]] = None
+
+
+@dataclass
+class Step:
+    """
+    journey의 한 단계.
+
+    Attributes:
+        action (str): `ACTIONS`의 키.
+        probability (float): 이 단계를 수행할 확률.
+        think_ms (float): 이 단계 전 평균 think time (ms, 지수 분포).
+    """
+    action: str
+    probability: float = 1.0
+    think_ms: float = 1000.0
+
+
+def _observe_menus(state: JourneyState, response: httpx.Response) -> None:
+    if response.status_code == 200:
+        state.menus = [(menu["id"], [food["id"] for food in menu["foods"]]) for menu in response.json()]
+
+
+def _with_menu(builder: Callable[[JourneyState, Tuple[int, List[int]], random.Random], Dict[str, Any]]):
+    def build(state: JourneyState, rng: random.Random) -> Optional[Dict[str, Any]]:
+        menu = state.menu(rng)
+        return builder(state, menu, rng) if menu else None
+    return build
+
+
+def _menu_pair(state: JourneyState) -> str:
+    first = state.menus[0][0]
+    second = state.menus[1][0] if len(state.menus) > 1 else first
+    return f"menu1_id={first}&menu2_id={second}"
+
+
+ACTIONS: Dict[str, Action] = {
+    "menus": Action(
+        "GET /menus/{date}",
+        lambda state, rng: {"method": "GET", "url": f"/api/v1/menus/{state.date}"},
+        observe=_observe_menus,
+    ),
+    "menu_statistics": Action(
+        "GET /statistics/menus/{menu_id}",
+        _with_menu(lambda state, menu, rng: {"method": "GET", "url": f"/api/v1/statistics/menus/{menu[0]}"}),
+    ),
+    "menu_mean": Action(
+        "GET /statistics/mean/menus/{menu_id}",
+        _with_menu(lambda state, menu, rng: {"method": "GET", "url": f"/api/v1/statistics/mean/menus/{menu[0]}"}),
+    ),
+    "score": Action(
+        "POST /scores/",
+        _with_menu(lambda state, menu, rng: {
+            "method": "POST",
+            "url": "/api/v1/scores/",
+            "json": [{"food_id": food_id, "score": float(rng.randint(1, 5))} for food_id in menu[1]],
+        }),
+        ok=(201,),
+    ),
+    "recent_scores": Action(
+        "GET /scores/{menu_id}",
+        _with_menu(lambda state, menu, rng: {"method": "GET", "url": f"/api/v1/scores/{menu[0]}"}),
+    ),
+    "vote": Action(
+        "POST /votes/",
+        _with_menu(lambda state, menu, rng: {
+            "method": "POST",
+            "url": "/api/v1/votes/",
+            "json": {"menu_id": menu[0], "created_at": datetime.now().isoformat()},
+        }),
+        ok=(201, 400),
+    ),
+    "vote_count": Action(
+        "GET /votes/count",
+        lambda state, rng: {"method": "GET", "url": f"/api/v1/votes/count?{_menu_pair(state)}"} if state.menus else None,
+    ),
+    "comments": Action(
+        "GET /comments/{menu_id}",
+        _with_menu(lambda state, menu, rng: {"method": "GET", "url": f"/api/v1/comments/{menu[0]}"}),
+        ok=(200, 400),
+    ),
+    "comment": Action(
+        "POST /comments/",
+        _with_menu(lambda state, menu, rng: {
+            "method": "POST",
+            "url": "/api/v1/comments/",
+            "json": {"menu_id": menu[0], "comment": "맛있어요", "created_at": datetime.now().isoformat()},
+        }),
+        ok=(201, 400),
+    ),
+}
+
+# 점심 시간 기본 여정: 메뉴 확인 -> 통계 확인 -> 점수 제출 -> 투표 -> 투표 현황/댓글 확인
+LUNCH_RUSH_JOURNEY: List[Step] = [
+    Step("menus", 1.0, 0),
+    Step("menu_statistics", 0.6, 3000),
+    Step("score", 0.7, 8000),
+    Step("vote", 0.5, 2000),
+    Step("vote_count", 0.5, 1500),
+    Step("comments", 0.3, 2000),
+    Step("comment", 0.1, 5000),
+]
+
+
+class Recorder:
+    """엔드포인트별 지연 시간과 오류를 누적하는 클래스."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+
+    def record(self, endpoint: str, elapsed_ms: float, status: str, ok: bool) -> None:
+        self.latencies.setdefault(endpoint, []).append(elapsed_ms)
+        self.errors[endpoint] = self.errors.get(endpoint, 0) + (not ok)
+        statuses = self.statuses.setdefault(endpoint, {})
+        statuses[status] = statuses.get(status, 0) + 1
+
+    def summary(self, wall: float) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            latencies = np.array(values)
+            counts = np.bincount(np.searchsorted(HISTOGRAM_BUCKETS_MS, latencies), minlength=len(HISTOGRAM_BUCKETS_MS) + 1)
+            labels = [f"le_{bound:g}" for bound in HISTOGRAM_BUCKETS_MS] + ["inf"]
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": self.errors[endpoint],
+                "error_rate": round(self.errors[endpoint] / len(values), 4),
+                "latency_ms": {
+                    "p50": round(float(np.percentile(latencies, 50)), 3),
+                    "p95": round(float(np.percentile(latencies, 95)), 3),
+                    "p99": round(float(np.percentile(latencies, 99)), 3),
+                    "max": round(float(latencies.max()), 3),
+                },
+                "histogram_ms": dict(zip(labels, counts.tolist())),
+                "status_codes": self.statuses[endpoint],
+            }
+
+        total = sum(len(values) for values in self.latencies.values())
+        errors = sum(self.errors.values())
+        return {
+            "requests": total,
+            "throughput_rps": round(total / wall, 3) if wall else 0.0,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+async def run_journey(
+    client: httpx.AsyncClient,
+    journey: List[Step],
+    state: JourneyState,
+    recorder: Recorder,
+    deadline: float,
+    think_scale: float,
+    rng: random.Random
+) -> None:
+    """
+    가상 사용자 한 명의 여정을 수행합니다.
+
+    단계 종료 시각(`deadline`)이 지나면 새 요청을 보내지 않고 종료합니다.
+    """
+    loop = asyncio.get_running_loop()
+    for step in journey:
+        if rng.random() >= step.probability:
+            continue
+        if step.think_ms:
+            think = rng.expovariate(1000.0 / (step.think_ms * think_scale)) if think_scale else 0.0
+            await asyncio.sleep(min(think, max(deadline - loop.time(), 0.0)))
+        if loop.time() >= deadline:
+            return
+
+        action = ACTIONS[step.action]
+        request = action.build(state, rng)
+        if request is None:
+            continue
+        start = time.perf_counter()
+        try:
+            response = await client.request(headers={"user-id": state.user_id}, **request)
+        except httpx.HTTPError as error:
+            recorder.record(action.endpoint, (time.perf_counter() - start) * 1000, type(error).__name__, False)
+            return
+        recorder.record(
+            action.endpoint, (time.perf_counter() - start) * 1000, str(response.status_code),
+            response.status_code in action.ok
+        )
+        if action.observe:
+            action.observe(state, response)
+
+
+async def run_stage(
+    client: httpx.AsyncClient,
+    journey: List[Step],
+    arrival_rate: float,
+    duration: float,
+    max_users: int,
+    dates: List[str],
+    think_scale: float,
+    rng: random.Random
+) -> Dict[str, Any]:
+    """
+    고정 도착률로 한 단계를 실행합니다.
+
+    Args:
+        client (httpx.AsyncClient): 대상 클라이언트.
+        journey (List[Step]): 사용자 여정.
+        arrival_rate (float): 초당 신규 사용자(journey) 수.
+        duration (float): 단계 길이 (초).
+        max_users (int): 동시 활성 사용자 상한. 초과한 도착은 버려지고 `dropped_arrivals`로 집계됩니다.
+        dates (List[str]): 사용자가 조회할 메뉴 날짜 후보.
+        think_scale (float): think time 배율.
+        rng (random.Random): 난수 생성기.
+
+    Returns:
+        Dict[str, Any]: 단계 측정 결과.
+    """
+    loop = asyncio.get_running_loop()
+    recorder = Recorder()
+    active: set = set()
+    arrivals = dropped = 0
+
+    started = loop.time()
+    deadline = started + duration
+    next_arrival = started
+    while next_arrival < deadline:
+        delay = next_arrival - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        arrivals += 1
+        if len(active) >= max_users:
+            dropped += 1
+        else:
+            state = JourneyState(user_id=str(uuid.UUID(int=rng.getrandbits(128), version=4)), date=rng.choice(dates))
+            task = asyncio.create_task(run_journey(client, journey, state, recorder, deadline, think_scale, rng))
+            active.add(task)
+            task.add_done_callback(active.discard)
+        next_arrival += rng.expovariate(arrival_rate)
+
+    if active:
+        await asyncio.gather(*active)
+    result = recorder.summary(loop.time() - started)
+    result.update({"arrival_rate": arrival_rate, "arrivals": arrivals, "dropped_arrivals": dropped})
+    return result
+
+
+def evaluate_slo(stage: Dict[str, Any], p95_ms: float, error_rate: float) -> Optional[str]:
+    """
+    단계 결과가 SLO를 위반하면 사유를, 만족하면 `None`을 반환합니다.
+
+    모든 엔드포인트의 p95 지연 시간과 전체 오류율을 검사하며,
+    동시 사용자 상한으로 도착이 버려진 경우도 포화로 간주합니다.
+    """
+    if not stage["requests"]:
+        return "no requests completed"
+    if stage["error_rate"] > error_rate:
+        return f"error rate {stage['error_rate']:.2%} > {error_rate:.2%}"
+    for endpoint, summary in stage["endpoints"].items():
+        if summary["latency_ms"]["p95"] > p95_ms:
+            return f"{endpoint} p95 {summary['latency_ms']['p95']:.1f}ms > {p95_ms:g}ms"
+    if stage["dropped_arrivals"]:
+        return f"{stage['dropped_arrivals']} arrivals dropped at max users"
+    return None
+
+
+def load_journey(path: Optional[str]) -> List[Step]:
+    """
+    JSON 파일(`[{"action": ..., "probability": ..., "think_ms": ...}, ...]`)에서 여정을 읽습니다.
+    경로가 없으면 점심 시간 기본 여정을 반환합니다.
+    """
+    if not path:
+        return LUNCH_RUSH_JOURNEY
+    with open(path, encoding="utf-8") as file:
+        steps = [Step(**step) for step in json.load(file)]
+    unknown = [step.action for step in steps if step.action not in ACTIONS]
+    if unknown:
+        raise ValueError(f"Unknown journey actions: {', '.join(unknown)} (available: {', '.join(ACTIONS)})")
+    return steps
+
+
+@asynccontextmanager
+async def target_client(base_url: Optional[str], max_users: int, timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    부하 대상 클라이언트를 생성합니다.
+
+    `base_url`이 없으면 in-process 앱을 생성하고 lifespan을 실행한 뒤 ASGI transport로 연결합니다.
+    """
+    limits = httpx.Limits(max_connections=max_users, max_keepalive_connections=max_users)
+    if base_url:
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+            yield client
+        return
+
+    from app.main import create_app
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadgen", timeout=timeout) as client:
+            yield client
+
+
+async def run(args: argparse.Namespace, journey: List[Step]) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    stages: List[Dict[str, Any]] = []
+    saturation: Optional[Dict[str, Any]] = None
+
+    async with target_client(args.base_url, args.max_users, args.timeout) as client:
+        rate = args.start_rate
+        while rate <= args.max_rate:
+            stage = await run_stage(
+                client, journey, rate, args.stage_seconds, args.max_users, args.date, args.think_scale, rng
+            )
+            stage["slo_violation"] = evaluate_slo(stage, args.slo_p95_ms, args.slo_error_rate)
+            stages.append(stage)
+            print(
+                f"rate {rate:8.2f}/s  {stage['throughput_rps']:8.2f} req/s  errors {stage['error_rate']:6.2%}  "
+                f"{stage['slo_violation'] or 'ok'}",
+                file=sys.stderr
+            )
+            if stage["slo_violation"]:
+                break
+            saturation = {"arrival_rate": rate, "throughput_rps": stage["throughput_rps"]}
+            rate *= args.ramp_factor
+
+    return {
+        "meta": {
+            "target": args.base_url or "in-process",
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "dates": args.date,
+            "seed": args.seed,
+            "journey": [asdict(step) for step in journey],
+            "think_scale": args.think_scale,
+            "max_users": args.max_users,
+            "slo": {"p95_ms": args.slo_p95_ms, "error_rate": args.slo_error_rate},
+        },
+        "stages": stages,
+        # SLO를 만족한 마지막 단계. 첫 단계부터 위반하면 None.
+        "saturation": saturation,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadgen", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", help="대상 서버 주소 (생략하면 in-process 앱)")
+    parser.add_argument("--date", action="append", help="조회할 메뉴 날짜, 여러 번 지정 가능 (기본: 오늘)")
+    parser.add_argument("--journey", help="사용자 여정 JSON 파일 (기본: 점심 시간 여정)")
+    parser.add_argument("--start-rate", type=float, default=1.0, help="첫 단계 도착률 (journey/s)")
+    parser.add_argument("--ramp-factor", type=float, default=1.5, help="단계마다 도착률에 곱할 배수")
+    parser.add_argument("--max-rate", type=float, default=1000.0)
+    parser.add_argument("--stage-seconds", type=float, default=30.0)
+    parser.add_argument("--max-users", type=int, default=1000, help="동시 활성 가상 사용자 상한")
+    parser.add_argument("--think-scale", type=float, default=1.0, help="think time 배율 (0이면 대기 없음)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--slo-p95-ms", type=float, default=500.0)
+    parser.add_argument("--slo-error-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략 시 stdout)")
+    args = parser.parse_args(argv)
+    if args.ramp_factor <= 1:
+        parser.error("--ramp-factor must be greater than 1")
+    args.date = args.date or [date.today().isoformat()]
+    try:
+        journey = load_journey(args.journey)
+    except (OSError, TypeError, ValueError) as error:
+        parser.error(str(error))
+
+    report = asyncio.run(run(args, journey))
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    saturation = report["saturation"]
+    if saturation:
+        print(
+            f"saturation: {saturation['throughput_rps']:.2f} req/s at {saturation['arrival_rate']:.2f} journeys/s",
+            file=sys.stderr
+        )
+    else:
+        print("SLO violated at the first stage; lower --start-rate", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
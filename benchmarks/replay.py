@@ -0,0 +1,328 @@
+"""
+`back_logs`에 기록된 실제 트래픽 재생(replay) 도구.
+
+지정한 시간 구간의 `back_logs`를 시간순으로 스트리밍하여 대상 인스턴스에 같은 요청을 다시 보냅니다.
+
+- 원래 간격(`--speed 1`), 가속(`--speed 10`), 또는 최대 속도(`--speed 0`)로 재생합니다.
+- 인증/쿠키 등 민감한 헤더는 제거하며, 필요하면 `--header`로 대체 헤더를 지정합니다.
+- 응답 상태 코드와 본문을 기록된 `response`와 비교하여 회귀를 보고합니다.
+  ID/시각처럼 실행마다 달라지는 필드는 `--ignore-field`로 비교에서 제외합니다.
+
+사용법:
+    python -m benchmarks.replay --source-url mysql+pymysql://... --base-url http://127.0.0.1:8000 \\
+        --from 2025-03-03T11:00 --to 2025-03-03T13:00 --speed 10 --output replay.json
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+from sqlalchemy import and_, create_engine, or_, select
+from sqlalchemy.engine import Engine
+
+from app.models.logs import BackLog
+from benchmarks.loadgen import target_client
+
+# 재생 시 제거하는 요청 헤더 (인증 정보 및 전송 계층에서 다시 계산되는 헤더)
+REDACTED_HEADERS = frozenset({
+    "authorization", "cookie", "proxy-authorization", "x-api-key", "x-profile",
+    "host", "content-length", "connection", "transfer-encoding", "accept-encoding",
+})
+
+# 응답 비교에서 기본으로 제외하는 필드 (재생할 때마다 새로 생성되는 값)
+DEFAULT_IGNORED_FIELDS = ("id", "created_at", "time", "access_token")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_DATE_SEGMENT = re.compile(r"/\d{4}-\d{2}-\d{2}(?=/|$)")
+
+
+def endpoint_template(request_api: str) -> str:
+    """`GET /api/v1/menus/2025-03-03?x=1` -> `GET /api/v1/menus/{date}` 형태로 집계 키를 만듭니다."""
+    path = request_api.split("?", 1)[0]
+    return _ID_SEGMENT.sub("/{id}", _DATE_SEGMENT.sub("/{date}", path))
+
+
+def redact_headers(headers: Optional[Dict[str, Any]], overrides: Dict[str, str]) -> Dict[str, str]:
+    """기록된 요청 헤더에서 민감한 헤더를 제거하고 대체 헤더를 덮어씁니다."""
+    redacted = {
+        name: str(value) for name, value in (headers or {}).items()
+        if name.lower() not in REDACTED_HEADERS
+    }
+    redacted.update(overrides)
+    return redacted
+
+
+def diff_body(expected: Any, actual: Any, ignored: Sequence[str], path: str = "$") -> Optional[str]:
+    """
+    두 JSON 값을 재귀적으로 비교하여 첫 번째 차이의 위치를 반환합니다.
+
+    Args:
+        expected (Any): 기록된 응답.
+        actual (Any): 재생한 응답.
+        ignored (Sequence[str]): 비교하지 않을 객체 키.
+        path (str): 현재 비교 위치 (JSONPath 형태).
+
+    Returns:
+        Optional[str]: 차이가 있으면 `$.foods[0].name: 'a' != 'b'` 형태의 설명, 없으면 `None`.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(set(expected) | set(actual)):
+            if key in ignored:
+                continue
+            if key not in expected or key not in actual:
+                return f"{path}.{key}: missing on {'recorded' if key not in expected else 'replayed'} side"
+            difference = diff_body(expected[key], actual[key], ignored, f"{path}.{key}")
+            if difference:
+                return difference
+        return None
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return f"{path}: length {len(expected)} != {len(actual)}"
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            difference = diff_body(left, right, ignored, f"{path}[{index}]")
+            if difference:
+                return difference
+        return None
+    if expected != actual:
+        return f"{path}: {expected!r} != {actual!r}"
+    return None
+
+
+def stream_logs(
+    engine: Engine,
+    start: datetime,
+    end: datetime,
+    exclude: Sequence[str],
+    chunk_size: int
+) -> Iterator[List[Any]]:
+    """
+    구간 [`start`, `end`)의 백엔드 로그를 시간순으로 `chunk_size`개씩 읽습니다.
+
+    (`time`, `id`) 기준 keyset 페이지네이션으로 청크마다 짧은 쿼리를 실행하므로
+    구간 전체를 메모리에 올리거나 읽기 트랜잭션을 재생 내내 유지하지 않습니다.
+    """
+    columns = (BackLog.id, BackLog.time, BackLog.request_api, BackLog.request_header,
+               BackLog.request_body, BackLog.status_code, BackLog.response)
+    last: Optional[Tuple[datetime, int]] = None
+    while True:
+        query = select(*columns).where(BackLog.time >= start, BackLog.time < end)
+        if last is not None:
+            query = query.where(or_(BackLog.time > last[0], and_(BackLog.time == last[0], BackLog.id > last[1])))
+        with engine.connect() as conn:
+            rows = conn.execute(query.order_by(BackLog.time, BackLog.id).limit(chunk_size)).all()
+        if not rows:
+            return
+        last = (rows[-1].time, rows[-1].id)
+        yield [row for row in rows if not row.request_api.split(" ", 1)[-1].startswith(tuple(exclude))]
+
+
+class ReplayReport:
+    """엔드포인트별 재생 결과를 누적하는 클래스."""
+
+    def __init__(self, max_examples: int) -> None:
+        self.max_examples = max_examples
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.latencies: Dict[str, List[float]] = {}
+        self.lags: List[float] = []
+        self.examples: List[Dict[str, Any]] = []
+
+    def record(
+        self,
+        endpoint: str,
+        request_api: str,
+        elapsed_ms: float,
+        lag: float,
+        status_mismatch: Optional[str],
+        body_mismatch: Optional[str],
+        error: Optional[str]
+    ) -> None:
+        summary = self.endpoints.setdefault(
+            endpoint, {"requests": 0, "errors": 0, "status_mismatches": 0, "body_mismatches": 0}
+        )
+        summary["requests"] += 1
+        summary["errors"] += error is not None
+        summary["status_mismatches"] += status_mismatch is not None
+        summary["body_mismatches"] += body_mismatch is not None
+        self.latencies.setdefault(endpoint, []).append(elapsed_ms)
+        self.lags.append(lag)
+
+        problem = error or status_mismatch or body_mismatch
+        if problem and len(self.examples) < self.max_examples:
+            self.examples.append({"request_api": request_api, "problem": problem})
+
+    def to_dict(self, wall: float) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, summary in sorted(self.endpoints.items()):
+            latencies = np.array(self.latencies[endpoint])
+            endpoints[endpoint] = {
+                **summary,
+                "latency_ms": {
+                    "p50": round(float(np.percentile(latencies, 50)), 3),
+                    "p95": round(float(np.percentile(latencies, 95)), 3),
+                    "p99": round(float(np.percentile(latencies, 99)), 3),
+                },
+            }
+        totals = {
+            key: sum(summary[key] for summary in self.endpoints.values())
+            for key in ("requests", "errors", "status_mismatches", "body_mismatches")
+        }
+        lags = np.array(self.lags) if self.lags else np.zeros(1)
+        return {
+            "totals": {**totals, "throughput_rps": round(totals["requests"] / wall, 3) if wall else 0.0},
+            # 예정 시각보다 늦게 전송된 정도 (대상 또는 재생기가 원래 속도를 따라가지 못한 경우 증가)
+            "schedule_lag_ms": {
+                "p50": round(float(np.percentile(lags, 50)) * 1000, 3),
+                "max": round(float(lags.max()) * 1000, 3),
+            },
+            "endpoints": endpoints,
+            "examples": self.examples,
+        }
+
+
+async def replay_one(
+    client: httpx.AsyncClient,
+    row: Any,
+    headers: Dict[str, str],
+    ignored: Sequence[str],
+    compare_body: bool,
+    report: ReplayReport,
+    lag: float
+) -> None:
+    method, url = row.request_api.split(" ", 1)
+    endpoint = endpoint_template(row.request_api)
+    start = time.perf_counter()
+    try:
+        response = await client.request(
+            method, url, json=row.request_body, headers=redact_headers(row.request_header, headers)
+        )
+    except httpx.HTTPError as error:
+        report.record(endpoint, row.request_api, (time.perf_counter() - start) * 1000, lag,
+                      None, None, f"{type(error).__name__}: {error}")
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    status_mismatch = body_mismatch = None
+    if response.status_code != row.status_code:
+        status_mismatch = f"status {row.status_code} != {response.status_code}"
+    elif compare_body:
+        try:
+            body_mismatch = diff_body(row.response, response.json(), ignored)
+        except json.JSONDecodeError:
+            body_mismatch = "$: replayed response is not JSON"
+    report.record(endpoint, row.request_api, elapsed_ms, lag, status_mismatch, body_mismatch, None)
+
+
+async def run(args: argparse.Namespace, overrides: Dict[str, str]) -> Dict[str, Any]:
+    source = create_engine(args.source_url)
+    report = ReplayReport(args.examples)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    pending: set = set()
+    ignored = tuple(args.ignore_field)
+
+    async def limited(row: Any, lag: float) -> None:
+        try:
+            await replay_one(client, row, overrides, ignored, not args.status_only, report, lag)
+        finally:
+            semaphore.release()
+
+    loop = asyncio.get_running_loop()
+    chunks = stream_logs(source, args.start, args.end, args.exclude, args.chunk_size)
+    origin: Optional[Tuple[datetime, float]] = None
+    started = loop.time()
+    try:
+        async with target_client(args.base_url, args.concurrency, args.timeout) as client:
+            while True:
+                rows = await asyncio.to_thread(next, chunks, None)
+                if rows is None:
+                    break
+                for row in rows:
+                    if origin is None:
+                        origin = (row.time, loop.time())
+                    lag = 0.0
+                    if args.speed:
+                        due = origin[1] + (row.time - origin[0]).total_seconds() / args.speed
+                        delay = due - loop.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        lag = max(loop.time() - due, 0.0)
+                    await semaphore.acquire()
+                    task = asyncio.create_task(limited(row, lag))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+    finally:
+        chunks.close()
+        source.dispose()
+
+    return {
+        "meta": {
+            "target": args.base_url or "in-process",
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "window": [args.start.isoformat(), args.end.isoformat()],
+            "speed": args.speed,
+            "concurrency": args.concurrency,
+            "ignored_fields": list(ignored),
+            "redacted_headers": sorted(REDACTED_HEADERS),
+        },
+        **report.to_dict(loop.time() - started),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.replay", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source-url", help="back_logs를 읽을 DB URL (기본: 애플리케이션 설정의 DB)")
+    parser.add_argument("--base-url", help="재생 대상 서버 주소 (생략하면 in-process 앱)")
+    parser.add_argument("--from", dest="start", type=datetime.fromisoformat, required=True)
+    parser.add_argument("--to", dest="end", type=datetime.fromisoformat, required=True)
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (1: 원래 속도, 0: 대기 없이 최대 속도)")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시에 진행 중인 요청 상한")
+    parser.add_argument("--header", action="append", default=[], help="추가/대체 헤더 (`Name: value`)")
+    parser.add_argument("--exclude", action="append", default=["/api/v1/auth"], help="재생하지 않을 경로 접두사")
+    parser.add_argument("--ignore-field", action="append", default=list(DEFAULT_IGNORED_FIELDS))
+    parser.add_argument("--status-only", action="store_true", help="응답 본문은 비교하지 않음")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--examples", type=int, default=20, help="보고서에 포함할 불일치 예시 수")
+    parser.add_argument("--fail-on-mismatch", action="store_true", help="불일치가 있으면 종료 코드 1")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략 시 stdout)")
+    args = parser.parse_args(argv)
+    if args.speed < 0:
+        parser.error("--speed must not be negative")
+
+    overrides = {}
+    for header in args.header:
+        name, separator, value = header.partition(":")
+        if not separator:
+            parser.error(f"Invalid --header {header!r}, expected 'Name: value'")
+        overrides[name.strip()] = value.strip()
+    if not args.source_url:
+        from app.config import get_settings
+        args.source_url = get_settings().db_url
+
+    report = asyncio.run(run(args, overrides))
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    totals = report["totals"]
+    print(
+        f"replayed {totals['requests']} requests: {totals['errors']} errors, "
+        f"{totals['status_mismatches']} status / {totals['body_mismatches']} body mismatches",
+        file=sys.stderr
+    )
+    mismatches = totals["errors"] + totals["status_mismatches"] + totals["body_mismatches"]
+    return 1 if args.fail_on_mismatch and mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+벤치마크용 DB 시드 데이터 생성.
+
+`days`일 동안 하루 `menus_per_day`개의 메뉴(메뉴당 `foods_per_menu`개 음식)를 만들고,
+`user_count`명의 사용자가 음식마다 `scores_per_food`개의 점수와 메뉴별 투표/댓글을 남긴 상태를 구성합니다.
+같은 `seed`로 실행하면 항상 같은 데이터가 생성됩니다.
+"""
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+
+from app.models import Base
+from app.models.comments import Comment
+from app.models.food_menu import food_menu_table
+from app.models.foods import Food
+from app.models.menus import Menu
+from app.models.scores import Score
+from app.models.votes import Vote
+
+_BATCH_SIZE = 5000
+
+
+@dataclass
+class SeedConfig:
+    """
+    시드 데이터 규모 설정.
+
+    Attributes:
+        days (int): 메뉴를 생성할 일수.
+        menus_per_day (int): 하루 메뉴 수.
+        foods_per_menu (int): 메뉴당 음식 수.
+        food_pool (int): 서로 다른 음식 종류 수 (메뉴 간 재등장).
+        user_count (int): 사용자 수.
+        scores_per_food (int): 메뉴의 음식마다 생성할 점수 수.
+        votes_per_menu (int): 메뉴당 투표 수.
+        comments_per_menu (int): 메뉴당 댓글 수.
+        seed (int): 난수 시드.
+        start (datetime): 첫 메뉴 날짜.
+    """
+    days: int = 30
+    menus_per_day: int = 2
+    foods_per_menu: int = 5
+    food_pool: int = 120
+    user_count: int = 500
+    scores_per_food: int = 50
+    votes_per_menu: int = 100
+    comments_per_menu: int = 20
+    seed: int = 42
+    start: datetime = datetime(2025, 3, 3, 12, 0)
+
+
+@dataclass
+class SeedResult:
+    """
+    생성된 데이터 요약 (시나리오 파라미터로 사용).
+
+    Attributes:
+        dates (List[str]): 메뉴가 존재하는 날짜 목록 (`YYYY-MM-DD`).
+        menu_ids (List[int]): 메뉴 ID 목록.
+        food_ids (List[int]): 음식 ID 목록.
+        served_food_ids (List[int]): 메뉴에 한 번 이상 포함된(점수가 있는) 음식 ID 목록.
+        menu_foods (Dict[int, List[int]]): 메뉴 ID -> 포함된 음식 ID 목록.
+        user_ids (List[str]): 사용자 ID 목록.
+        rows (Dict[str, int]): 테이블별 생성 행 수.
+    """
+    dates: List[str]
+    menu_ids: List[int]
+    food_ids: List[int]
+    served_food_ids: List[int]
+    menu_foods: Dict[int, List[int]]
+    user_ids: List[str]
+    rows: Dict[str, int]
+
+
+def _insert_batches(conn, table, rows: List[Dict[str, Any]]) -> None:
+    for offset in range(0, len(rows), _BATCH_SIZE):
+        conn.execute(insert(table), rows[offset:offset + _BATCH_SIZE])
+
+
+def seed(engine: Engine, config: SeedConfig, reset: bool = False) -> SeedResult:
+    """
+    DB에 시드 데이터를 생성합니다.
+
+    Args:
+        engine (Engine): 대상 DB 엔진.
+        config (SeedConfig): 데이터 규모 설정.
+        reset (bool): `True`이면 기존 테이블을 삭제 후 다시 생성합니다.
+
+    Returns:
+        SeedResult: 생성된 데이터 요약.
+
+    Raises:
+        RuntimeError: `reset` 없이 데이터가 이미 존재하는 DB에 실행한 경우.
+    """
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(Menu)).scalar():
+            raise RuntimeError("Target database already has menus. Use --reset on a scratch database.")
+
+    rng = random.Random(config.seed)
+    user_ids = [f"user-{index:06d}" for index in range(config.user_count)]
+
+    with engine.begin() as conn:
+        _insert_batches(conn, Food.__table__, [{"id": index + 1, "name": f"food-{index + 1}"} for index in range(config.food_pool)])
+
+        menus, food_menus = [], []
+        menu_foods: Dict[int, List[int]] = {}
+        dates = []
+        for day in range(config.days):
+            served_at = config.start + timedelta(days=day)
+            dates.append(served_at.strftime("%Y-%m-%d"))
+            for _ in range(config.menus_per_day):
+                menu_id = len(menus) + 1
+                menus.append({"id": menu_id, "created_at": served_at})
+                foods = rng.sample(range(1, config.food_pool + 1), config.foods_per_menu)
+                menu_foods[menu_id] = foods
+                food_menus.extend({"menu_id": menu_id, "food_id": food_id} for food_id in foods)
+        _insert_batches(conn, Menu.__table__, menus)
+        _insert_batches(conn, food_menu_table, food_menus)
+
+        scores, votes, comments = [], [], []
+        for menu in menus:
+            for food_id in menu_foods[menu["id"]]:
+                scores.extend({
+                    "user_id": rng.choice(user_ids),
+                    "score": float(rng.randint(1, 5)),
+                    "created_at": menu["created_at"] + timedelta(minutes=rng.randint(0, 90)),
+                    "food_id": food_id,
+                } for _ in range(config.scores_per_food))
+            votes.extend({
+                "user_id": user_id,
+                "created_at": menu["created_at"],
+                "menu_id": menu["id"],
+            } for user_id in rng.sample(user_ids, min(config.votes_per_menu, len(user_ids))))
+            comments.extend({
+                "user_id": rng.choice(user_ids),
+                "comment": f"comment {rng.randint(0, 10 ** 6)}",
+                "created_at": menu["created_at"],
+                "menu_id": menu["id"],
+            } for _ in range(config.comments_per_menu))
+        _insert_batches(conn, Score.__table__, scores)
+        _insert_batches(conn, Vote.__table__, votes)
+        _insert_batches(conn, Comment.__table__, comments)
+
+    return SeedResult(
+        dates=dates,
+        menu_ids=[menu["id"] for menu in menus],
+        food_ids=list(range(1, config.food_pool + 1)),
+        served_food_ids=sorted({food_id for foods in menu_foods.values() for food_id in foods}),
+        menu_foods=menu_foods,
+        user_ids=user_ids,
+        rows={
+            Food.__tablename__: config.food_pool,
+            Menu.__tablename__: len(menus),
+            food_menu_table.name: len(food_menus),
+            Score.__tablename__: len(scores),
+            Vote.__tablename__: len(votes),
+            Comment.__tablename__: len(comments),
+        }
+    )
+
+
+def describe(config: SeedConfig) -> Dict[str, Any]:
+    """JSON 직렬화 가능한 시드 설정을 반환합니다."""
+    data = asdict(config)
+    data["start"] = config.start.isoformat()
+    return data
+